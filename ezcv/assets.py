@@ -0,0 +1,319 @@
+"""This module is for publishing the static files of a site to the output folder including:
+
+- Collecting the theme assets and site images that need to be in the output folder
+- Only copying (or linking) files that changed since they were last published
+- Removing files from the output folder that are no longer part of the site
+
+Functions
+---------
+collect_files() -> Dict[str, str]:
+    Collects the files in a folder, mapped from their path in the output folder to their source path
+
+is_up_to_date() -> bool:
+    Whether a published file has the same size and modification time as it's source
+
+publish_file():
+    Copies or links a single file into the output folder
+
+sync_files() -> Tuple[int, int]:
+    Publishes every file that is not already up to date in the output folder
+
+prune_folder() -> int:
+    Removes every file from a folder that is not in the provided set of paths
+
+detach_file():
+    Replaces a linked file with a copy of itself so it can be modified without changing the source
+
+Module Variables
+----------------
+PUBLISH_METHODS (Tuple[str]):
+    The ways files can be published to the output folder
+
+SIDECAR_EXTENSIONS (Tuple[str]):
+    The extensions of the compressed copies written next to output files (see ezcv.optimize.precompress())
+
+Examples
+--------
+#### Publish the assets of a theme to the site folder, and remove any stale files
+```
+from ezcv.assets import collect_files, prune_folder, sync_files
+
+files = collect_files("dimension", ignore_patterns=("*.jinja",))
+published, skipped = sync_files(files, "site", method="hardlink")
+prune_folder("site", set(files))
+```
+"""
+# Standard Lib Dependencies
+import os                                   # Used for path validation, linking and file removal
+import shutil                               # Used to copy files and their metadata
+import logging                              # Used to log information for internal testing
+import threading                            # Used to give each publishing thread it's own temporary files
+from concurrent.futures import ThreadPoolExecutor # Used to publish files in parallel
+from fnmatch import fnmatch                 # Used to match ignore patterns against file names
+from typing import Dict, Iterable, Set, Tuple # Used to provide accurate type hints
+
+try:
+    import fcntl                            # Used to reflink files on linux
+except ImportError: # Windows
+    fcntl = None
+
+PUBLISH_METHODS = ("copy", "hardlink", "symlink", "reflink", "copy_file_range")
+
+SIDECAR_EXTENSIONS = (".gz", ".br")
+
+# The linux ioctl request number to clone a file (share the same data blocks until one is modified)
+_FICLONE = 0x40049409
+
+
+def collect_files(folder:str, output_prefix:str = "", ignore_patterns:Iterable[str] = ()) -> Dict[str, str]:
+    """Collects the files in a folder, mapped from their path in the output folder to their source path
+
+    Parameters
+    ----------
+    folder : str
+        The folder to collect the files of
+
+    output_prefix : str, optional
+        The folder (with / as a seperator) inside the output folder the files go in i.e. 'images/gallery/', by default ""
+
+    ignore_patterns : Iterable[str], optional
+        Glob patterns of file names to leave out i.e. ('*.jinja',), by default ()
+
+    Returns
+    -------
+    Dict[str, str]
+        The path relative to the output folder (with / as a seperator) mapped to the source path of each file
+    """
+    files = {}
+    if not os.path.exists(folder):
+        return files
+    for current_folder, _, file_names in os.walk(folder):
+        for file_name in file_names:
+            if any(fnmatch(file_name, pattern) for pattern in ignore_patterns):
+                continue
+            source = os.path.join(current_folder, file_name)
+            files[output_prefix + os.path.relpath(source, folder).replace(os.sep, "/")] = source
+    return files
+
+
+def is_up_to_date(source:str, destination:str, method:str = "copy") -> bool:
+    """Whether a published file has the same size and modification time as it's source
+
+    Notes
+    -----
+    - Copies keep the modification time of the source, and links share it, so an unchanged pair always matches
+    - Symlinks are only up to date if they point at the source, and files are always re-published when \
+        switching between symlinks and the other methods
+
+    Parameters
+    ----------
+    source : str
+        The path to the source file
+
+    destination : str
+        The path to the published file
+
+    method : str, optional
+        The method the file should be published with, one of PUBLISH_METHODS, by default "copy"
+
+    Returns
+    -------
+    bool
+        True if the published file does not need to be published again
+    """
+    if os.path.islink(destination) != (method == "symlink"):
+        return False
+    if method == "symlink":
+        return os.readlink(destination) == os.path.abspath(source)
+    try:
+        destination_stats = os.stat(destination)
+    except FileNotFoundError:
+        return False
+    source_stats = os.stat(source)
+    return source_stats.st_size == destination_stats.st_size and source_stats.st_mtime_ns == destination_stats.st_mtime_ns
+
+
+def _reflink(source:str, destination:str):
+    """Clones source to destination on filesystems that support it (btrfs, xfs, etc.), raises OSError otherwise"""
+    if fcntl is None:
+        raise OSError("Reflinks are not supported on this platform")
+    with open(source, "rb") as source_file, open(destination, "wb") as destination_file:
+        fcntl.ioctl(destination_file.fileno(), _FICLONE, source_file.fileno())
+    shutil.copystat(source, destination)
+
+
+def _copy_file_range(source:str, destination:str):
+    """Copies source to destination inside the kernel (allowing server side copies on network filesystems), raises OSError if it's not supported"""
+    if not hasattr(os, "copy_file_range"):
+        raise OSError("copy_file_range is not supported on this platform")
+    with open(source, "rb") as source_file, open(destination, "wb") as destination_file:
+        remaining = os.fstat(source_file.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(source_file.fileno(), destination_file.fileno(), remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+    shutil.copystat(source, destination)
+
+
+def publish_file(source:str, destination:str, method:str = "copy"):
+    """Copies or links a single file into the output folder
+
+    Notes
+    -----
+    - The file is written to a temporary path and then moved over the destination, so anything \
+        serving the output folder never sees a missing or partially written file
+    - If a hardlink, reflink or copy_file_range can't be used (i.e. the output folder is on a different drive) the file is copied instead
+    - Symlinks point at the absolute path of the source, so the output folder only works on the machine that built it
+
+    Parameters
+    ----------
+    source : str
+        The path to the source file
+
+    destination : str
+        The path to publish the file to
+
+    method : str, optional
+        One of PUBLISH_METHODS, by default "copy"
+    """
+    destination_folder = os.path.dirname(destination)
+    if destination_folder:
+        os.makedirs(destination_folder, exist_ok=True)
+    temporary_path = f"{destination}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        if method == "hardlink":
+            try:
+                os.link(source, temporary_path)
+            except OSError:
+                shutil.copy2(source, temporary_path)
+        elif method == "symlink":
+            os.symlink(os.path.abspath(source), temporary_path)
+        elif method in ("reflink", "copy_file_range"):
+            try:
+                _reflink(source, temporary_path) if method == "reflink" else _copy_file_range(source, temporary_path)
+            except OSError:
+                shutil.copy2(source, temporary_path)
+        else:
+            shutil.copy2(source, temporary_path)
+        os.replace(temporary_path, destination)
+    except BaseException:
+        if os.path.lexists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+
+def _sync_file(source:str, destination:str, method:str, force:bool) -> bool:
+    """Publishes a single file if it's not up to date, returns whether it was published"""
+    if not force and is_up_to_date(source, destination, method):
+        return False
+    publish_file(source, destination, method)
+    return True
+
+
+def sync_files(files:Dict[str, str], output_folder:str, method:str = "copy", force:Iterable[str] = (), threads:int = None) -> Tuple[int, int]:
+    """Publishes every file that is not already up to date in the output folder
+
+    Notes
+    -----
+    - Files are checked and published on a pool of threads, since the work is almost entirely waiting on the disk
+
+    Parameters
+    ----------
+    files : Dict[str, str]
+        The path relative to the output folder mapped to the source path of each file (see collect_files())
+
+    output_folder : str
+        The folder to publish the files to
+
+    method : str, optional
+        One of PUBLISH_METHODS, by default "copy"
+
+    force : Iterable[str], optional
+        Paths relative to the output folder to publish even if they look up to date, by default ()
+
+    threads : int, optional
+        The number of threads to publish files with, by default None which uses the ThreadPoolExecutor default
+
+    Returns
+    -------
+    Tuple[int, int]
+        The number of files that were published, and the number that were skipped
+
+    Raises
+    ------
+    ValueError
+        If the method is not one of PUBLISH_METHODS
+    """
+    if method not in PUBLISH_METHODS:
+        raise ValueError(f"Unknown publish method '{method}', must be one of {', '.join(PUBLISH_METHODS)}")
+    force = set(force)
+    sources = list(files.values())
+    destinations = [os.path.join(output_folder, *path.split("/")) for path in files]
+    forced = [path in force for path in files]
+    if threads == 1 or len(files) < 2:
+        results = list(map(_sync_file, sources, destinations, [method] * len(files), forced))
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            results = list(pool.map(_sync_file, sources, destinations, [method] * len(files), forced))
+    published = sum(results)
+    skipped = len(results) - published
+    logging.debug("[ezcv sync_files(output_folder=%r, method=%r)] Published %s files, %s were up to date", output_folder, method, published, skipped)
+    return published, skipped
+
+
+def _is_current_sidecar(sidecar_path:str) -> bool:
+    """Whether a compressed copy was written from the current version of it's file (they share a modification time)"""
+    try:
+        return os.stat(sidecar_path).st_mtime_ns == os.stat(os.path.splitext(sidecar_path)[0]).st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def prune_folder(folder:str, keep:Set[str]) -> int:
+    """Removes every file from a folder that is not in the provided set of paths, along with any folders left empty
+
+    Notes
+    -----
+    - Compressed copies of kept files (i.e. 'index.html.gz' when 'index.html' is kept) are kept as well, as long as they \
+        were written from the current version of the file (they share it's modification time, see ezcv.optimize.precompress())
+
+    Parameters
+    ----------
+    folder : str
+        The folder to remove files from
+
+    keep : Set[str]
+        The paths relative to folder (with / as a seperator) of the files to keep
+
+    Returns
+    -------
+    int
+        The number of files that were removed
+    """
+    removed = 0
+    for current_folder, _, file_names in os.walk(folder, topdown=False):
+        for file_name in file_names:
+            file_path = os.path.join(current_folder, file_name)
+            path = os.path.relpath(file_path, folder).replace(os.sep, "/")
+            extension = os.path.splitext(path)[1]
+            if path not in keep and not (extension in SIDECAR_EXTENSIONS and path[:-len(extension)] in keep and _is_current_sidecar(file_path)):
+                logging.debug("[ezcv prune_folder()] Removing stale file %s", file_path)
+                os.remove(file_path)
+                removed += 1
+        if current_folder != folder and not os.listdir(current_folder):
+            os.rmdir(current_folder)
+    return removed
+
+
+def detach_file(file_path:str):
+    """Replaces a linked file with a copy of itself so it can be modified without changing the source
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the (possibly) linked file
+    """
+    if os.path.islink(file_path) or os.stat(file_path).st_nlink > 1:
+        logging.debug("[ezcv detach_file()] Replacing linked file %s with a copy", file_path)
+        publish_file(os.path.realpath(file_path), file_path)
@@ -1,10 +1,30 @@
 """This file controls the live reloading when the -p flag is used
 
+Notes
+-----
+- Changes to the content, images, config and theme files are watched by ezcv.watcher, which rebuilds the preview \
+    incrementally on a background thread and then tells livereload to refresh the browser
+- The preview is built in memory (see ezcv.output.MemoryOutput), and the server switches to a new build only once it's finished
+- Files are served by tornado (the server livereload runs on), static files are streamed from their source in chunks \
+    so large files don't hold up other requests, and support range requests and 304 responses
+
 Functions
 ---------
 start_server():
     Starts the live reload server and serves preview files
 
+Module Variables
+----------------
+PORT (int):
+    The port the preview is served on
+
+CONTENT_TYPES (Dict[str, str]):
+    Content types of web file extensions that are registered with mimetypes, since some operating systems \
+    have the wrong type (or none) for them
+
+NOT_FOUND_PAGE (bytes):
+    The page returned for missing files when the site has no 404.html page
+
 Examples
 --------
 Starting server from project root directory
@@ -25,17 +45,56 @@ start_server(project_path)
 
 # Internal dependencies (should ship with python)
 import os                                       # Used in path validation
+import time                                     # Used to mark when the last rebuild finished
+import logging                                  # Used to log information for internal testing
+import threading                                # Used to type hint the event that cancels a rebuild
+import hashlib                                  # Used to get the ETag of pages for HEAD requests
+import mimetypes                                # Used to get the content type of served files
 import webbrowser                               # Used to open a browser tab
 from tempfile import TemporaryDirectory         # Used to create a temporary directory
+from typing import Dict, List, Optional, Set    # Used to provide accurate type hints
 
 # third party dependencies (need to be installed via pip)
+import yaml                                     # Used to catch errors in the config file
 from livereload import Server                   # Used to livereload pages in browser
-from ezcv.core import generate_site             # Used to generate the static html pages
-from flask import render_template, Flask        # Used to setup a running wsgi/http server
-from jinja2.exceptions import TemplateNotFound  # Used to except template errors raised when a page doesn't exist
+from livereload.server import HEAD_END, LiveScriptInjector # Used to get the length of pages with the livereload script
+from tornado.web import HTTPError, RequestHandler, StaticFileHandler # Used to serve the preview files
+from ezcv.core import generate_site, get_site_config # Used to generate the static html pages
+from ezcv.output import MemoryOutput            # Used to build the preview in memory
+from ezcv.themes import locate_theme_directory  # Used to find the theme folder to watch
+from ezcv.watcher import RebuildScheduler, SiteWatcher # Used to rebuild the site when files change
 
 # Setup global variables
-PORT = 5000 # The port to open flask to
+PORT = 5000 # The port to serve the preview on
+
+CONTENT_TYPES = {
+    ".css": "text/css",
+    ".js": "text/javascript",
+    ".mjs": "text/javascript",
+    ".json": "application/json",
+    ".map": "application/json",
+    ".webmanifest": "application/manifest+json",
+    ".xml": "application/xml",
+    ".svg": "image/svg+xml",
+    ".webp": "image/webp",
+    ".avif": "image/avif",
+    ".ico": "image/x-icon",
+    ".woff": "font/woff",
+    ".woff2": "font/woff2",
+    ".ttf": "font/ttf",
+    ".otf": "font/otf",
+    ".mp4": "video/mp4",
+    ".webm": "video/webm",
+}
+
+for extension, content_type in CONTENT_TYPES.items():
+    mimetypes.add_type(content_type, extension)
+
+NOT_FOUND_PAGE = b"""<div style='font-size: XXX-large;text-align: center;'>
+<h1>404 page not found</h1>
+</br>
+<button onclick='history.go(-1)'> Click to go back</button>
+</div>"""
 
 def open_in_browser():
     """Opens localhost:{port} in whichever browser is installed"""
@@ -49,9 +108,138 @@ def open_in_browser():
     webbrowser.open(f"http://localhost:{PORT}", new=2) # Open the preview in the browser
 
 
+class _PreviewHandler(StaticFileHandler):
+    """Serves the files of the preview build, pages from memory and static files streamed from their source
+
+    Notes
+    -----
+    - Every response has Cache-Control: no-cache, so browsers always check with the server (which is cheap \
+        since unchanged files get a 304 response) and never show files from before a rebuild
+    - Static file ETags are based on the size and modification time of the file instead of it's contents, \
+        so large files are not hashed on every request
+    """
+    def initialize(self, preview:Dict[str, MemoryOutput]):
+        super().initialize(path="")
+        self.preview = preview
+        self.absolute_path = None # Only set when serving a static file
+
+
+    @classmethod
+    def get_absolute_path(cls, root:str, path:str) -> str:
+        return path # The path is the absolute path of the source file from the build
+
+
+    def validate_absolute_path(self, root:str, absolute_path:str) -> Optional[str]:
+        if not os.path.isfile(absolute_path): # Removed since the last build
+            raise HTTPError(404)
+        return absolute_path
+
+
+    def compute_etag(self) -> Optional[str]:
+        if self.absolute_path is None: # Pages use a hash of their contents
+            return RequestHandler.compute_etag(self)
+        stats = os.stat(self.absolute_path)
+        return f'"{stats.st_mtime_ns:x}-{stats.st_size:x}"'
+
+
+    def set_extra_headers(self, path:str):
+        self.set_header("Cache-Control", "no-cache")
+
+
+    async def get(self, path:str, include_body:bool = True):
+        """Takes in a path and returns the file of the preview build with that path
+        So if a user types in /test then it will try to find test, test.html or test/index.html
+
+        Parameters
+        ----------
+        path : str
+            The path the user puts in the browser
+
+        include_body : bool, optional
+            False for HEAD requests, by default True
+        """
+        site = self.preview["site"]
+        path = path.strip("/") or "index.html"
+        for candidate in (path, f"{path}.html", f"{path}/index.html"):
+            if candidate in site.static:
+                return await super().get(site.static[candidate], include_body)
+            if candidate in site.pages:
+                return self._send_page(site.pages[candidate], candidate, include_body)
+        logging.debug("[ezcv _PreviewHandler.get()] No file found for %s", path)
+        self.set_status(404)
+        # If no 404 page exists, return a generic 404 page
+        self._send_page(site.pages.get("404.html", NOT_FOUND_PAGE), "404.html", include_body)
+
+
+    def _send_page(self, html:bytes, path:str, include_body:bool = True):
+        """Sends a page from memory, tornado adds an ETag and answers with a 304 if the browser's copy is up to date
+
+        Notes
+        -----
+        - HEAD requests (include_body=False) get the same headers as a GET without the body, like tornado's StaticFileHandler
+        """
+        content_type = mimetypes.guess_type(path)[0] or "text/html"
+        self.set_header("Content-Type", f"{content_type}; charset=UTF-8")
+        self.set_header("Cache-Control", "no-cache")
+        if include_body:
+            self.finish(html)
+            return
+        self.set_header("Etag", f'"{hashlib.sha1(html).hexdigest()}"') # The same ETag RequestHandler.compute_etag() gives the body
+        injected = 0 # livereload only injects it's script into a body, so add it's length to match a GET
+        if "html" in content_type and HEAD_END in html:
+            injected = sum(len(transform.script) for transform in self._transforms if isinstance(transform, LiveScriptInjector))
+        self.set_header("Content-Length", len(html) + injected)
+        if self.get_status() == 200 and self.check_etag_header():
+            self.set_status(304)
+        self.finish()
+
+
+class _PreviewServer(Server):
+    """A livereload server that serves a preview build with _PreviewHandler instead of a wsgi app
+
+    Notes
+    -----
+    - livereload injects it's script into every html response the handler sends
+    """
+    def __init__(self, preview:Dict[str, MemoryOutput]):
+        super().__init__()
+        self.preview = preview
+
+
+    def get_web_handlers(self, script:bytes) -> list:
+        return [(r"/(.*)", _PreviewHandler, {"preview": self.preview})]
+
+
+def _watched_paths(project_folder:str) -> List[str]:
+    """Returns the folders and files of a site that trigger a rebuild when they change, including the folder of it's theme
+
+    Parameters
+    ----------
+    project_folder : str
+        The folder where the config.yml and content folders are
+
+    Returns
+    -------
+    List[str]
+        The folders (watched recursively) and glob patterns of files to watch
+    """
+    paths = [os.path.join(project_folder, "content"), os.path.join(project_folder, "images"), os.path.join(project_folder, "*.yml")]
+    try:
+        config = get_site_config()
+        paths.append(locate_theme_directory(config["theme"] or "dimension", {"config": config}))
+    except (FileNotFoundError, yaml.YAMLError) as e: # The error is printed by the next build
+        logging.debug("[ezcv _watched_paths()] Could not locate the theme folder to watch: %r", e)
+    return paths
+
+
 def start_server(project_folder: str="."):
     """Preview entrypoint that serves ezcv files from project folder and watches for changes
 
+    Notes
+    -----
+    - Rebuilds wait until no files have changed for a moment, and a rebuild that is running is cancelled when more changes come in
+    - Rebuilds are incremental, so only the pages that depend on the changed files are rendered again
+
     Parameters
     ----------
     project_folder : str, optional
@@ -59,50 +247,33 @@ def start_server(project_folder: str="."):
     """
     project_folder = os.path.abspath(project_folder)
     with TemporaryDirectory() as temp_dir:
-        ## Configure the flask app
-        app = Flask(__name__, static_url_path='', template_folder=temp_dir, static_folder=temp_dir)
-        ### These are a security risk, if you intend to use this server in prod remove the next two lines
-        app.config["DEBUG"] = True
-        app.config['TEMPLATES_AUTO_RELOAD'] = True
-
-        @app.route('/')
-        def index():
-            """display the homepage"""
-            return render_template("index.html")
-
-        @app.route('/<path>')
-        def static_file(path:str):
-            """Takes in a path and tries to return the template file with that title
-            So if a user types in /test then it will try to find a template called test.html
-
-            Parameters
-            ----------
-            path : str
-                The path the user puts in the browser
-            """
-            try: # look for a page
-                if not path.endswith(".html"):
-                    if path.endswith(".jpg") or path.endswith("jpeg") or path.endswith("png") or path.endswith("js") or path.endswith("css"):
-                        return app.send_static_file(path)
-                    return render_template(f"{path}.html")
-                else: # If path ends with .html NOTE: This conditional is also a security risk, remove in production
-                    return render_template(path)
-            except TemplateNotFound:
-                try: # Try to look for a 404 page
-                    return render_template("404.html")
-                except TemplateNotFound: # If no 404 page exists, return a generic 404 page
-                    return """<div style='font-size: XXX-large;text-align: center;'>
-                    <h1>404 page not found</h1>
-                    </br>
-                    <button onclick='history.go(-1)'> Click to go back</button>
-                    </div>"""
-        generate_site(output_folder=temp_dir, preview=True)                          # Generate the site initially
+        build_stamp = os.path.join(temp_dir, "last-build") # Written after each rebuild so livereload refreshes the browser
+        preview = {"site": MemoryOutput()} # The build being served, replaced (not modified) when a rebuild finishes
+
+        def rebuild(changed:Set[str], cancel_event:threading.Event):
+            """Incrementally rebuilds the preview, stopping early if cancel_event is set"""
+            print(f"\nRebuilding preview, {len(changed)} file(s) changed")
+            preview["site"] = generate_site(output_folder=preview["site"], preview=True, incremental=True, cancel_event=cancel_event)
+
+        def refresh(changed:Set[str]):
+            """Refreshes the browser after a rebuild, and watches the new theme folder if the config changed"""
+            if any(path.endswith(".yml") for path in changed):
+                watcher.set_paths(_watched_paths(project_folder))
+            with open(build_stamp, "w+") as stamp_file:
+                stamp_file.write(str(time.time()))
+
+        preview["site"] = generate_site(output_folder=preview["site"], preview=True, incremental=True) # Generate the site initially
+        refresh(set())
+        scheduler = RebuildScheduler(rebuild, on_rebuild=refresh)                       # Coalesces changes into rebuilds on a background thread
+        watcher = SiteWatcher(_watched_paths(project_folder), scheduler.notify)         # Watches the site and theme files for changes
+        watcher.start()
         open_in_browser()                                                               # Open the browser
-        server = Server(app)                                                            # Initialize the livereload server
-        server.watch(os.path.join(project_folder, 'images/*'), lambda: generate_site(output_folder=temp_dir, preview=True))       # Watch for changes in the images folder
-        server.watch(os.path.join(project_folder, '*.yml'), lambda: generate_site(output_folder=temp_dir, preview=True))          # Watch for changes in the yml files
-        server.watch(os.path.join(project_folder, 'content/*/*.md'), lambda: generate_site(output_folder=temp_dir, preview=True)) # watch for changes in the markdown files
-        server.serve(port=PORT)                                                         # Start the server
+        server = _PreviewServer(preview)                                                # Initialize the livereload server
+        server.watch(build_stamp)                                                       # Refresh the browser when a rebuild finishes
+        try:
+            server.serve(port=PORT)                                                     # Start the server
+        finally:
+            watcher.stop()
 
 if __name__ == '__main__':
     start_server() 
@@ -0,0 +1,414 @@
+"""This module is for benchmarking how generate_site() scales with the size of a site including:
+
+- Generating synthetic sites with a configurable number of section entries, blog posts and gallery images
+- Building the synthetic site with the bundled themes (no network access is needed)
+- Reporting throughput (pages/s and MB/s) and peak memory of each build
+- Measuring how long the cli takes to import (with python -X importtime), and which modules it loads
+
+Functions
+---------
+generate_synthetic_site() -> dict:
+    Generates a synthetic site with the provided number of files
+
+run_benchmark() -> dict:
+    Builds a site with a theme multiple times and returns the timings
+
+measure_startup() -> dict:
+    Measures how long a module takes to import with python -X importtime, and checks it against a budget
+
+main():
+    The entrypoint for the ezcv-benchmark console script
+
+Module Variables
+----------------
+usage (str):
+    The docopt usage string of the ezcv-benchmark console script
+
+STARTUP_BUDGET (int):
+    The default number of milliseconds ezcv.cli is allowed to take to import
+
+STARTUP_EXCLUDED_MODULES (Tuple[str]):
+    The packages that importing ezcv.cli should not load, since only some commands need them
+
+Examples
+--------
+#### Benchmark a site with 1000 blog posts against the dimension theme
+```
+from ezcv.benchmark import generate_synthetic_site, run_benchmark
+
+generate_synthetic_site("benchmark_site", posts=1000)
+print(run_benchmark("benchmark_site", "dimension"))
+```
+
+#### Run the same benchmark from the command line
+```bash
+ezcv-benchmark --posts 1000 --theme dimension
+```
+
+#### Check the cli still starts quickly (exits with an error if it doesn't)
+```bash
+ezcv-benchmark --startup --budget 100
+```
+"""
+# Standard Lib Dependencies
+import os                                   # Used for path validation and to change into the site folder
+import sys                                  # Used to silence the output of builds
+import json                                 # Used to write the JSON report
+import time                                 # Used to time builds
+import random                               # Used to generate deterministic synthetic content
+import shutil                               # Used to remove synthetic sites and build output
+import datetime                             # Used to date synthetic blog posts
+import tempfile                             # Used to generate sites in a temporary folder
+import statistics                           # Used to get the median build time
+import subprocess                           # Used to time imports in a fresh interpreter
+import multiprocessing                      # Used to run each build in a fresh process
+from concurrent.futures import ProcessPoolExecutor # Used to run each build in a fresh process
+from typing import Dict, Iterable           # Used to provide accurate type hints
+from contextlib import redirect_stderr, redirect_stdout # Used to silence the output of builds
+
+try:
+    import resource                         # Used to get the peak memory of a build
+except ImportError: # Windows
+    resource = None
+
+# Internal Dependencies
+from ezcv import __version__ as version
+
+# Third Party Dependencies
+from docopt import docopt                   # Used to parse the console script arguments
+from PIL import Image                       # Used to generate gallery images
+from PIL.TiffImagePlugin import IFDRational # Used to write EXIF fractions
+
+usage = """Usage:
+    ezcv-benchmark [-e ENTRIES] [-b POSTS] [-g IMAGES] [-w WORDS] [-r RUNS] [-j JOBS] [-t THEME]... [-d FOLDER] [-o REPORT] [--cache] [--keep]
+    ezcv-benchmark --startup [-r RUNS] [--budget MS] [-o REPORT]
+    ezcv-benchmark (-h | --help)
+
+Options:
+-h, --help                      show this help message and exit
+-e ENTRIES, --entries ENTRIES   The number of markdown entries in each section [default: 20]
+-b POSTS, --posts POSTS         The number of blog posts [default: 200]
+-g IMAGES, --images IMAGES      The number of gallery images [default: 10]
+-w WORDS, --words WORDS         The number of words in each blog post [default: 500]
+-r RUNS, --runs RUNS            The number of times to build the site with each theme [default: 3]
+-j JOBS, --jobs JOBS            The number of processes to build with (0 uses every CPU) [default: 1]
+-t THEME, --theme THEME         A bundled theme to build with, can be used more than once [default: dimension base]
+-d FOLDER, --dir FOLDER         The folder to generate the site in, by default a temporary folder
+-o REPORT, --output REPORT      Write the results to a JSON file
+--cache                         Keep the content and template caches between runs (by default every run is a cold build)
+--keep                          Don't remove the generated site when the benchmark is done
+--startup                       Measure how long ezcv.cli takes to import instead, and exit with an error if it's over budget
+--budget MS                     The number of milliseconds ezcv.cli is allowed to take to import [default: 100]
+"""
+
+STARTUP_BUDGET = 100
+
+STARTUP_EXCLUDED_MODULES = ("flask", "livereload", "tornado", "PIL", "css_html_js_minify", "requests", "tqdm", "markdown", "mdx_math", "exifread", "jinja2", "yaml")
+
+# The sections that are generated, and a function to generate the metadata of each entry
+_SECTIONS = {
+    "projects": lambda index: {"title": f"Project {index}", "link": f"https://example.com/projects/{index}"},
+    "education": lambda index: {"title": f"Degree {index}", "institution": f"University {index}", "year_started": 2000 + index % 20, "current": index == 0},
+    "work_experience": lambda index: {"role": f"Role {index}", "company": f"Company {index}", "year_started": 2000 + index % 20, "year_ended": 2001 + index % 20},
+    "volunteering_experience": lambda index: {"role": f"Volunteer {index}", "company": f"Charity {index}", "year_started": 2000 + index % 20, "current": index == 0},
+}
+
+_WORDS = ("static", "site", "generator", "theme", "template", "content", "markdown", "gallery", "image", "build",
+          "python", "page", "section", "render", "output", "config", "blog", "post", "cache", "asset")
+
+
+def _paragraphs(generator:random.Random, words:int) -> str:
+    """Generates markdown with roughly the provided number of words, split into headings, paragraphs, lists and code"""
+    blocks = []
+    remaining = words
+    while remaining > 0:
+        block_words = min(remaining, generator.randint(40, 120))
+        text = " ".join(generator.choice(_WORDS) for _ in range(block_words))
+        kind = len(blocks) % 5
+        if kind == 0:
+            blocks.append(f"## {text[:40].title()}\n\n{text}")
+        elif kind == 3:
+            blocks.append("\n".join(f"- {item}" for item in text.split(" ")[:10]) + f"\n\n{text}")
+        elif kind == 4:
+            blocks.append(f"```python\nprint('{text[:60]}')\n```\n\n{text}")
+        else:
+            blocks.append(text)
+        remaining -= block_words
+    return "\n\n".join(blocks)
+
+
+def _write_markdown(file_path:str, metadata:dict, body:str):
+    """Writes a markdown content file with the provided metadata"""
+    with open(file_path, "w+") as content_file:
+        content_file.write("---\n")
+        for key, value in metadata.items():
+            content_file.write(f"{key}: {str(value).lower() if isinstance(value, bool) else value}\n")
+        content_file.write(f"---\n\n{body}\n")
+
+
+def _write_image(file_path:str, generator:random.Random, index:int):
+    """Writes a noisy 1280x960 JPG with the camera and exposure EXIF tags ezcv reads"""
+    image = Image.effect_noise((1280, 960), generator.randint(20, 60)).convert("RGB")
+    exif = Image.Exif()
+    exif[0x010F] = "ezcv"                               # Make
+    exif[0x0110] = f"Benchmark {index % 3}"              # Model
+    exif[0x8769] = {                                    # EXIF sub-IFD
+        0x829A: IFDRational(1, generator.choice((60, 125, 250, 1000))), # ExposureTime
+        0x829D: IFDRational(generator.choice((14, 28, 56, 80)), 10),    # FNumber
+        0x8827: generator.choice((100, 200, 400, 1600)),                # ISOSpeedRatings
+        0x920A: IFDRational(generator.choice((24, 35, 50, 85)), 1),     # FocalLength
+        0xA405: generator.choice((36, 52, 75, 127)),                    # FocalLengthIn35mmFilm
+        0xA434: "Synthetic Lens",                                       # LensModel
+    }
+    image.save(file_path, exif=exif, quality=90)
+
+
+def generate_synthetic_site(site_folder:str, entries:int = 20, posts:int = 200, images:int = 10, words:int = 500, seed:int = 0) -> dict:
+    """Generates a synthetic site with the provided number of files
+
+    Notes
+    -----
+    - The same arguments always generate the same site, so results can be compared between machines and ezcv versions
+    - The config sets every value the bundled themes require, so the site builds with dimension and base
+
+    Parameters
+    ----------
+    site_folder : str
+        The folder to generate the site in, it's created if it does not exist
+
+    entries : int, optional
+        The number of markdown entries in each section, by default 20
+
+    posts : int, optional
+        The number of blog posts, by default 200
+
+    images : int, optional
+        The number of gallery images, by default 10
+
+    words : int, optional
+        The number of words in each blog post, by default 500
+
+    seed : int, optional
+        The seed for the generated content, by default 0
+
+    Returns
+    -------
+    dict
+        The number of files generated and the total size of the content in bytes
+    """
+    generator = random.Random(seed)
+    os.makedirs(site_folder, exist_ok=True)
+    with open(os.path.join(site_folder, "config.yml"), "w+") as config_file:
+        config_file.write("name: Benchmark\ntheme: dimension\nresume: false\nbiography: A synthetic site used to benchmark ezcv\n")
+
+    for section, metadata in _SECTIONS.items():
+        section_folder = os.path.join(site_folder, "content", section)
+        os.makedirs(section_folder, exist_ok=True)
+        for index in range(entries):
+            _write_markdown(os.path.join(section_folder, f"entry-{index:05}.md"), metadata(index), _paragraphs(generator, 60))
+
+    blog_folder = os.path.join(site_folder, "content", "blog")
+    os.makedirs(blog_folder, exist_ok=True)
+    first_post = datetime.date(2020, 1, 1)
+    for index in range(posts):
+        created = first_post + datetime.timedelta(days=index)
+        _write_markdown(os.path.join(blog_folder, f"post-{index:05}.md"), {"title": f"Post {index}", "created": created, "updated": created}, _paragraphs(generator, words))
+
+    gallery_folder = os.path.join(site_folder, "content", "gallery")
+    os.makedirs(gallery_folder, exist_ok=True)
+    for index in range(images):
+        _write_image(os.path.join(gallery_folder, f"photo-{index:05}.jpg"), generator, index)
+
+    content_size = 0
+    for current_folder, _, file_names in os.walk(os.path.join(site_folder, "content")):
+        content_size += sum(os.path.getsize(os.path.join(current_folder, file_name)) for file_name in file_names)
+    return {"entries": entries * len(_SECTIONS), "posts": posts, "images": images, "content_bytes": content_size}
+
+
+def _build(site_folder:str, theme:str, output_folder:str, jobs:int, cache:bool) -> dict:
+    """Builds the site in the current (fresh) process and returns the time, peak memory and output size of the build
+
+    Notes
+    -----
+    - ```peak_memory``` is the peak memory of the build process, and ```worker_peak_memory``` the peak memory of the largest \
+        worker process (parsing and rendering happen in workers when jobs is more than 1)
+    """
+    from ezcv.core import generate_site # Imported here so the import time is not part of the build time
+    os.chdir(site_folder)
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull), redirect_stderr(devnull):
+        start = time.perf_counter()
+        generate_site(output_folder, theme, jobs=jobs, cache=cache)
+        wall = time.perf_counter() - start
+
+    peak_memory, worker_peak_memory = None, None
+    if resource is not None:
+        scale = 1 if sys.platform == "darwin" else 1024 # Linux reports kilobytes, macOS bytes
+        peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+        worker_peak_memory = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale # Workers have exited once generate_site() returns
+    pages, output_bytes = 0, 0
+    for current_folder, _, file_names in os.walk(output_folder):
+        for file_name in file_names:
+            pages += file_name.endswith(".html")
+            output_bytes += os.path.getsize(os.path.join(current_folder, file_name))
+    return {"wall": wall, "peak_memory": peak_memory, "worker_peak_memory": worker_peak_memory, "pages": pages, "output_bytes": output_bytes}
+
+
+def run_benchmark(site_folder:str, theme:str, runs:int = 3, jobs:int = 1, cache:bool = False) -> dict:
+    """Builds a site with a theme multiple times and returns the timings
+
+    Notes
+    -----
+    - Each build runs in a fresh process so the peak memory of one build does not hide the next, and \
+        imports and in-process caches from earlier builds don't make later builds look faster
+    - The output folder is removed before each build
+
+    Parameters
+    ----------
+    site_folder : str
+        The folder of the site to build
+
+    theme : str
+        The name of a bundled theme i.e. 'dimension'
+
+    runs : int, optional
+        The number of times to build the site, by default 3
+
+    jobs : int, optional
+        The number of processes to build with (less than 1 uses every CPU), by default 1
+
+    cache : bool, optional
+        Whether to keep the content and template caches between runs, by default False
+
+    Returns
+    -------
+    dict
+        The theme, the results of each run, and the median wall time, pages/s, MB/s and maximum peak memory (of the build and worker processes) of the runs
+    """
+    site_folder = os.path.abspath(site_folder)
+    output_folder = f"benchmark-{theme}"
+    results = []
+    for _ in range(runs):
+        shutil.rmtree(os.path.join(site_folder, output_folder), ignore_errors=True)
+        if not cache:
+            shutil.rmtree(os.path.join(site_folder, ".ezcv_cache"), ignore_errors=True)
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            results.append(pool.submit(_build, site_folder, theme, output_folder, jobs, cache).result())
+    shutil.rmtree(os.path.join(site_folder, output_folder), ignore_errors=True)
+
+    wall = statistics.median(result["wall"] for result in results)
+    peak_memories = [result["peak_memory"] for result in results if result["peak_memory"] is not None]
+    worker_peak_memories = [result["worker_peak_memory"] for result in results if result["worker_peak_memory"] is not None]
+    return {
+        "theme": theme,
+        "runs": results,
+        "wall": wall,
+        "pages": results[-1]["pages"],
+        "output_bytes": results[-1]["output_bytes"],
+        "pages_per_second": results[-1]["pages"] / wall,
+        "megabytes_per_second": results[-1]["output_bytes"] / 1024 / 1024 / wall,
+        "peak_memory": max(peak_memories) if peak_memories else None,
+        "worker_peak_memory": max(worker_peak_memories) if worker_peak_memories else None,
+    }
+
+
+def _import_times(code:str) -> Dict[str, int]:
+    """Runs code in a fresh interpreter with -X importtime, and returns the cumulative microseconds of each module that was imported"""
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True)
+    times = {}
+    for line in process.stderr.splitlines(): # i.e. 'import time:       328 |      14734 | ezcv.cli'
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure_startup(module:str = "ezcv.cli", runs:int = 3, budget:int = STARTUP_BUDGET, excluded_modules:Iterable[str] = STARTUP_EXCLUDED_MODULES) -> dict:
+    """Measures how long a module takes to import with python -X importtime, and checks it against a budget
+
+    Notes
+    -----
+    - Each run imports the module in a fresh interpreter, the first run is not counted since it may be compiling .pyc files
+    - The import time does not include starting the interpreter, and modules the interpreter imports on it's own \
+        (i.e. site and .pth files) are left out of the results, so they only change with ezcv's own imports
+
+    Parameters
+    ----------
+    module : str, optional
+        The module to import, by default "ezcv.cli"
+
+    runs : int, optional
+        The number of times to import the module, by default 3
+
+    budget : int, optional
+        The number of milliseconds the import is allowed to take, by default STARTUP_BUDGET
+
+    excluded_modules : Iterable[str], optional
+        The packages the import should not load, by default STARTUP_EXCLUDED_MODULES
+
+    Returns
+    -------
+    dict
+        The median import time in milliseconds, the time of each run, the excluded packages that were loaded, \
+        the slowest imports and whether the import is within budget (and loaded none of the excluded packages)
+    """
+    startup_modules = _import_times("pass") # Imported by the interpreter before any code runs
+    _import_times(f"import {module}") # Warm up
+    results = [_import_times(f"import {module}") for _ in range(max(1, runs))]
+    import_times = [result.get(module, 0) / 1000 for result in results]
+    import_time = statistics.median(import_times)
+    imported = {name: cumulative for name, cumulative in results[-1].items() if name not in startup_modules}
+    loaded = [name for name in excluded_modules if name in imported]
+    slowest = sorted(imported.items(), key=lambda item: item[1], reverse=True)[:10]
+    return {
+        "module": module,
+        "import_time": import_time,
+        "runs": import_times,
+        "budget": budget,
+        "loaded_excluded_modules": loaded,
+        "slowest_imports": [{"module": name, "cumulative": cumulative / 1000} for name, cumulative in slowest],
+        "passed": import_time <= budget and not loaded,
+    }
+
+
+def main():
+    """The entrypoint for the ezcv-benchmark console script"""
+    args = docopt(usage, version=version)
+    if args["--startup"]:
+        result = measure_startup(runs=int(args["--runs"]), budget=int(args["--budget"]))
+        print(f"Importing {result['module']} took {result['import_time']:.1f} ms (budget {result['budget']} ms)")
+        for slow_import in result["slowest_imports"]:
+            print(f"  {slow_import['cumulative']:>8.1f} ms  {slow_import['module']}")
+        if result["loaded_excluded_modules"]:
+            print(f"\n{result['module']} should not load: {', '.join(result['loaded_excluded_modules'])}")
+        if args["--output"]:
+            with open(args["--output"], "w+") as report_file:
+                json.dump({"ezcv_version": version, "startup": result}, report_file, indent=1)
+        sys.exit(0 if result["passed"] else 1)
+
+    site_folder = args["--dir"] or tempfile.mkdtemp(prefix="ezcv-benchmark-")
+    try:
+        print(f"Generating synthetic site in {site_folder}")
+        site = generate_synthetic_site(site_folder, int(args["--entries"]), int(args["--posts"]), int(args["--images"]), int(args["--words"]))
+        print(f"Generated {site['entries']} section entries, {site['posts']} blog posts and {site['images']} gallery images ({site['content_bytes'] / 1024 / 1024:.1f} MB)\n")
+
+        results = []
+        print(f"{'Theme':<12}  {'Pages':>7}  {'Output MB':>9}  {'Wall (s)':>9}  {'Pages/s':>9}  {'MB/s':>7}  {'Peak MB':>8}  {'Worker MB':>9}")
+        for theme in args["--theme"]:
+            result = run_benchmark(site_folder, theme, int(args["--runs"]), int(args["--jobs"]), args["--cache"])
+            results.append(result)
+            peak_memory = f"{result['peak_memory'] / 1024 / 1024:.1f}" if result["peak_memory"] else "n/a"
+            worker_peak_memory = f"{result['worker_peak_memory'] / 1024 / 1024:.1f}" if result["worker_peak_memory"] else "n/a"
+            print(f"{theme:<12}  {result['pages']:>7}  {result['output_bytes'] / 1024 / 1024:>9.1f}  {result['wall']:>9.3f}  {result['pages_per_second']:>9.1f}  {result['megabytes_per_second']:>7.1f}  {peak_memory:>8}  {worker_peak_memory:>9}")
+
+        if args["--output"]:
+            with open(args["--output"], "w+") as report_file:
+                json.dump({"ezcv_version": version, "site": site, "jobs": int(args["--jobs"]), "cache": args["--cache"], "results": results}, report_file, indent=1)
+            print(f"\nWrote the results to {os.path.abspath(args['--output'])}")
+    finally:
+        if not args["--keep"] and not args["--dir"]:
+            shutil.rmtree(site_folder, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
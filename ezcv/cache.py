@@ -0,0 +1,396 @@
+"""This module is for handling the persistent build cache including:
+
+- Caching the parsed (metadata, html) of content files between builds
+- Indexing the exif tags of gallery images between builds
+- Capping the size of the cache by evicting the least recently used entries
+- Clearing the cache
+
+Classes
+-------
+ContentCache:
+    A persistent on-disk cache of the metadata and html of content files
+
+ExifIndex:
+    A persistent index of the exif tags of images, so unchanged images are not read again
+
+Functions
+---------
+clear_cache():
+    Removes the cache folder and everything in it
+
+get_template_cache() -> jinja2.FileSystemBytecodeCache:
+    Returns the bytecode cache for the compiled templates of a theme
+
+Module Variables
+----------------
+CACHE_FOLDER (str):
+    The default folder (relative to the site folder) to store the cache in
+
+DEFAULT_CACHE_SIZE (int):
+    The default maximum size of the content cache in megabytes
+
+TEMPLATE_CACHE_FOLDER (str):
+    The default folder to store compiled theme templates in
+
+EXIF_INDEX_FILE_NAME (str):
+    The name of the file (in the cache folder) the exif index is stored in
+
+Examples
+--------
+#### Get the content of a markdown file, using the cache if possible
+```
+from ezcv.cache import ContentCache
+from ezcv.content import Markdown
+
+cache = ContentCache()
+
+content = cache.get("content/blog/example.md", Markdown)
+if not content:
+    content = Markdown().get_content("content/blog/example.md")
+    cache.set("content/blog/example.md", Markdown, content)
+cache.save()
+```
+"""
+# Standard Lib Dependencies
+import os                                   # Used for path validation and file removal
+import json                                 # Used to read and write the cache index
+import time                                 # Used to mark entries as recently used
+import pickle                               # Used to serialize the cached content
+import shutil                               # Used to remove the cache folder
+import hashlib                              # Used to generate cache keys
+import logging                              # Used to log information for internal testing
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Type # Used to provide accurate type hints
+
+# Internal Dependencies
+from ezcv import __version__ as version
+from ezcv.manifest import hash_file
+
+# Third Party Dependencies
+if TYPE_CHECKING:
+    import jinja2                           # Used to cache compiled templates, imported by get_template_cache()
+
+CACHE_FOLDER = ".ezcv_cache"
+
+DEFAULT_CACHE_SIZE = 256
+
+TEMPLATE_CACHE_FOLDER = os.path.join(CACHE_FOLDER, "templates")
+
+EXIF_INDEX_FILE_NAME = "exif.json"
+
+
+def clear_cache(cache_folder:str = CACHE_FOLDER):
+    """Removes the cache folder and everything in it
+
+    Parameters
+    ----------
+    cache_folder : str, optional
+        The folder the cache is stored in, by default CACHE_FOLDER
+    """
+    logging.debug("[ezcv clear_cache(cache_folder=%r)] Clearing cache", cache_folder)
+    if os.path.exists(cache_folder):
+        shutil.rmtree(cache_folder)
+
+
+def get_template_cache(theme_folder:str, template_cache_folder:str = TEMPLATE_CACHE_FOLDER) -> "jinja2.FileSystemBytecodeCache":
+    """Returns the bytecode cache for the compiled templates of a theme
+
+    Notes
+    -----
+    - Each theme gets it's own folder inside template_cache_folder
+    - Jinja stores a checksum of each template's source with it's bytecode, so edited templates are recompiled
+
+    Parameters
+    ----------
+    theme_folder : str
+        The path to the theme folder
+
+    template_cache_folder : str, optional
+        The folder to store compiled templates in, by default TEMPLATE_CACHE_FOLDER
+
+    Returns
+    -------
+    jinja2.FileSystemBytecodeCache
+        The bytecode cache to pass to a jinja2.Environment
+    """
+    import jinja2 # Imported here so commands that don't render templates (i.e. ezcv cache clear) don't load it
+    theme_folder = os.path.abspath(theme_folder)
+    theme_key = f"{os.path.basename(theme_folder)}-{hashlib.sha256(theme_folder.encode()).hexdigest()[:12]}"
+    theme_cache_folder = os.path.join(template_cache_folder, theme_key)
+    os.makedirs(theme_cache_folder, exist_ok=True)
+    logging.debug("[ezcv get_template_cache(theme_folder=%r)] Using template cache at %s", theme_folder, theme_cache_folder)
+    return jinja2.FileSystemBytecodeCache(directory=theme_cache_folder, pattern=f"__ezcv_{version}_%s.cache")
+
+
+class ContentCache:
+    """A persistent on-disk cache of the metadata and html of content files
+
+    Notes
+    -----
+    - Entries are keyed on the path and content hash of the file, the content handler (and it's settings) and the ezcv version
+    - An index of the size and mtime of each file is kept so unchanged files don't need to be re-hashed, \
+        if the size or mtime changed (i.e. after a fresh git checkout) the content hash is used instead
+    - When the cache is larger than max_size the least recently used entries are evicted on save()
+
+    Attributes
+    ----------
+    folder : str
+        The folder the content entries are stored in
+
+    max_size : int
+        The maximum size of the cache in bytes
+
+    hits : int
+        The number of files that were found in the cache
+
+    misses : int
+        The number of files that were not found in the cache
+    """
+    def __init__(self, cache_folder:str = CACHE_FOLDER, max_size:int = DEFAULT_CACHE_SIZE):
+        """Loads the index of the cache (the cache entries are only read when they're needed)
+
+        Parameters
+        ----------
+        cache_folder : str, optional
+            The folder to store the cache in, by default CACHE_FOLDER
+
+        max_size : int, optional
+            The maximum size of the cache in megabytes, by default DEFAULT_CACHE_SIZE
+        """
+        self.folder = os.path.join(cache_folder, "content")
+        self.max_size = max_size * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+        self._index_path = os.path.join(self.folder, "index.json")
+        self._index:Dict[str, dict] = {}
+        if os.path.exists(self._index_path):
+            try:
+                with open(self._index_path, "r") as index_file:
+                    self._index = json.load(index_file)
+            except ValueError:
+                logging.warning("[ezcv ContentCache()] Could not read %s, starting with an empty cache", self._index_path)
+
+
+    def _content_hash(self, file_path:str) -> str:
+        """Returns the hash of a file, using the index to avoid re-hashing files whose size and mtime have not changed"""
+        stats = os.stat(file_path)
+        entry = self._index.get(file_path)
+        if entry and entry["size"] == stats.st_size and entry["mtime"] == stats.st_mtime_ns:
+            return entry["hash"]
+        file_hash = hash_file(file_path)
+        self._index[file_path] = {"size": stats.st_size, "mtime": stats.st_mtime_ns, "hash": file_hash}
+        return file_hash
+
+
+    def _entry_path(self, file_path:str, extension_handler:Type) -> str:
+        """Returns the path of the cache entry for a file parsed by the provided content handler"""
+        handler_name = f"{extension_handler.__module__}.{extension_handler.__qualname__}"
+        key_data = [version, file_path, self._content_hash(file_path), handler_name, extension_handler.get_cache_settings()]
+        key = hashlib.sha256(json.dumps(key_data).encode()).hexdigest()
+        return os.path.join(self.folder, key[:2], f"{key}.pickle")
+
+
+    def get(self, file_path:str, extension_handler:Type) -> Optional[Tuple[dict, str]]:
+        """Gets the cached content of a file
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the content file
+
+        extension_handler : Type
+            The Content subclass used to parse the file
+
+        Returns
+        -------
+        Optional[Tuple[dict, str]]
+            The metadata and html of the file, or None if it's not in the cache
+        """
+        entry_path = self._entry_path(file_path, extension_handler)
+        try:
+            with open(entry_path, "rb") as entry_file:
+                content = pickle.load(entry_file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            self.misses += 1
+            return None
+        now = time.time()
+        os.utime(entry_path, (now, now)) # Mark as recently used for eviction
+        self.hits += 1
+        return content
+
+
+    def set(self, file_path:str, extension_handler:Type, content:Tuple[dict, str]):
+        """Adds the content of a file to the cache
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the content file
+
+        extension_handler : Type
+            The Content subclass used to parse the file
+
+        content : Tuple[dict, str]
+            The metadata and html of the file
+        """
+        entry_path = self._entry_path(file_path, extension_handler)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        temporary_path = f"{entry_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as entry_file:
+            pickle.dump((dict(content[0]), content[1]), entry_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, entry_path) # Avoid partially written entries if the build is interrupted
+
+
+    def save(self):
+        """Writes the index of the cache and evicts the least recently used entries if the cache is over max_size"""
+        logging.debug("[ezcv ContentCache.save()] Saving cache with self.hits=%r self.misses=%r", self.hits, self.misses)
+        os.makedirs(self.folder, exist_ok=True)
+        self._index = {file_path: entry for file_path, entry in self._index.items() if os.path.exists(file_path)}
+        with open(self._index_path, "w+") as index_file:
+            json.dump(self._index, index_file)
+
+        entries = []
+        total_size = 0
+        for current_folder, _, files in os.walk(self.folder):
+            for file_name in files:
+                if file_name.endswith(".pickle"):
+                    stats = os.stat(os.path.join(current_folder, file_name))
+                    entries.append((stats.st_mtime, stats.st_size, os.path.join(current_folder, file_name)))
+                    total_size += stats.st_size
+        if total_size > self.max_size:
+            entries.sort() # Oldest (least recently used) first
+            for _, size, entry_path in entries:
+                if total_size <= self.max_size:
+                    break
+                os.remove(entry_path)
+                total_size -= size
+            logging.debug("[ezcv ContentCache.save()] Evicted entries, cache is now %s bytes", total_size)
+
+
+class ExifIndex:
+    """A persistent index of the exif tags of images, so unchanged images are not read again
+
+    Notes
+    -----
+    - The whole index is a single json file, so a gallery can get the tags of every image without opening them
+    - Entries are keyed on the path of the image, and are only used if it's size and mtime have not changed
+    - The index is separate from the content cache, so it's still used when the content cache is turned off \
+        (i.e. with --no-cache), or after the entry of an image is evicted from it
+    - The index is discarded when the ezcv version changes, since the tags that are read may be different
+    - Only the tags read from the image are stored (before Image.__html__() formats them), so the index is \
+        the same whether the images were read in one process or a pool
+
+    Attributes
+    ----------
+    folder : str
+        The folder the index is stored in
+
+    hits : int
+        The number of images whose tags were found in the index
+
+    misses : int
+        The number of images whose tags were not found in the index
+    """
+    def __init__(self, cache_folder:str = CACHE_FOLDER):
+        """Loads the index
+
+        Parameters
+        ----------
+        cache_folder : str, optional
+            The folder to store the index in, by default CACHE_FOLDER
+        """
+        self.folder = cache_folder
+        self.hits = 0
+        self.misses = 0
+        self._index_path = os.path.join(cache_folder, EXIF_INDEX_FILE_NAME)
+        self._images:Dict[str, dict] = {}
+        self._added:Dict[str, dict] = {} # The entries added since the last call to pop_added()
+        self._changed = False
+        if os.path.exists(self._index_path):
+            try:
+                with open(self._index_path, "r") as index_file:
+                    index = json.load(index_file)
+                if index.get("version") == version:
+                    self._images = index["images"]
+            except (ValueError, KeyError, AttributeError):
+                logging.warning("[ezcv ExifIndex()] Could not read %s, starting with an empty index", self._index_path)
+
+
+    def get(self, file_path:str) -> Optional[Dict[str, str]]:
+        """Gets the indexed exif tags of an image
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the image
+
+        Returns
+        -------
+        Optional[Dict[str, str]]
+            The name of each tag mapped to it's value, or None if the image is not in the index (or has changed)
+        """
+        stats = os.stat(file_path)
+        entry = self._images.get(file_path)
+        if entry and entry["size"] == stats.st_size and entry["mtime"] == stats.st_mtime_ns:
+            self.hits += 1
+            return dict(entry["tags"])
+        self.misses += 1
+        return None
+
+
+    def set(self, file_path:str, tags:Dict[str, str]):
+        """Adds the exif tags of an image to the index
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the image
+
+        tags : Dict[str, str]
+            The name of each tag mapped to it's value
+        """
+        stats = os.stat(file_path)
+        entry = {"size": stats.st_size, "mtime": stats.st_mtime_ns, "tags": dict(tags)}
+        self._images[file_path] = entry
+        self._added[file_path] = entry
+        self._changed = True
+
+
+    def pop_added(self) -> Dict[str, dict]:
+        """Returns the entries added since the last call, so a worker process can send them to the index that's saved
+
+        Returns
+        -------
+        Dict[str, dict]
+            The path of each image mapped to it's entry, pass them to update() on the index in the parent process
+        """
+        added, self._added = self._added, {}
+        return added
+
+
+    def update(self, entries:Dict[str, dict]):
+        """Adds the entries from the index of another process (see pop_added())
+
+        Parameters
+        ----------
+        entries : Dict[str, dict]
+            The path of each image mapped to it's entry
+        """
+        if entries:
+            self._images.update(entries)
+            self._changed = True
+
+
+    def save(self):
+        """Writes the index if it changed, leaving out images that no longer exist"""
+        logging.debug("[ezcv ExifIndex.save()] Saving index with self.hits=%r self.misses=%r", self.hits, self.misses)
+        images = {file_path: entry for file_path, entry in self._images.items() if os.path.exists(file_path)}
+        if not self._changed and len(images) == len(self._images): # Nothing to write
+            return
+        os.makedirs(self.folder, exist_ok=True)
+        temporary_path = f"{self._index_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w+") as index_file:
+            json.dump({"version": version, "images": images}, index_file)
+        os.replace(temporary_path, self._index_path) # Avoid a partially written index if the build is interrupted
+        self._images = images
+        self._added = {}
+        self._changed = False
@@ -61,28 +61,25 @@ import string               # Used for data validation
 import shutil               # Used for file/folder copying and removal
 import logging              # Used to log information for internal testing
 import datetime             # Used for date formatting and date validation
-from glob import glob       # Used to glob filepaths (patternmatch filepaths)
 from sys import argv, exit  # Used to get length of CLI args and exit cleanly
 
 ## internal dependencies
 from ezcv import __version__ as version
-from ezcv.core import generate_site, get_site_config
-from ezcv.themes import THEMES_FOLDER, generate_theme_metadata, get_remote_themes, get_theme_metadata, locate_theme_directory, setup_remote_theme
-from ezcv.autoreload import start_server
+from ezcv.log import configure_logging
+# The rest of ezcv (and yaml) is imported by the commands that use it, so the cli starts quickly \
+# and i.e. ezcv build doesn't load the preview server, see ezcv-benchmark --startup
 
 # Third party dependencies
-import yaml                      # Used to read and write yaml files
 from colored import fg           # Used to highlight output with colors
 from docopt import docopt        # Used to complete argument parsing for the cli
-from PIL import Image            # Used to optimize and minify image files
-from css_html_js_minify import * # Used to optimize and minify html/css/js files
 
 usage = """Usage:
-    ezcv [-h] [-v] [-p]
-    ezcv build [-d OUTPUT_DIR] [-o]
+    ezcv [-h] [-v] [-p] [--verbose] [--log-json]
+    ezcv build [-d OUTPUT_DIR] [-o] [--keep-exif] [-i] [-j JOBS] [--precompress] [--no-cache] [--profile] [--verbose] [--log-json]
     ezcv init [<name>] [<theme>] [-f]
-    ezcv theme [-l] [-c] [-m] [<theme>]
+    ezcv theme [-l] [-c] [-m] [--compile] [<theme>]
     ezcv section <SECTION_NAME> [-t=<type>]
+    ezcv cache clear
 
 
 Options:
@@ -92,9 +89,18 @@ Options:
 -c, --copy            copy the provided theme, or defined site theme
 -p, --preview         preview the current state of the site
 -o, --optimize        Optimize output files (takes longer to run)
+--keep-exif           Keep the exif data of images when optimizing them
+-i, --incremental     Only rebuild what changed since the last build
+-j JOBS, --jobs JOBS  The number of processes to parse content and render posts with (0 uses every CPU, can't be negative)
+--precompress         Write gzip (and brotli) compressed copies of text files next to them
+--no-cache            Don't read or write the content and template caches
+--profile             Print how long each phase of the build took and write it to ezcv-profile.json
+--verbose             Print debug logs
+--log-json            Print logs as lines of JSON
 -f, --flask           Generate Flask routes and requirements.txt
 -d OUTPUT_DIR, --dir OUTPUT_DIR The folder name to export the site to
 -m, --metadata        Generate metadata for the theme
+--compile             Compile the templates of the provided theme, or defined site theme, into the template cache
 -t=<type>, --type=<type> The type of section to generate [default: markdown]
 """
 
@@ -109,14 +115,15 @@ def init(theme_name="dimension", name="John Doe", flask:bool = False):
     name : (str, optional)
         The name to use in the config, by default "John Doe"
     """
+    from ezcv.themes import get_remote_themes, get_theme_metadata, locate_theme_directory, setup_remote_theme
     if os.path.exists(os.path.abspath(name)): # If folder already exists at ./<name>
         logging.error("[ezcv cli.init()] The provided name already exists")
         print(f"[ezcv cli.init()] The provided name {name} already exists at {os.path.abspath(name)}")
         return
-    logging.debug(f"[ezcv cli.init()] Initializing site with theme {theme_name} and name {name}")
+    logging.debug("[ezcv cli.init()] Initializing site with theme %s and name %s", theme_name, name)
     print(f"Generating site at {os.path.abspath(name)}")
 
-    logging.debug(f"[ezcv cli.init()] Copying example site from {os.path.join(os.path.dirname(__file__), 'example_site')} to {os.path.abspath(name)}")
+    logging.debug("[ezcv cli.init()] Copying example site from %s to %s", os.path.join(os.path.dirname(__file__), 'example_site'), os.path.abspath(name))
     shutil.copytree(os.path.join(os.path.dirname(__file__), "example_site"), os.path.abspath(name))
 
     # Generate initial config.yml file
@@ -157,7 +164,7 @@ def init(theme_name="dimension", name="John Doe", flask:bool = False):
         config_file.write(config_file_contents)
 
     if theme_name != "dimension":
-        logging.debug(f"[ezcv cli.init()] Not using dimension theme, copying theme {theme_name}")
+        logging.debug("[ezcv cli.init()] Not using dimension theme, copying theme %s", theme_name)
 
         # Check if theme is remote theme, and download it if it is
         remote_themes = get_remote_themes()
@@ -183,11 +190,12 @@ def init(theme_name="dimension", name="John Doe", flask:bool = False):
 
 def preview():
     """Creates a temporary folder of the site's files and then previews it in browser"""
+    from ezcv.autoreload import start_server # Imported here so the preview server (livereload and tornado) is only loaded for previews
     logging.debug("[ezcv cli.preview()] Generating temporary site preview")
     start_server()
 
 
-def theme(list_themes: bool = False, copy_theme:bool = False, theme_name:str = "", metadata:bool = False):
+def theme(list_themes: bool = False, copy_theme:bool = False, theme_name:str = "", metadata:bool = False, compile_templates:bool = False):
     """Used to get information about the available themes and/or copy a theme folder
 
     Parameters
@@ -203,8 +211,15 @@ def theme(list_themes: bool = False, copy_theme:bool = False, theme_name:str = "
     
     metadata : bool, optional
         Whether or not to generate metadata for the theme, by default False
+
+    compile_templates : bool, optional
+        Whether or not to compile the templates of the theme into the template cache, by default False
     """
-    logging.debug(f"[ezcv cli.theme({list_themes=}, {copy_theme=}, {theme_name=}, {metadata=})] Calling theme command")
+    import yaml
+    from ezcv.cache import TEMPLATE_CACHE_FOLDER
+    from ezcv.core import compile_theme_templates, get_site_config
+    from ezcv.themes import THEMES_FOLDER, generate_theme_metadata, get_remote_themes, locate_theme_directory
+    logging.debug("[ezcv cli.theme(list_themes=%r, copy_theme=%r, theme_name=%r, metadata=%r, compile_templates=%r)] Calling theme command", list_themes, copy_theme, theme_name, metadata, compile_templates)
     if not theme_name:
         logging.debug("[ezcv cli.theme()] No theme provided, using dimension theme")
         theme_name = "dimension"
@@ -212,7 +227,7 @@ def theme(list_themes: bool = False, copy_theme:bool = False, theme_name:str = "
     if metadata:
         if os.path.exists(os.path.join(THEMES_FOLDER, theme_name)): # If the theme exists in the themes folder
             try: # Try to copy the theme to ./<theme>
-                logging.debug(f"[ezcv cli.theme()] Copying theme {theme_name} to ./{theme_name}")
+                logging.debug("[ezcv cli.theme()] Copying theme %s to ./%s", theme_name, theme_name)
                 shutil.copytree(os.path.join(THEMES_FOLDER, theme_name), theme_name)
             except FileExistsError: # If a folder exists at ./<theme> remove and then re-copy
                 shutil.rmtree(theme_name)
@@ -235,7 +250,7 @@ def theme(list_themes: bool = False, copy_theme:bool = False, theme_name:str = "
     if copy_theme and not metadata:
         if os.path.exists(os.path.join(THEMES_FOLDER, theme_name)): # If the theme exists in the themes folder
             try: # Try to copy the theme to ./<theme>
-                logging.debug(f"[ezcv cli.theme()] Copying theme {theme_name} to ./{theme_name}")
+                logging.debug("[ezcv cli.theme()] Copying theme %s to ./%s", theme_name, theme_name)
                 shutil.copytree(os.path.join(THEMES_FOLDER, theme_name), theme_name)
             except FileExistsError: # If a folder exists at ./<theme> remove and then re-copy
                 shutil.rmtree(theme_name)
@@ -255,6 +270,18 @@ def theme(list_themes: bool = False, copy_theme:bool = False, theme_name:str = "
         else: # Theme could not be found
             print(f"Theme {theme_name} not found and was unable to be copied")
 
+    if compile_templates:
+        template_cache_folder = TEMPLATE_CACHE_FOLDER
+        if os.path.exists("config.yml") and isinstance(get_site_config()["template_cache"], str):
+            template_cache_folder = get_site_config()["template_cache"]
+        try:
+            theme_folder = locate_theme_directory(theme_name, {"config": {"remotes": get_remote_themes()}})
+            logging.debug("[ezcv cli.theme()] Compiling templates of %s into %s", theme_folder, template_cache_folder)
+            compiled = compile_theme_templates(theme_folder, template_cache_folder)
+            print(f"Compiled {compiled} templates of {theme_name} into {os.path.abspath(template_cache_folder)}")
+        except FileNotFoundError:
+            print(f"Theme {theme_name} not found and was unable to be compiled")
+
     if list_themes:
         # Get local themes
         logging.debug("[ezcv cli.theme()] Listing local themes")
@@ -288,14 +315,17 @@ def section(section_name:str, section_type:str):
     -----
     - Needs to be run from the main folder of a site
     """    
-    logging.debug(f"[ezcv cli.section({section_name=}, {section_type=})] Calling section command")
+    import yaml
+    from ezcv.core import get_site_config
+    from ezcv.themes import THEMES_FOLDER, generate_theme_metadata, locate_theme_directory
+    logging.debug("[ezcv cli.section(section_name=%r, section_type=%r)] Calling section command", section_name, section_type)
 
     # Sanatizing section name so resulting folder name is valid
-    logging.debug(f"[ezcv cli.section()] Sanatizing {section_name=}")
+    logging.debug("[ezcv cli.section()] Sanatizing section_name=%r", section_name)
     legal_path_characters = string.ascii_letters + string.digits+ " ()[]_-" # Allowed characters in file path
     section_name = section_name.replace(" ", "_")
     section_name = ''.join(current_character for current_character in section_name if current_character in legal_path_characters).lower()
-    logging.debug(f"[ezcv cli.section()] Sanatized {section_name=}")
+    logging.debug("[ezcv cli.section()] Sanatized section_name=%r", section_name)
 
     if os.path.exists("config.yml"):
         config_path = "config.yml"
@@ -316,7 +346,7 @@ def section(section_name:str, section_type:str):
     elif theme_path == os.path.join(THEMES_FOLDER, theme_name): # Theme is in package theme folder i.e. THEME_FOLDER/aerial
         try: # Try to copy the theme to ./<theme>
             print(f"[ezcv cli.section()] Copying theme {theme_name} to ./{theme_name}")
-            logging.debug(f"[ezcv cli.section()] Copying theme {theme_name} to ./{theme_name}")
+            logging.debug("[ezcv cli.section()] Copying theme %s to ./%s", theme_name, theme_name)
             shutil.copytree(os.path.join(THEMES_FOLDER, theme_name), config["theme"])
         except FileExistsError: # If a folder exists at ./<theme> remove and then re-copy
             shutil.rmtree(theme_name)
@@ -461,13 +491,15 @@ def section(section_name:str, section_type:str):
     with open(os.path.join(theme_path, "metadata.yml"), 'w+') as metadata_file:
         yaml.dump(dict(theme_metadata), metadata_file)
 
-def optimize(directory:str = "site"):
+def optimize(directory:str = "site", jobs:int = None, strip_exif:bool = True, cache:bool = True):
     """Goes through and minifies html, css, js and image files in directory
 
     Notes
     -----
-    - This assumes you are following the standard template layout: https://ezcv.readthedocs.io/en/latest/theme-development/#folder-layout
-    - Only image extensions supported are:
+    - This optimizes the files of a directory in place, ezcv build -o optimizes files while building instead \
+        (see the optimize argument of ezcv.core.generate_site()) so the next build doesn't publish them again
+    - Html, css and js files anywhere in directory are minified with ezcv.optimize.minify_files()
+    - Images are optimized with ezcv.optimize.optimize_images(), only image extensions supported are:
 
         - .jpg
         - .png
@@ -477,41 +509,32 @@ def optimize(directory:str = "site"):
     ----------
     directory : str
         The directory you want to minify all files from
+
+    jobs : int, optional
+        The number of processes to minify files and optimize images with (less than 1 uses every CPU), by default None which uses every CPU
+
+    strip_exif : bool, optional
+        Whether to remove the exif data of images, by default True
+
+    cache : bool, optional
+        Whether to keep a record of minified files and optimized images in the cache so they are not optimized again, by default True
     """
-    logging.debug(f"[ezcv cli.optimize({directory=})] Optimizing files")
+    from ezcv.optimize import IMAGE_CACHE_FOLDER, MINIFY_CACHE_FOLDER, minify_files, optimize_images
+    logging.debug("[ezcv cli.optimize(directory=%r)] Optimizing files", directory)
     # Minify html/css/js
-    html = glob(f'{directory}{os.sep}*.html')
-    css = glob(f'{os.path.join(os.path.join(directory, "css"))}{os.sep}*.css')
-    js = glob(f'{os.path.join(os.path.join(directory, "js"))}{os.sep}*.js')
-
-    for file in html:
-        logging.debug(f"[ezcv cli.optimize()] Processing html file: {file}")
-        process_single_html_file(file, overwrite=True)
-    
-    for file in css:
-        logging.debug(f"[ezcv cli.optimize()] Processing css file: {file}")
-        process_single_css_file(file, overwrite=True)
-    
-    for file in js:
-        logging.debug(f"[ezcv cli.optimize()] Processing js file: {file}")
-        process_single_js_file(file, overwrite=True)
+    minified, skipped = minify_files(directory, jobs, cache_folder=MINIFY_CACHE_FOLDER if cache else None)
+    print(f"Minified {minified} files, {skipped} were unchanged")
 
     # Find and process images
-    png = glob(f'{os.path.join(os.path.join(directory, "images"))}{os.sep}*.png')
-    jpg = glob(f'{os.path.join(os.path.join(directory, "images"))}{os.sep}*.jpg')
-    jpeg = glob(f'{os.path.join(os.path.join(directory, "images"))}{os.sep}*.jpeg')
-
-    for extension in [png, jpg, jpeg]:
-        if extension: # if list is not empty
-            for image in extension:
-                logging.debug(f"[ezcv cli.optimize()] Processing image file: {image}")
-                pil_object = Image.open(image)
-                pil_object.save(image, optimize=True, quality=85)
+    optimized, skipped = optimize_images(os.path.join(directory, "images"), jobs, strip_exif, cache_folder=IMAGE_CACHE_FOLDER if cache else None)
+    print(f"Optimized {optimized} images, {skipped} were already optimized")
 
 def main():
     """The primary entrypoint for the ezcv cli"""
     args = docopt(usage, version=version)
-    logging.debug(f"[ezcv cli.main()] Arguments: {args}")
+    if args["--verbose"] or args["--log-json"]:
+        configure_logging(args["--verbose"], args["--log-json"])
+    logging.debug("[ezcv cli.main()] Arguments: %s", args)
 
     if len(argv) == 1: # Print usage if no arguments are given
         print("\n", usage)
@@ -530,20 +553,35 @@ def main():
         exit()
 
     elif args["build"]:
+        from ezcv.core import generate_site
+        jobs = None
+        if args["--jobs"]:
+            try:
+                jobs = int(args["--jobs"])
+            except ValueError:
+                jobs = -1
+            if jobs < 0: # Not a whole number, or negative
+                print(f"{fg(1)}--jobs must be a whole number of processes (0 uses every CPU), got '{args['--jobs']}'{fg(15)}\n\n{usage}")
+                exit(1)
         if not args["--dir"]:
-            generate_site()
+            generate_site(incremental=args["--incremental"], jobs=jobs, cache=not args["--no-cache"], profile=args["--profile"], optimize=args["--optimize"], strip_exif=not args["--keep-exif"])
         else:
-            generate_site(args["--dir"])
+            generate_site(args["--dir"], incremental=args["--incremental"], jobs=jobs, cache=not args["--no-cache"], profile=args["--profile"], optimize=args["--optimize"], strip_exif=not args["--keep-exif"])
 
-        if args["--optimize"]:
-            if args["--dir"]:
-                optimize(args["--dir"])
-            else:
-                optimize()
+        if args["--precompress"]:
+            from ezcv.optimize import precompress
+            report = precompress(args["--dir"] or "site")
+            print(f"\n{report.summary()}")
         exit()
 
     elif args["theme"]:
-        if args["--metadata"]:
+        from ezcv.core import get_site_config
+        if args["--compile"]:
+            if not args["<theme>"]:
+                args["<theme>"] = get_site_config()["theme"] if os.path.exists("config.yml") else "dimension"
+            theme(theme_name=args["<theme>"], compile_templates=True)
+            exit()
+        elif args["--metadata"]:
             if not args["<theme>"]:
                 args["<theme>"] = get_site_config()["theme"]
             theme(args["--list"], args["--copy"], args["<theme>"], metadata=True)
@@ -570,6 +608,13 @@ def main():
         section(args["<SECTION_NAME>"], args["--type"])
         exit()
 
+    elif args["cache"]:
+        if args["clear"]:
+            from ezcv.cache import CACHE_FOLDER, clear_cache
+            clear_cache()
+            print(f"Cleared the cache at {os.path.abspath(CACHE_FOLDER)}")
+        exit()
+
     elif args["--preview"]: # If preview flag is specified with no other flags
         preview()
         exit()
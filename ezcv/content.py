@@ -23,20 +23,79 @@ get_content_directories() -> List[str]:
 get_section_content() -> List[List[Union[defaultdict, str]]]:
     Takes in a section folder and gets all the content from the files using the Content subclass asigned to the file extension
 
+create_content_pool() -> ProcessPoolExecutor:
+    Creates a process pool that can be used to parse content files in parallel
+
+get_content_handlers() -> DefaultDict[str, Type]:
+    Returns the registered content handlers, each extension mapped to the Content subclass that parses it
+
+register_content_handler():
+    Registers a Content subclass to parse files with it's extensions
+
+get_markdown_parser() -> markdown.Markdown:
+    Returns the markdown parser of the current thread, reset so nothing from the last document it parsed is left
+
+read_exif_tags() -> Dict[str, str]:
+    Reads the exif tags gallery images use from a jpeg or tiff based image
+
+Module Variables
+----------------
+MARKDOWN_EXTENSIONS (list[str]):
+    The markdown extensions used to render markdown content
+
+EXIF_EXTENSIONS (Tuple[str]):
+    The extensions of the jpeg and tiff based images exif data is read from
+
+EXIF_TAGS (Tuple[str]):
+    The exif tags that are read from images (the ones Image.__html__() and the gallery templates use)
+
+EXIF_STOP_TAG (str):
+    The tag exif reading stops at, it's the last of EXIF_TAGS in the order tags are stored in files
+
+CONTENT_HANDLER_GROUP (str):
+    The entry point group installed packages can add content handlers (Content subclasses) with
+
 """
 # Standard Lib Dependencies
 import os                                                # Used primarily in path validation
 import logging                                           # Used to log information for internal testing
+import threading                                         # Used to give each thread it's own markdown parser
 import datetime                                          # Used for date formatting and date validation
 from collections import defaultdict                      # Used to give dicts default args
 from dataclasses import dataclass, field                 # Used to improve class performance
-from typing import DefaultDict, List, Tuple, Type, Union # Used to provide accurate type hints
+from concurrent.futures import Executor, ProcessPoolExecutor # Used to parse content files in parallel
+from typing import TYPE_CHECKING, ClassVar, DefaultDict, Dict, List, Optional, Tuple, Type, Union # Used to provide accurate type hints
 
 
+# Internal Dependencies
+from ezcv.cache import ContentCache, ExifIndex           # Used to skip parsing unchanged content files
+
 # Third Party Dependencies
-import exifread            # Used to get metadata of image files
-import markdown            # Used to render and read markdown files
 from colored import fg     # Used to highlight output with colors, especially errors/warnings
+# exifread (used to get metadata of image files) and markdown (used to render and read markdown files) are \
+# imported when the first file that needs them is parsed, so builds without images or markdown don't pay for them
+if TYPE_CHECKING:
+    import markdown
+
+# The markdown extensions used to render markdown content
+MARKDOWN_EXTENSIONS = ['meta', 'footnotes', 'tables', 'toc', 'abbr', 'def_list', 'sane_lists', "mdx_math"]
+
+EXIF_EXTENSIONS = (".jpg", ".jpeg", ".jpe", ".jfif", ".pjpeg", ".pjp", ".tif", ".tiff")
+
+EXIF_TAGS = ("Image Make", "Image Model", "EXIF ExposureTime", "EXIF FNumber", "EXIF ISOSpeedRatings", "EXIF FocalLength", "EXIF FocalLengthIn35mmFilm", "EXIF LensModel")
+
+EXIF_STOP_TAG = "LensModel"
+
+CONTENT_HANDLER_GROUP = "ezcv.content_handlers"
+
+# The markdown parser of each thread, see get_markdown_parser()
+_markdown_parsers = threading.local()
+
+# The registered content handlers, each lowercase extension mapped to the Content subclass that parses it
+_content_handlers:Dict[str, Type] = {}
+
+# Whether the content handlers from installed packages have been registered, see get_content_handlers()
+_entry_points_loaded = False
 
 
 def get_content_directories() -> List[str]:
@@ -53,11 +112,215 @@ def get_content_directories() -> List[str]:
         if os.path.isdir(os.path.join("content", current_path)):
             result.append(os.path.join("content", current_path))
 
-    logging.debug(f"[ezcv get_content_directories()] result {result}")
+    logging.debug("[ezcv get_content_directories()] result %s", result)
     return result
 
 
-def get_section_content(section_content_folder: str, examples: bool = False, blog:bool = False) -> List[List[Union[defaultdict, str]]]:
+def _initialize_content_worker(ignore_exif_data:bool, exif_index_folder:Optional[str]):
+    """Copies the class level settings of the content handlers into a worker process
+
+    Parameters
+    ----------
+    ignore_exif_data : bool
+        The value of Image.ignore_exif_data in the parent process
+
+    exif_index_folder : Optional[str]
+        The folder of Image.exif_index in the parent process, or None if there isn't one
+    """
+    Image.ignore_exif_data = ignore_exif_data
+    Image.exif_index = ExifIndex(exif_index_folder) if exif_index_folder else None # Only read from, new entries are sent back to the parent process
+
+
+def _get_file_content(extension_handler:Type, file_path:str) -> Tuple[Tuple[dict, str], Dict[str, dict]]:
+    """Gets the content of a single file, used as the unit of work for content pools
+
+    Notes
+    -----
+    - The metadata is returned as a regular dict since defaultdicts with a lambda default can't be pickled
+    - The entries the file added to Image.exif_index are returned as well, since the index of a worker process is never saved
+
+    Parameters
+    ----------
+    extension_handler : Type
+        The Content subclass to parse the file with
+
+    file_path : str
+        The path to the file
+
+    Returns
+    -------
+    Tuple[Tuple[dict, str], Dict[str, dict]]
+        The metadata and html of the file, and the entries it added to Image.exif_index (see ExifIndex.pop_added())
+    """
+    metadata, html = extension_handler().get_content(file_path)
+    return (dict(metadata), html), (Image.exif_index.pop_added() if Image.exif_index else {})
+
+
+def create_content_pool(jobs:int) -> ProcessPoolExecutor:
+    """Creates a process pool that can be used to parse content files in parallel
+
+    Parameters
+    ----------
+    jobs : int
+        The number of worker processes, values less than 1 use the number of CPU's
+
+    Returns
+    -------
+    ProcessPoolExecutor
+        The process pool, it should be shutdown by the caller when it's no longer needed
+
+    Examples
+    --------
+    ```
+    from ezcv.content import create_content_pool, get_section_content
+
+    with create_content_pool(4) as pool:
+        content = get_section_content('content/blog', blog=True, executor=pool)
+    ```
+    """
+    if jobs < 1:
+        jobs = os.cpu_count() or 1
+    logging.debug("[ezcv create_content_pool(jobs=%r)] Creating content pool", jobs)
+    exif_index_folder = Image.exif_index.folder if Image.exif_index else None
+    return ProcessPoolExecutor(max_workers=jobs, initializer=_initialize_content_worker, initargs=(Image.ignore_exif_data, exif_index_folder))
+
+
+def register_content_handler(extension_handler:Type, extensions:List[str] = None):
+    """Registers a Content subclass to parse files with it's extensions
+
+    Notes
+    -----
+    - Content subclasses that set their own extensions attribute are registered automatically when they're defined, \
+        this is only needed to register a class for other extensions, or to take over extensions from another handler
+    - If an extension is already registered, the handler registered last is used
+
+    Parameters
+    ----------
+    extension_handler : Type
+        The Content subclass to parse the files with
+
+    extensions : List[str], optional
+        The extensions to register it for i.e. ['.rst'], by default None which uses extension_handler.extensions
+
+    Examples
+    --------
+    ```
+    from ezcv.content import Markdown, register_content_handler
+
+    register_content_handler(Markdown, [".txt"]) # Parse .txt files as markdown
+    ```
+    """
+    for extension in extensions or extension_handler.extensions:
+        logging.debug("[ezcv register_content_handler()] Registering %s for %s", extension_handler.__qualname__, extension)
+        _content_handlers[extension.lower()] = extension_handler
+
+
+def _load_entry_point_handlers():
+    """Registers the content handlers installed packages add to the CONTENT_HANDLER_GROUP entry point group"""
+    from importlib.metadata import entry_points # Imported here so installed packages are only scanned once content is parsed
+    try:
+        handler_entry_points = entry_points(group=CONTENT_HANDLER_GROUP)
+    except TypeError: # Python < 3.10 returns a dict of every group
+        handler_entry_points = entry_points().get(CONTENT_HANDLER_GROUP, [])
+    for entry_point in handler_entry_points:
+        try:
+            extension_handler = entry_point.load()
+        except Exception as e: # A broken plugin shouldn't stop the build
+            print(f"{fg(1)}Could not load content handler {entry_point.name} ({entry_point.value}): {e}{fg(15)}\n")
+            continue
+        logging.debug("[ezcv _load_entry_point_handlers()] Loaded content handler %s from %s", entry_point.name, entry_point.value)
+        register_content_handler(extension_handler)
+
+
+def get_content_handlers() -> DefaultDict[str, Type]:
+    """Returns the registered content handlers, each extension mapped to the Content subclass that parses it
+
+    Notes
+    -----
+    - The handlers installed packages add to the CONTENT_HANDLER_GROUP entry point group are loaded the first time \
+        this is called, and registered after the ones in ezcv (so they take over any extensions they share)
+    - Handlers are expected to import their dependencies when they parse a file, instead of when they're loaded
+
+    Returns
+    -------
+    DefaultDict[str, Type]
+        A copy of the registered handlers, with a default of False for extensions that don't have one
+
+    Examples
+    --------
+    ```
+    from ezcv.content import get_content_handlers
+
+    extension_handlers = get_content_handlers()
+    print(extension_handlers[".md"]) # <class 'ezcv.content.Markdown'>
+    print(extension_handlers[".xyz"]) # False
+    ```
+    """
+    global _entry_points_loaded
+    if not _entry_points_loaded:
+        _entry_points_loaded = True
+        _load_entry_point_handlers()
+    return defaultdict(lambda:False, _content_handlers)
+
+
+def get_markdown_parser() -> "markdown.Markdown":
+    """Returns the markdown parser of the current thread, reset so nothing from the last document it parsed is left
+
+    Notes
+    -----
+    - Each thread (and process) gets it's own parser, which is created (loading the extensions) the first time it's needed, \
+        and created again if MARKDOWN_EXTENSIONS is changed
+    - The state the extensions keep between documents (Meta, toc, footnotes, abbreviations etc.) is cleared by reset()
+
+    Returns
+    -------
+    markdown.Markdown
+        The parser, set up with MARKDOWN_EXTENSIONS
+
+    Examples
+    --------
+    ```
+    from ezcv.content import get_markdown_parser
+
+    parser = get_markdown_parser()
+    html = parser.convert("title: Example\\n\\n# Some content")
+    print(parser.Meta) # {'title': ['Example']}
+    ```
+    """
+    import markdown # Imported here so it's only loaded once a markdown file is found
+    extensions = tuple(MARKDOWN_EXTENSIONS)
+    if getattr(_markdown_parsers, "extensions", None) != extensions:
+        logging.debug("[ezcv get_markdown_parser()] Creating markdown parser with extensions=%r", extensions)
+        _markdown_parsers.parser = markdown.Markdown(extensions=list(extensions))
+        _markdown_parsers.extensions = extensions
+    return _markdown_parsers.parser.reset()
+
+
+def read_exif_tags(file_path:str) -> Dict[str, str]:
+    """Reads the exif tags gallery images use from a jpeg or tiff based image
+
+    Notes
+    -----
+    - Only the tags in EXIF_TAGS are returned, and reading stops at EXIF_STOP_TAG without decoding \
+        maker notes or extracting the thumbnail, so only the start of the file is read
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the image
+
+    Returns
+    -------
+    Dict[str, str]
+        The name of each tag in EXIF_TAGS the image has mapped to it's printable value i.e. {'Image Make': 'Canon'}
+    """
+    import exifread # Imported here so it's only loaded once an image is found
+    with open(file_path, "rb") as image_file:
+        tags = exifread.process_file(image_file, stop_tag=EXIF_STOP_TAG, details=False, extract_thumbnail=False)
+    return {name: str(tags[name]) for name in EXIF_TAGS if name in tags}
+
+
+def get_section_content(section_content_folder: str, examples: bool = False, blog:bool = False, executor:Executor = None, cache:ContentCache = None) -> List[List[Union[defaultdict, str]]]:
     """Takes in a section folder and gets all the content from the files using the Content subclass asigned to the file extension
 
     Parameters
@@ -71,6 +334,16 @@ def get_section_content(section_content_folder: str, examples: bool = False, blo
     blog : bool, optional
         Whether or not the current section is a blog section, by default False
 
+    executor : Executor, optional
+        A pool (i.e. from create_content_pool()) to parse the files in parallel, by default None which parses them one at a time
+
+    cache : ContentCache, optional
+        A persistent cache (from ezcv.cache) to get the content of unchanged files from, by default None which parses every file
+
+    Notes
+    -----
+    - The content is always returned in the same order as the files are listed in the folder, regardless of whether an executor is used
+
     Returns
     -------
     List[List[Union[defaultdict, str]]]
@@ -91,34 +364,61 @@ def get_section_content(section_content_folder: str, examples: bool = False, blo
     print(content[0]) # Prints [defaultdict(<function <lambda> at 0x000001F1B97CE040>, {'title': 'This is the title', 'company': 'This is the company'}), '<p>This is some content</p>']
     ```
     """
-    logging.debug(f"[ezcv get_section_content({section_content_folder=}, {examples=}, {blog=})] Getting section content for {section_content_folder}")
+    logging.debug("[ezcv get_section_content(section_content_folder=%r, examples=%r, blog=%r)] Getting section content for %s", section_content_folder, examples, blog, section_content_folder)
     content:List[List[Union[defaultdict, str]]] = []
-    extension_handlers:DefaultDict[str, Type] = Content.get_available_extensions()
+    extension_handlers:DefaultDict[str, Type] = get_content_handlers()
+    file_names:List[str] = []      # The files that have a Content subclass capable of handling them
+    handlers:List[Type] = []       # The Content subclass for each file in file_names
     logging.debug("[ezcv get_section_content()] Beggining file iteration")
     for file_name in os.listdir(section_content_folder):                   # Iterate through the section_content folder and get the content from each file
         if not examples and file_name.startswith("example"):
             continue
         else:
-            logging.debug(f"[ezcv get_section_content()] Getting content for {file_name}")
             extension = "." + file_name.lower().split(".")[-1]      # Get the file extension
             if extension_handlers[extension]:                       # Checking if there exists a Content subclass capable of handling the file
-                extension_handler = extension_handlers[extension]() # Instantiate the proper extension
-
-                # Get the content and add it to the list
-                if not blog:
-                    metadata, html = extension_handler.get_content(os.path.join(section_content_folder, file_name))
-                    content.append([metadata, html])
-                else:
-                    metadata, html = extension_handler.get_content(os.path.join(section_content_folder, file_name))
-                    # TODO: Add data if not there
-                    if not metadata["created"]:
-                        metadata["created"] = datetime.datetime.now().strftime("%Y-%m-%d")
-                    if not metadata["updated"]:
-                        metadata["updated"] = datetime.datetime.now().strftime("%Y-%m-%d")
-                    
-
-                    content.append([metadata, html, file_name])
-    logging.debug(f"[ezcv get_section_content()] Returning section content {content=}")
+                file_names.append(file_name)
+                handlers.append(extension_handlers[extension])
+
+    # Get the content of any files that are cached, and keep track of the ones that need to be parsed
+    file_paths = [os.path.join(section_content_folder, file_name) for file_name in file_names]
+    results:List[Tuple[dict, str]] = [None] * len(file_paths)
+    if cache:
+        for index, file_path in enumerate(file_paths):
+            results[index] = cache.get(file_path, handlers[index])
+    uncached = [index for index, result in enumerate(results) if result is None]
+    uncached_handlers = [handlers[index] for index in uncached]
+    uncached_paths = [file_paths[index] for index in uncached]
+
+    # Get the content of each uncached file, executor.map() returns results in the order the files were submitted
+    if executor and len(uncached_paths) > 1:
+        logging.debug("[ezcv get_section_content()] Getting content for %s files in parallel", len(uncached_paths))
+        chunk_size = max(1, len(uncached_paths) // ((os.cpu_count() or 1) * 4)) # Batch small files to cut down on inter-process overhead
+        parsed = executor.map(_get_file_content, uncached_handlers, uncached_paths, chunksize=chunk_size)
+    else:
+        parsed = map(_get_file_content, uncached_handlers, uncached_paths)
+    for index, (result, exif_entries) in zip(uncached, parsed):
+        results[index] = result
+        if cache:
+            cache.set(file_paths[index], handlers[index], result)
+        if exif_entries and Image.exif_index: # Tags read in worker processes are only added to their copy of the index
+            Image.exif_index.update(exif_entries)
+
+    for file_name, (metadata, html) in zip(file_names, results):
+        logging.debug("[ezcv get_section_content()] Got content for %s", file_name)
+        metadata = defaultdict(lambda:False, metadata)
+
+        # Add the content to the list
+        if not blog:
+            content.append([metadata, html])
+        else:
+            # TODO: Add data if not there
+            if not metadata["created"]:
+                metadata["created"] = datetime.datetime.now().strftime("%Y-%m-%d")
+            if not metadata["updated"]:
+                metadata["updated"] = datetime.datetime.now().strftime("%Y-%m-%d")
+
+            content.append([metadata, html, file_name])
+    logging.debug("[ezcv get_section_content()] Returning content of %s files", len(content))
     return content
 
 
@@ -179,22 +479,38 @@ class Content(dict):
     """
 
 
+    def __init_subclass__(cls, **kwargs):
+        """Registers subclasses that set their own extensions attribute as the handler of those extensions"""
+        super().__init_subclass__(**kwargs)
+        if "extensions" in cls.__dict__:
+            register_content_handler(cls)
+
+
     def get_available_extensions() -> DefaultDict[str, Type]:
         """Returns a defaultdict of extensions and corresponding child types to handle them
 
+        Notes
+        -----
+        - This is the same as get_content_handlers(), and is kept for backwards compatibility
+
         Returns
         -------
         DefaultDict[str, Type]:
             A defaultdict with a str for the extension as a key, and the type as a value
         """
-        logging.debug("[ezcv Content.get_available_extensions()] Getting available extensions")
-        all_extensions:DefaultDict[str, Type] = defaultdict(lambda:False)
-        for current_class in Content.__subclasses__():
-            for extension in current_class.extensions:
-                all_extensions[extension] = current_class
+        return get_content_handlers()
+
 
-        logging.debug(f"[ezcv Content.get_available_extensions()] Found extensions {all_extensions=}")
-        return all_extensions
+    @classmethod
+    def get_cache_settings(cls) -> str:
+        """Returns the settings that change the output of the class, used to invalidate cached content when they change
+
+        Returns
+        -------
+        str
+            The settings of the class, by default an empty string
+        """
+        return ""
 
 
     def __metadata__(self):
@@ -256,6 +572,8 @@ class Markdown(Content):
         - [meta](https://python-markdown.github.io/extensions/meta)
         - [mdx_math](https://github.com/mitya57/python-markdown-math)
         - [mermaid](https://github.com/oruelle/md_mermaid)
+    - Each thread (and process) parses files with it's own parser from get_markdown_parser(), so \
+        Markdown() objects can be used from several threads at once
 
     Examples
     --------
@@ -265,16 +583,28 @@ class Markdown(Content):
     html, metadata = Markdown().get_content('file_1.md')
     ```
     """
-    md:markdown.Markdown = markdown.Markdown(extensions=['meta', 'footnotes', 'tables', 'toc', 'abbr', 'def_list', 'sane_lists', "mdx_math"]) # Setup markdown parser with extensions
+    md:"markdown.Markdown" = None # The parser of the last file, set by __html__() from get_markdown_parser()
     extensions:List[str] = (".md", ".markdown", ".mdown", ".mkdn", ".mkd", ".mdwn")
 
 
+    @classmethod
+    def get_cache_settings(cls) -> str:
+        """Returns the markdown extensions used, so cached content is invalidated when they change
+
+        Returns
+        -------
+        str
+            The comma seperated list of markdown extensions
+        """
+        return ",".join(MARKDOWN_EXTENSIONS)
+
+
     def __metadata__(self) -> defaultdict:
         """Gets the metadata from the YAML frontmatter of the markdown file
 
         Notes
         -----
-        - This class requires __html__ to be run first, or self.md to be set manually and run self.md.convert(text:str) over the text of the document
+        - This class requires __html__ to be run first, or self.md to be set manually (i.e. to get_markdown_parser()) and run self.md.convert(text:str) over the text of the document
 
         Returns
         -------
@@ -288,7 +618,7 @@ class Markdown(Content):
                 metadata[key] = self.md.Meta[key][0]
             else:
                 metadata[key] = self.md.Meta[key]
-        logging.debug(f"[ezcv Markdown.__metadata__()] Returning metadata {metadata=}")
+        logging.debug("[ezcv Markdown.__metadata__()] Returning metadata metadata=%r", metadata)
         return metadata
 
 
@@ -305,11 +635,12 @@ class Markdown(Content):
         str
             The HTML rendered from the markdown file
         """
-        logging.debug(f"[ezcv Markdown.__html__()] Getting HTML for {file_path=}")
+        logging.debug("[ezcv Markdown.__html__()] Getting HTML for file_path=%r", file_path)
         with open(f"{file_path}", "r") as mdfile: # Parse markdown file
             text = mdfile.read()
+        self.md = get_markdown_parser() # Reset, so nothing from the last file (footnotes, abbreviations etc.) ends up in this one
         html = self.md.convert(text) # Convert the markdown content text to hmtl
-        logging.debug(f"[ezcv Markdown.__html__()] Returning HTML for {file_path=}")
+        logging.debug("[ezcv Markdown.__html__()] Returning HTML for file_path=%r", file_path)
         return html
 
 
@@ -340,12 +671,12 @@ class Markdown(Content):
         metadata, html  = Markdown().get_content('file_1.md')
         ```
         """
-        logging.debug(f"[ezcv Markdown.get_content()] Getting content for {file_path=}")
+        logging.debug("[ezcv Markdown.get_content()] Getting content for file_path=%r", file_path)
         if not os.path.exists(file_path): # If file doesn't exist
             raise FileNotFoundError(f"{fg(1)} Could not find file: {file_path}{fg(15)}\n")
         html = self.__html__(file_path)
         metadata = self.__metadata__()
-        logging.debug(f"[ezcv Markdown.get_content()] Returning content for {file_path=}")
+        logging.debug("[ezcv Markdown.get_content()] Returning content for file_path=%r", file_path)
         return metadata, html
 
 
@@ -355,7 +686,8 @@ class Image(Content):
     
     Notes
     -----
-    - Exif data is NOT available on PNG images (it is only available of jpg and tiff)
+    - Exif data is NOT available on PNG images (it is only available of jpeg and tiff based images, see EXIF_EXTENSIONS)
+    - Only the exif tags in EXIF_TAGS are read, their values are strings
     - Since there are so many conditionals it is recommended to use the existing gallery stylesheet
 
     Examples
@@ -367,14 +699,31 @@ class Image(Content):
     metadata, html = Image().get_content('1.jpg')
     ```
     """
-    ignore_exif_data:bool = False
-    extensions:List[str] = (".jpg", ".png", ".jpeg", ".gif", ".svg", ".webp", ".apng", ".jfif", ".pjpeg", ".pjp")
+    ignore_exif_data:ClassVar[bool] = False # Set on the class so the config value applies to every instance
+    exif_index:ClassVar[Optional[ExifIndex]] = None # Set by generate_site() to keep the exif tags of images between builds
+    extensions:List[str] = (".jpg", ".png", ".jpeg", ".jpe", ".gif", ".svg", ".webp", ".apng", ".jfif", ".pjpeg", ".pjp", ".tif", ".tiff")
     image_paths:List[str] = field(default_factory=lambda: []) # TODO: find way to implement this properly
 
 
+    @classmethod
+    def get_cache_settings(cls) -> str:
+        """Returns whether exif data is ignored (and which tags are read), so cached content is invalidated when it changes
+
+        Returns
+        -------
+        str
+            The value of ignore_exif_data and the exif tags that are read i.e. 'ignore_exif_data=False;exif_tags=Image Make,...'
+        """
+        return f"ignore_exif_data={cls.ignore_exif_data};exif_tags={','.join(EXIF_TAGS)}"
+
+
     def __metadata__(self, filename:str) -> defaultdict:
         """Return the metadata of the file (and exif data if available)
 
+        Notes
+        -----
+        - The exif tags are read with read_exif_tags(), and come from Image.exif_index instead if the image is in it
+
         Parameters
         ----------
         filename : str
@@ -385,20 +734,23 @@ class Image(Content):
         defaultdict
             A defaultdict of the keys with the metadata in it
         """
-        logging.debug(f"[ezcv Image.__metadata__()] Getting metadata for {filename=}")
+        logging.debug("[ezcv Image.__metadata__()] Getting metadata for filename=%r", filename)
         if self.ignore_exif_data:
             return defaultdict(lambda:False)
 
-        elif filename.lower().endswith("jpg"):
-            with open(filename ,"rb") as f:
-                tags = exifread.process_file(f)
+        elif filename.lower().endswith(EXIF_EXTENSIONS):
+            tags = self.exif_index.get(filename) if self.exif_index else None
+            if tags is None:
+                tags = read_exif_tags(filename)
+                if self.exif_index:
+                    self.exif_index.set(filename, tags) # Stores a copy, so the formatting in __html__() isn't indexed
             tags = defaultdict(lambda:False, tags)
-            logging.debug(f"[ezcv Image.__metadata__()] Returning EXIF Tags for {filename=} {tags=}")
+            logging.debug("[ezcv Image.__metadata__()] Returning EXIF Tags for filename=%r tags=%r", filename, tags)
 
             return tags
 
         else:
-            logging.debug(f"[ezcv Image.__metadata__()] No EXIF Tags for {filename=}")
+            logging.debug("[ezcv Image.__metadata__()] No EXIF Tags for filename=%r", filename)
             return defaultdict(lambda:False)
 
 
@@ -415,7 +767,7 @@ class Image(Content):
         str
             The HTML of the EXIF data from the file
         """
-        logging.debug(f"[ezcv Image.__html__({tags=})] Getting HTML for {self.image_paths=}")
+        logging.debug("[ezcv Image.__html__(tags=%r)] Getting HTML for self.image_paths=%r", tags, self.image_paths)
         html = ""
 
         # Lens detail
@@ -481,7 +833,7 @@ class Image(Content):
         metadata, html = Image().get_content('1.jpg')
         ```
         """
-        logging.debug(f"[ezcv Image.get_content()] Getting content for {file_path=}")
+        logging.debug("[ezcv Image.get_content()] Getting content for file_path=%r", file_path)
         tags = self.__metadata__(file_path)
         html = self.__html__(tags)
         tags["file_path"] = f"images/gallery/{file_path.split(os.path.sep)[-1]}"
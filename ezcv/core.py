@@ -12,12 +12,22 @@ generate_site():
 get_site_config() -> defaultdict:
     Gets the site config from provided file path and returns defaultdict of values
 
+compile_theme_templates() -> int:
+    Compiles all the templates of a theme ahead of time and stores them in the template cache
+
+Classes
+-------
+BuildCancelled:
+    Raised by generate_site() when it's cancel_event is set before the build finishes
 
 Module Variables
 ----------------
 SECTIONS_LIST (list[str]):
     The list of the first party supported sections
 
+STREAM_BUFFER_SIZE (int):
+    The number of template chunks to join before writing them when streaming a page to disk
+
 Examples
 --------
 #### Generating a site using all settings defined in "config.yml"
@@ -37,24 +47,69 @@ generate_site(output_folder="my_site", theme = "aerial", preview = True)
 
 # Standard Lib Dependencies
 import os                           # Used for path validation
-import shutil                       # Used for file/folder copying and removal
+import pickle                       # Used to check that extra filters can be sent to worker processes
+import threading                    # Used to type hint the event that cancels a build
 import logging                      # Used to log information for internal testing
+from itertools import repeat        # Used to pass the same arguments to every call in a pool
 from collections import defaultdict # Used to instatiate dictionaries with default arguments on unspecified keys
-from typing import Callable, Union  # Used to add additional typehints to help with documentation and usage on functions
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor # Used to render and write pages in parallel
+from typing import Callable, Dict, Set, Tuple, Union # Used to add additional typehints to help with documentation and usage on functions
 
 # Internal Dependencies
+from ezcv import __version__ as version
 from ezcv.themes import *
 from ezcv.content import *
 from ezcv.filters import inject_filters
+from ezcv.manifest import BUILD_STAMP_FILE_NAME, BuildManifest, BuildPlan
+from ezcv.assets import collect_files, prune_folder, sync_files
+from ezcv.output import MemoryOutput, output_exists
+from ezcv.profiler import PROFILE_FILE_NAME, BuildProfiler
+from ezcv.pagination import Page, first_page, paginate
+from ezcv.cache import CACHE_FOLDER, DEFAULT_CACHE_SIZE, TEMPLATE_CACHE_FOLDER, ContentCache, ExifIndex, get_template_cache
 
 # Third Party Dependencies
 import yaml                         # Used for config file parsing
 import jinja2                       # used as middlewear for generating templates
-from tqdm import tqdm               # Used to generate progress bars during iteration
+import jinja2.meta                  # Used to find the templates and variables a template depends on
+# tqdm (used to generate progress bars during iteration) and ezcv.images (pillow) are imported by the build steps that use them
 
 # The global list of currently supported first party sections
 SECTIONS_LIST = ["projects", "education", "work_experience", "volunteering_experience", "gallery", "blog"]
 
+# The jinja environment of a render worker process, set by _initialize_render_worker()
+_worker_environment:jinja2.Environment = None
+
+# The number of template chunks to join before writing them when streaming a page to disk
+STREAM_BUFFER_SIZE = 64
+
+# The environments created by _create_environment() keyed by theme folder, extra filters and template cache folder
+_environments:Dict[tuple, jinja2.Environment] = {}
+
+# The results of _template_dependencies() keyed by environment, template name and template source
+_template_dependencies_cache:Dict[tuple, Tuple[Set[str], Set[str]]] = {}
+
+class BuildCancelled(Exception):
+    """Raised by generate_site() when it's cancel_event is set before the build finishes"""
+
+
+def _check_cancelled(cancel_event:threading.Event):
+    """Raises BuildCancelled if the cancel event of a build is set
+
+    Parameters
+    ----------
+    cancel_event : threading.Event
+        The cancel event passed to generate_site(), or None if the build can't be cancelled
+
+    Raises
+    ------
+    BuildCancelled
+        If the event is set
+    """
+    if cancel_event is not None and cancel_event.is_set():
+        logging.debug("[ezcv _check_cancelled()] Stopping cancelled build")
+        raise BuildCancelled("The build was cancelled before it finished")
+
+
 def get_site_config(config_file_path:str = "config.yml", remotes_file_path:str = os.path.join(THEMES_FOLDER, "remotes.yml")) -> defaultdict:
     """Gets the site config from provided file path and returns defaultdict of values
 
@@ -68,14 +123,14 @@ def get_site_config(config_file_path:str = "config.yml", remotes_file_path:str =
     defaultdict:
         The configuration, if any key is not present it defaults to False
     """
-    logging.debug(f"[ezcv get_site_config({config_file_path}, {remotes_file_path})]: Loading config file")
+    logging.debug("[ezcv get_site_config(%s, %s)]: Loading config file", config_file_path, remotes_file_path)
     if not os.path.exists(config_file_path):
         raise FileNotFoundError(f"Config file at {config_file_path} was not found")
 
     with open(config_file_path, "r") as config_file:
         config = yaml.safe_load(config_file)
 
-    logging.debug(f"[ezcv get_site_config({config_file_path}, {remotes_file_path})]: Loading remotes file")
+    logging.debug("[ezcv get_site_config(%s, %s)]: Loading remotes file", config_file_path, remotes_file_path)
     config["remotes"] = get_remote_themes(remotes_file_path)
 
     # Convert config dict to defaultdict so that all empty values are False instead of giving KeyNotFoundError
@@ -84,6 +139,151 @@ def get_site_config(config_file_path:str = "config.yml", remotes_file_path:str =
     return default_dict_config
 
 
+def _create_environment(theme_folder:str, extra_filters:List[Callable] = None, template_cache_folder:str = None) -> jinja2.Environment:
+    """Creates the jinja environment for a theme with the custom filters injected
+
+    Notes
+    -----
+    - Environments are reused for the same theme, filters and template cache within a process, so templates \
+        that were already compiled (i.e. in a previous preview build) are only recompiled if their file changed
+
+    Parameters
+    ----------
+    theme_folder : (str)
+        The absolute path to the folder for the theme to use
+
+    extra_filters : (List[Callable], optional)
+        An optional set of method objects containing additional filter functions you want to use
+
+    template_cache_folder : (str, optional)
+        The folder to store compiled templates in between builds, by default None which does not store them
+
+    Returns
+    -------
+    jinja2.Environment
+        The jinja environment pre-loaded with the theme and filters
+    """
+    environment_key = (os.path.abspath(theme_folder), tuple(extra_filters or ()), template_cache_folder)
+    if environment_key in _environments:
+        return _environments[environment_key]
+    bytecode_cache = get_template_cache(theme_folder, template_cache_folder) if template_cache_folder else None
+    theme_loader = jinja2.FileSystemLoader(theme_folder)
+    environment = jinja2.Environment(loader=theme_loader, autoescape=True, trim_blocks=True, bytecode_cache=bytecode_cache) # Grab all files in theme_folder
+    _environments[environment_key] = inject_filters(environment, extra_filters)
+    return _environments[environment_key]
+
+
+def compile_theme_templates(theme_folder:str, template_cache_folder:str = TEMPLATE_CACHE_FOLDER) -> int:
+    """Compiles all the templates of a theme ahead of time and stores them in the template cache
+
+    Parameters
+    ----------
+    theme_folder : str
+        The path to the theme folder
+
+    template_cache_folder : str, optional
+        The folder to store compiled templates in, by default TEMPLATE_CACHE_FOLDER
+
+    Returns
+    -------
+    int
+        The number of templates that were compiled
+
+    Raises
+    ------
+    jinja2.TemplateSyntaxError
+        If any of the templates are invalid
+
+    Examples
+    --------
+    ```
+    from ezcv.core import compile_theme_templates
+    from ezcv.themes import THEMES_FOLDER
+
+    compile_theme_templates(os.path.join(THEMES_FOLDER, "dimension"))
+    ```
+    """
+    logging.debug("[ezcv compile_theme_templates(theme_folder=%r, template_cache_folder=%r)] Compiling templates", theme_folder, template_cache_folder)
+    environment = _create_environment(os.path.abspath(theme_folder), template_cache_folder=template_cache_folder)
+    templates = environment.list_templates(extensions=["jinja"])
+    for template in templates:
+        environment.get_template(template) # Compiles the template and stores it in the bytecode cache
+    return len(templates)
+
+
+def _template_dependencies(template:str, environment:jinja2.Environment) -> Tuple[Set[str], Set[str]]:
+    """Finds the templates a template uses (itself, and any it extends, includes or imports) and the context variables they read
+
+    Notes
+    -----
+    - If a template includes another template by a name that is only known when rendering, '*' is added to the templates \
+        so the template depends on every template in the theme
+
+    Parameters
+    ----------
+    template : (str)
+        The name of the template inside the theme folder i.e. 'index.jinja'
+
+    environment : (jinja2.Environment)
+        The jinja environment pre-loaded with the themes and filters
+
+    Returns
+    -------
+    Tuple[Set[str], Set[str]]
+        The names of the templates, and the names of the undeclared variables i.e. ({'index.jinja'}, {'config', 'projects_html'})
+    """
+    templates, variables = set(), set()
+    remaining = [template]
+    while remaining:
+        current_template = remaining.pop()
+        if current_template in templates:
+            continue
+        templates.add(current_template)
+        try:
+            source, _, _ = environment.loader.get_source(environment, current_template)
+        except jinja2.TemplateNotFound:
+            continue
+        cache_key = (id(environment), current_template, source)
+        if not cache_key in _template_dependencies_cache:
+            ast = environment.parse(source)
+            referenced = {name if name is not None else "*" for name in jinja2.meta.find_referenced_templates(ast)}
+            _template_dependencies_cache[cache_key] = (referenced, jinja2.meta.find_undeclared_variables(ast))
+        referenced, template_variables = _template_dependencies_cache[cache_key]
+        variables.update(template_variables)
+        for referenced_template in referenced:
+            if referenced_template == "*":
+                templates.add("*")
+            else:
+                remaining.append(referenced_template)
+    return templates, variables
+
+
+def _page_dependencies(page:str, environment:jinja2.Environment) -> Set[str]:
+    """Returns the nodes of the dependency graph a page rendered with the site context depends on
+
+    Parameters
+    ----------
+    page : (str)
+        The filename inside the theme folder to render i.e. 'index.jinja'
+
+    environment : (jinja2.Environment)
+        The jinja environment pre-loaded with the themes and filters
+
+    Returns
+    -------
+    Set[str]
+        The templates the page uses, the rendered sections it uses (i.e. 'projects_html'), and 'content/' if it uses the raw content of every section
+    """
+    templates, variables = _template_dependencies(page, environment)
+    dependencies = set(templates)
+    for variable in variables:
+        if variable.endswith("_html"):
+            dependencies.add(variable)
+        elif variable == "sections":
+            dependencies.add("content/")
+    return dependencies
+
+
 def _render_section(section_name:str, site_context:dict, environment:jinja2.Environment, blog:bool=False) -> str:
     """Renders the particular section provided using the environment provided
 
@@ -106,7 +306,7 @@ def _render_section(section_name:str, site_context:dict, environment:jinja2.Envi
     str:
         The rendered template of the section
     """
-    logging.debug(f"[ezcv _render_section({section_name}, {site_context}, {environment})]: Begin rendering section")
+    logging.debug("[ezcv _render_section(%s, %s, %s)]: Begin rendering section", section_name, site_context.keys(), environment)
     try:
         contents = site_context["sections"][section_name]
     except KeyError:
@@ -116,7 +316,7 @@ def _render_section(section_name:str, site_context:dict, environment:jinja2.Envi
         else:
             return ""
 
-    logging.debug(f"[ezcv _render_section({section_name}, {site_context}, {environment})]: Rendering sections")
+    logging.debug("[ezcv _render_section(%s, %s, %s)]: Rendering sections", section_name, site_context.keys(), environment)
     if not blog: # Rendering sections that are not blog sections
     # If a section template exists set it to the path, else False i.e. if <theme folder>/sections/<section name>.jinja exists set it to that
         section_template_file = f"sections/{section_name}.jinja"
@@ -148,7 +348,8 @@ def _render_section(section_name:str, site_context:dict, environment:jinja2.Envi
         elif feed_file_path:
             if len(contents) > 0: # If there is any markdown content
                 logging.debug("[ezcv _render_section()] Rendering feed file")
-                html = environment.get_template(feed_file).render({section_name:contents, "config": site_context["config"]})
+                blog_page = first_page(section_name, contents, site_context["config"]["blog_page_size"] or 0)
+                html = _render_feed(section_name, blog_page, site_context, environment)
             else:
                 html = ""
         if not single_file_path:
@@ -157,6 +358,33 @@ def _render_section(section_name:str, site_context:dict, environment:jinja2.Envi
         return single_file, overview_file, html
 
 
+def _render_feed(section_name:str, blog_page:Page, site_context:dict, environment:jinja2.Environment) -> str:
+    """Renders the feed of a page of a blog section
+
+    Parameters
+    ----------
+    section_name : (str)
+        The name of the blog section i.e. 'blog'
+
+    blog_page : (Page)
+        The page of the section to render, only it's posts are passed to the template
+
+    site_context: (dict)
+        The dictionary containing the site's context
+
+    environment : (jinja2.Environment)
+        The jinja environment pre-loaded with the themes and filters
+
+    Returns
+    -------
+    str:
+        The rendered feed template
+    """
+    logging.debug("[ezcv _render_feed(%s, %s)]: Rendering page %s of %s", section_name, blog_page.output_path, blog_page.number, blog_page.total_pages)
+    feed_template = environment.get_template(f"sections/{section_name}/feed.jinja")
+    return feed_template.render({section_name: blog_page.posts, "config": site_context["config"], "page": blog_page})
+
+
 def _render_page(page:str, site_context:dict, environment:jinja2.Environment) -> str:
     """Renders the page provided from the specified theme
 
@@ -176,14 +404,252 @@ def _render_page(page:str, site_context:dict, environment:jinja2.Environment) ->
     str:
         The rendered html of the page
     """
-    logging.debug(f"[ezcv _render_page({page}, {site_context}, {environment})]: Begin rendering page")
+    logging.debug("[ezcv _render_page(%s, %s, %s)]: Begin rendering page", page, site_context.keys(), environment)
     inject_filters(environment) # Add in custom filters
     # Render template and return contents
     theme = environment.get_template(page)
     return theme.render(site_context)
 
 
-def _export(site_context:dict, theme_folder:str, environment:jinja2.Environment, output_folder:str = "site",  pages:list=None ):
+def _stream_page(page:str, site_context:dict, environment:jinja2.Environment, output_path:str):
+    """Renders the page provided from the specified theme straight into the output file
+
+    Notes
+    -----
+    - The page is written in chunks as it renders instead of being built up as one string, so memory use does not \
+        grow with the size of the page (i.e. an index.html that includes every section)
+    - The page is written to a temporary file that replaces output_path once it's done, so a half rendered page is never served
+
+    Parameters
+    ----------
+    page : (str)
+        The filename inside the theme folder to render i.e. 'index.jinja'
+
+    site_context : (dict)
+        A dictionary containing the config values, and all sections html
+
+    environment : (jinja2.Environment)
+        The jinja environment pre-loaded with the themes and filters
+
+    output_path : (str)
+        The path to write the rendered html to
+    """
+    logging.debug("[ezcv _stream_page(%s, %s, %s, %s)]: Begin streaming page", page, site_context.keys(), environment, output_path)
+    inject_filters(environment) # Add in custom filters
+    stream = environment.get_template(page).stream(site_context)
+    stream.enable_buffering(STREAM_BUFFER_SIZE)
+    temporary_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        stream.dump(temporary_path, encoding="utf-8")
+        os.replace(temporary_path, output_path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+
+def _write_page(page:str, site_context:dict, environment:jinja2.Environment, output_folder:Union[str, MemoryOutput], output:str):
+    """Renders a page into the output folder, or into the pages of a site being built in memory
+
+    Parameters
+    ----------
+    page : (str)
+        The filename inside the theme folder to render i.e. 'index.jinja'
+
+    site_context : (dict)
+        A dictionary containing the config values, and all sections html
+
+    environment : (jinja2.Environment)
+        The jinja environment pre-loaded with the themes and filters
+
+    output_folder : (Union[str, MemoryOutput])
+        The folder to output the page to, or the site being built in memory
+
+    output : (str)
+        The path of the page relative to the output folder (with / as a seperator) i.e. 'blog/page/2.html'
+    """
+    if isinstance(output_folder, MemoryOutput):
+        output_folder.pages[output] = _render_page(page, site_context, environment).encode("utf-8")
+        return
+    output_path = os.path.join(output_folder, *output.split("/"))
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    _stream_page(page, site_context, environment, output_path)
+
+
+def _write_file(file_path:str, text:str):
+    """Writes text to a file, used to write pages on a background thread while the next page renders
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the file to write
+
+    text : str
+        The text to write to the file
+    """
+    with open(file_path, "w+", encoding="utf-8") as outfile:
+        outfile.write(text)
+
+
+def _initialize_render_worker(theme_folder:str, extra_filters:List[Callable], template_cache_folder:str):
+    """Creates the jinja environment used by a render worker process
+
+    Parameters
+    ----------
+    theme_folder : str
+        The absolute path to the folder for the theme to use
+
+    extra_filters : List[Callable]
+        The additional filter functions passed to generate_site()
+
+    template_cache_folder : str
+        The folder compiled templates are stored in, or None
+    """
+    global _worker_environment
+    _worker_environment = _create_environment(theme_folder, extra_filters, template_cache_folder)
+
+
+def _render_single_page(template_file:str, config:dict, metadata:dict, html:str) -> str:
+    """Renders a single blog post, used as the unit of work for render workers when building in memory
+
+    Notes
+    -----
+    - The config and metadata are passed as regular dicts since defaultdicts with a lambda default can't be pickled
+
+    Parameters
+    ----------
+    template_file : str
+        The template to render i.e. 'sections/blog/single.jinja'
+
+    config : dict
+        The site config
+
+    metadata : dict
+        The metadata of the post
+
+    html : str
+        The html of the post
+
+    Returns
+    -------
+    str
+        The rendered page
+    """
+    single_page_context = {"config": defaultdict(lambda: False, config), "content": [defaultdict(lambda: False, metadata), html]}
+    return _render_page(template_file, single_page_context, _worker_environment)
+
+
+def _write_single_page(template_file:str, config:dict, metadata:dict, html:str, output_path:str) -> str:
+    """Renders a single blog post and writes it to the output path, used as the unit of work for render workers
+
+    Notes
+    -----
+    - The config and metadata are passed as regular dicts since defaultdicts with a lambda default can't be pickled
+
+    Parameters
+    ----------
+    template_file : str
+        The template to render i.e. 'sections/blog/single.jinja'
+
+    config : dict
+        The site config
+
+    metadata : dict
+        The metadata of the post
+
+    html : str
+        The html of the post
+
+    output_path : str
+        The path to write the rendered page to
+
+    Returns
+    -------
+    str
+        The output path that was written
+    """
+    _write_file(output_path, _render_single_page(template_file, config, metadata, html))
+    return output_path
+
+
+def _write_single_pages(template_file:str, posts:list, config:dict, output_folder:Union[str, MemoryOutput], environment:jinja2.Environment, jobs:int = 1, theme_folder:str = "", extra_filters:List[Callable] = None, template_cache_folder:str = None):
+    """Renders and writes single blog post pages, in parallel if more than one job is specified
+
+    Parameters
+    ----------
+    template_file : str
+        The template to render i.e. 'sections/blog/single.jinja'
+
+    posts : list
+        A list of tuples of the output filename, metadata and html of each post
+
+    config : dict
+        The site config
+
+    output_folder : Union[str, MemoryOutput]
+        The folder to output the pages to, or the site being built in memory
+
+    environment : jinja2.Environment
+        The jinja environment used when rendering in this process
+
+    jobs : int, optional
+        The number of processes to render with (less than 1 uses every CPU), by default 1
+
+    theme_folder : str, optional
+        The absolute path to the folder for the theme, used to setup the environment of render workers, by default ""
+
+    extra_filters : List[Callable], optional
+        The additional filter functions passed to generate_site(), by default None
+
+    template_cache_folder : str, optional
+        The folder compiled templates are stored in, used to setup the environment of render workers, by default None
+
+    Raises
+    ------
+    jinja2.UndefinedError
+        If a template uses a value that is not defined
+    """
+    if jobs != 1 and len(posts) > 1:
+        try: # Filters are sent to each worker, so they need to be picklable (i.e. not lambdas)
+            pickle.dumps(extra_filters)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            print("[ezcv _export()]: extra_filters can't be sent to worker processes, rendering blog posts in a single process")
+            jobs = 1
+    in_memory = isinstance(output_folder, MemoryOutput)
+    if in_memory and (jobs == 1 or len(posts) < 2):
+        for page_name, metadata, html in posts:
+            output_folder.pages[page_name] = _render_page(template_file, {"config": config, "content": [metadata, html]}, environment).encode("utf-8")
+        return
+    if jobs == 1 or len(posts) < 2:
+        # Render on this thread, and write the previous page on a background thread while the next one renders
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            writes = []
+            for page_name, metadata, html in posts:
+                single_page_context = {"config": config, "content": [metadata, html]}
+                writes.append(writer.submit(_write_file, os.path.join(output_folder, page_name), _render_page(template_file, single_page_context, environment)))
+            for write in writes:
+                write.result() # Raise any errors from writing
+        return
+
+    # Each worker renders and writes it's own pages so writing overlaps with rendering in other workers
+    workers = (os.cpu_count() or 1) if jobs < 1 else jobs
+    logging.debug("[ezcv _write_single_pages()]: Rendering %s pages with %s workers", len(posts), workers)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initialize_render_worker, initargs=(theme_folder, extra_filters, template_cache_folder)) as pool:
+        chunk_size = max(1, len(posts) // (workers * 4))
+        plain_config = dict(config)
+        if in_memory:
+            rendered = pool.map(_render_single_page, repeat(template_file), repeat(plain_config), (dict(metadata) for _, metadata, _ in posts),
+                                (html for _, _, html in posts), chunksize=chunk_size)
+            for (page_name, _, _), page_html in zip(posts, rendered):
+                output_folder.pages[page_name] = page_html.encode("utf-8")
+            return
+        written = pool.map(_write_single_page, repeat(template_file), repeat(plain_config), (dict(metadata) for _, metadata, _ in posts),
+                           (html for _, _, html in posts), (os.path.join(output_folder, page_name) for page_name, _, _ in posts), chunksize=chunk_size)
+        for _ in written: # Consume results to raise any errors from the workers
+            pass
+
+
+def _export(site_context:dict, theme_folder:str, environment:jinja2.Environment, output_folder:Union[str, MemoryOutput] = "site",  pages:list=None, plan:BuildPlan=None, jobs:int = 1, extra_filters:List[Callable] = None, template_cache_folder:str = None, publish_method:str = "copy", profiler:BuildProfiler = None, cancel_event:threading.Event = None, extra_static_files:Dict[str, str] = None, optimize:bool = False, strip_exif:bool = True, cache:bool = True):
     """Generates all the site html from pages specified and outputs them to the output folder
 
     Parameters
@@ -197,89 +663,160 @@ def _export(site_context:dict, theme_folder:str, environment:jinja2.Environment,
     environment : (jinja2.Environment)
         The jinja environment pre-loaded with the themes and filters
 
-    output_folder : (str, optional)
-        The folder to output the HTML files to, by default "site"
+    output_folder : (Union[str, MemoryOutput], optional)
+        The folder to output the HTML files to, or the site being built in memory, by default "site"
 
     pages : (list, optional)
         The list of pages to use, by default None which gets set to ["index.jinja"]
 
+    plan : (BuildPlan, optional)
+        The plan for an incremental build, by default None which rebuilds everything
+
+    jobs : (int, optional)
+        The number of processes to render blog posts with (less than 1 uses every CPU), by default 1
+
+    extra_filters : (List[Callable], optional)
+        The additional filter functions passed to generate_site(), needed to setup render workers, by default None
+
+    template_cache_folder : (str, optional)
+        The folder compiled templates are stored in, needed to setup render workers, by default None
+
+    publish_method : (str, optional)
+        How to publish theme assets and images to the output folder, one of PUBLISH_METHODS, by default "copy"
+
+    profiler : (BuildProfiler, optional)
+        The profiler to record the time each phase takes with, by default None
+
+    cancel_event : (threading.Event, optional)
+        Stops the export between pages when it's set, by default None
+
+    extra_static_files : (Dict[str, str], optional)
+        Files to publish along with the theme assets and images (i.e. gallery image variants), \
+        mapped from their path in the output folder to their source path, by default None
+
+    optimize : (bool, optional)
+        Whether to optimize images and minify html/css/js files, by default False. Static files are optimized into \
+        .ezcv_cache and their optimized copies are published, and rendered pages are minified once they're written
+
+    strip_exif : (bool, optional)
+        Whether to remove the exif data of images when optimizing them, by default True
+
+    cache : (bool, optional)
+        Whether to use the records of files that were optimized by earlier builds, by default True
+
     Raises
     ------
     FileNotFoundError
         If the provided theme folder does not exist
+
+    BuildCancelled
+        If the cancel event is set before the export finishes
     """
     if pages is None:
         pages = ["index.jinja"]
+    if plan is None:
+        plan = BuildPlan()
+    if profiler is None:
+        profiler = BuildProfiler()
     if not os.path.exists(theme_folder): # Error out if provided theme folder does not exist
         raise FileNotFoundError(f"The provided theme folder does not exist: {theme_folder}")
 
-    # Copy source files
-    try:
-        shutil.copytree(theme_folder, output_folder, ignore=shutil.ignore_patterns("*.jinja"))
-
-    except FileExistsError:
-        shutil.rmtree(output_folder)
-        shutil.copytree(theme_folder, output_folder, ignore=shutil.ignore_patterns("*.jinja"))
-    
-    # Copy images
-    output_image_dir = os.path.join(output_folder, "images")
-    if os.path.exists("images"):
-        if not os.path.exists(output_image_dir): # Create output_folder/images if it's not present
-            os.mkdir(output_image_dir)
-        for file in os.listdir("images"): # Copy file from source images folder to output image directory
-            # TODO: Add catch for if image already exists
-            shutil.copyfile(os.path.join("images", file), os.path.join(output_image_dir, file))
-
-    # Copy Gallery images
-    output_fallery_image_dir = os.path.join(output_folder, "images", "gallery")
-    if os.path.exists(os.path.join("content", "gallery")):
-        if not os.path.exists(output_fallery_image_dir): # Create output_folder/images/gallery if it's not present
-            os.mkdir(output_fallery_image_dir)
-        for file in os.listdir(os.path.join("content", "gallery")): # Copy file from source images folder to output image directory
-            # TODO: Add catch for if image already exists
-            shutil.copyfile(os.path.join("content", "gallery", file), os.path.join(output_fallery_image_dir, file))
+    in_memory = isinstance(output_folder, MemoryOutput)
+    if not in_memory:
+        os.makedirs(output_folder, exist_ok=True)
+    _check_cancelled(cancel_event)
+    phase = profiler.start("Asset publishing")
+
+    # Collect the theme assets and site images, site images replace theme images with the same name
+    static_files = collect_files(theme_folder, ignore_patterns=("*.jinja", "metadata.yml"))
+    for path in [path for path in static_files if not "/" in path and path.endswith(".html")]:
+        del static_files[path] # Top level html files are rendered as pages
+    static_files.update(collect_files("images", "images/"))
+    static_files.update(collect_files(os.path.join("content", "gallery"), "images/gallery/"))
+    static_files.update(extra_static_files or {})
+
+    # Publish the optimized copies of images, css and js files (from the cache) instead of optimizing the published files
+    if optimize and not in_memory:
+        from ezcv.optimize import optimize_static_files # Imported here so pillow and css_html_js_minify are only loaded when optimizing
+        static_files, optimized, skipped = optimize_static_files(static_files, jobs, strip_exif, cache=cache)
+        print(f"Optimized {optimized} static files, {skipped} were already optimized")
+
+    # Publish the files that changed since the last build to the output folder
+    force = set(plan.changed_assets)
+    force.update(image.replace("content/gallery/", "images/gallery/", 1) for image in plan.changed_images)
+    if in_memory: # Static files are referenced from their source instead of being copied
+        published, skipped = output_folder.reference(static_files, force)
+    else:
+        published, skipped = sync_files(static_files, output_folder, publish_method, force)
+    plan.rebuilt["assets"] += published
+    plan.skipped["assets"] += skipped
+    phase.files = published
+    profiler.finish(phase)
 
     # Iterate through top level pages and write to the output folder
     print("\nGenerating output html from theme")
+    phase = profiler.start("Page rendering")
+    from tqdm import tqdm
     pages_iterator = tqdm(pages)
     pages_iterator.set_description_str("Generating top level pages")
     templates_list = environment.list_templates()
     for page in pages_iterator:  # Write new pages
+        _check_cancelled(cancel_event)
         if type(page) == str: # Standard markdown sections
-            try:
-                html = _render_page(page, site_context, environment)
-            except jinja2.UndefinedError as e:
-                print(e)
-                raise ValueError("A required configuration value is missing")
+            source = page
             if page.endswith(".jinja"):
                 page = f"{page[:-6:]}.html"
+            if not plan.needs_render(page, output_exists(output_folder, page)):
+                continue
             pages_iterator.set_description_str(f"Writing {page}")
             pages_iterator.refresh()
-            with open(f"{output_folder}{os.sep}{page}", "w+") as outfile:
-                outfile.write(html)
+            plan.add_dependencies(page, _page_dependencies(source, environment))
+            try:
+                _write_page(source, site_context, environment, output_folder, page)
+            except jinja2.UndefinedError as e:
+                print(e)
+                raise ValueError("A required configuration value is missing")
+            plan.outputs[page] = source
+            plan.rebuilt["pages"] += 1
         elif type(page) == list: # Blog sections
             if len(page) == 2: # overview pages
-                logging.debug(f"[ezcv _export()]: Rendering {page[0]} overview page")
+                logging.debug("[ezcv _export()]: Rendering %s overview page", page[0])
                 if not "sections/blog/overview.jinja" in templates_list:
                     print("[ezcv _export()]: No overview template found")
                     continue
-                try:
-                    html = _render_page(page[1], site_context, environment)
-                except jinja2.UndefinedError as e:
-                    print(e)
-                    raise ValueError("A required configuration value is missing")
-                if page[1].endswith(".jinja"):
-                    page = f"{page[0]}.html"
-                pages_iterator.set_description_str(f"Writing {page}")
-                pages_iterator.refresh()
-                with open(f"{output_folder}{os.sep}{page}", "w+") as outfile:
-                    outfile.write(html)
+                section_name = page[0]
+                source = page[1]
+                posts = site_context["sections"].get(section_name, [])
+                feed_templates, _ = _template_dependencies(f"sections/{section_name}/feed.jinja", environment)
+                overview_dependencies = _page_dependencies(source, environment) | feed_templates | {f"content/{section_name}/"}
+                for blog_page in paginate(section_name, posts, site_context["config"]["blog_page_size"] or 0):
+                    if not plan.needs_render(blog_page.output_path, output_exists(output_folder, blog_page.output_path)):
+                        plan.outputs[blog_page.output_path] = source
+                        continue
+                    _check_cancelled(cancel_event)
+                    pages_iterator.set_description_str(f"Writing {blog_page.output_path}")
+                    pages_iterator.refresh()
+                    # Each page of the overview gets the feed of only it's own posts
+                    page_context = dict(site_context)
+                    page_context["page"] = blog_page
+                    if blog_page.number > 1:
+                        page_context[f"{section_name}_html"] = _render_feed(section_name, blog_page, site_context, environment)
+                    plan.add_dependencies(blog_page.output_path, overview_dependencies)
+                    try:
+                        _write_page(source, page_context, environment, output_folder, blog_page.output_path)
+                    except jinja2.UndefinedError as e:
+                        print(e)
+                        raise ValueError("A required configuration value is missing")
+                    plan.outputs[blog_page.output_path] = source
+                    plan.rebuilt["pages"] += 1
             elif len(page) == 3: # Single pages
-                logging.debug(f"[ezcv _export()]: Rendering {page[0]} single pages")
+                logging.debug("[ezcv _export()]: Rendering %s single pages", page[0])
                 if not "sections/blog/single.jinja" in templates_list:
                     print("[ezcv _export()]: No single blog post template found")
                     continue
+                section_name = page[0]
                 template_file = page[1]
+                single_pages = {} # The output filename of each post to (metadata, html, content file name)
                 for content_file in page[2]:
                     if content_file[0]["title"]:
                         title = content_file[0]["title"]
@@ -287,30 +824,60 @@ def _export(site_context:dict, theme_folder:str, environment:jinja2.Environment,
                         title = content_file[2].replace('.md', '')
                     if title == "index":
                         raise ValueError("The title of a blog post cannot be 'index'")
-                    try:
-                        single_page_context = {"config": site_context["config"], "content": [content_file[0], content_file[1]]}
-                        html = _render_page(template_file, single_page_context, environment)
-                    except jinja2.UndefinedError as e:
-                        print(e)
-                        raise ValueError("A required configuration value is missing")
-                    if template_file.endswith(".jinja"):
-                        page = f"{title}.html"
-                    pages_iterator.set_description_str(f"Writing {page}")
-                    pages_iterator.refresh()
-                    with open(f"{output_folder}{os.sep}{page}", "w+") as outfile:
-                        outfile.write(html)
-    logging.debug("Cleaning up metadata.yml")
-    if os.path.exists(os.path.join(output_folder, "metadata.yml")):
-        os.remove(os.path.join(output_folder, "metadata.yml")) # Remove metadata file
-
-
-def generate_site(output_folder:str="site", theme:str = "dimension", sections: list = None, config_file_path="config.yml", preview:bool = False, extra_filters:List[Callable] = None):
+                    page_name = f"{title}.html"
+                    if page_name in single_pages: # Later posts overwrite earlier ones with the same title
+                        print(f"[ezcv _export()]: Blog posts '{single_pages[page_name][2]}' and '{content_file[2]}' have the same title '{title}', only '{content_file[2]}' will be written")
+                    single_pages[page_name] = content_file
+                posts = [] # The posts that need to be rendered
+                single_templates, _ = _template_dependencies(template_file, environment)
+                for page_name, content_file in single_pages.items():
+                    source = f"content/{section_name}/{content_file[2]}"
+                    plan.outputs[page_name] = source
+                    if plan.needs_render(page_name, output_exists(output_folder, page_name)):
+                        plan.add_dependencies(page_name, single_templates | {source})
+                        posts.append((page_name, content_file[0], content_file[1]))
+                pages_iterator.set_description_str(f"Writing {len(posts)} {section_name} posts")
+                pages_iterator.refresh()
+                try:
+                    _write_single_pages(template_file, posts, site_context["config"], output_folder, environment, jobs, theme_folder, extra_filters, template_cache_folder)
+                except jinja2.UndefinedError as e:
+                    print(e)
+                    raise ValueError("A required configuration value is missing")
+                plan.rebuilt["pages"] += len(posts)
+
+    plan.skipped["pages"] += len(plan.outputs) - plan.rebuilt["pages"]
+    phase.files = plan.rebuilt["pages"]
+    profiler.finish(phase)
+
+    if optimize and not in_memory:
+        _check_cancelled(cancel_event)
+        phase = profiler.start("Page minification")
+        from ezcv.optimize import PAGE_CACHE_FOLDER, minify_files
+        minified, skipped = minify_files(output_folder, jobs, PAGE_CACHE_FOLDER if cache else None, paths=plan.outputs)
+        print(f"Minified {minified} pages, {skipped} were unchanged")
+        phase.files = minified
+        profiler.finish(phase)
+
+    # Remove files that are no longer part of the site (i.e. a deleted blog post, or the output of a different theme)
+    _check_cancelled(cancel_event)
+    phase = profiler.start("Stale file removal")
+    if in_memory:
+        removed = output_folder.prune(set(plan.outputs))
+    else:
+        removed = prune_folder(output_folder, set(static_files) | set(plan.outputs))
+    phase.files = removed
+    profiler.finish(phase)
+    logging.debug("[ezcv _export()]: Removed %s stale files from %s", removed, output_folder)
+
+
+def generate_site(output_folder:Union[str, MemoryOutput]="site", theme:str = "dimension", sections: list = None, config_file_path="config.yml", preview:bool = False, extra_filters:List[Callable] = None, incremental:bool = False, jobs:int = None, cache:bool = True, profile:bool = False, cancel_event:threading.Event = None, optimize:bool = False, strip_exif:bool = True):
     """The primary entrypoint to generating a site
 
     Parameters
     ----------
-    output_folder : (str, optional)
-        The folder to output the site files to, by default "site"
+    output_folder : (Union[str, MemoryOutput], optional)
+        The folder to output the site files to, by default "site". If a MemoryOutput is passed the site is built in memory \
+        instead, and the previous build stored in it is used for incremental builds
 
     theme : (str, optional)
         The name of the theme to use, by default "dimension"
@@ -327,6 +894,29 @@ def generate_site(output_folder:str="site", theme:str = "dimension", sections: l
     extra_filters : List[Callable], optional
         An optional set of method objects containing additional filter functions you want to use
 
+    incremental : (bool, optional)
+        Only redo the work whose inputs changed since the last build in output_folder, by default False
+
+    jobs : (int, optional)
+        The number of processes to parse content and render blog posts with (less than 1 uses every CPU), by default None which uses the jobs config value or 1
+
+    cache : (bool, optional)
+        Whether to use the persistent content and template caches in .ezcv_cache (unless they're turned off in the config), by default True
+
+    profile : (bool, optional)
+        Whether to print the time each phase of the build took, and write them to PROFILE_FILE_NAME as JSON, by default False
+
+    cancel_event : (threading.Event, optional)
+        An event that stops the build early when it's set (i.e. from another thread when the files changed again), by default None. \
+        The output folder is left partially updated, and the build manifest is not written so the next incremental build redoes the work
+
+    optimize : (bool, optional)
+        Whether to optimize images and minify html, css and js files (see ezcv.optimize.optimize_static_files()), by default False. \
+        Ignored when building in memory
+
+    strip_exif : (bool, optional)
+        Whether to remove the exif data of images when optimizing them, by default True
+
     Notes
     -----
     - theme options are: 
@@ -352,11 +942,19 @@ def generate_site(output_folder:str="site", theme:str = "dimension", sections: l
         - Gallery (gallery)
     - If sections is an empty list then the theme's section directory will be searched for themes
 
+    Returns
+    -------
+    Union[MemoryOutput, None]
+        The site that was built if output_folder is a MemoryOutput (the one passed in is not modified), otherwise None
+
     Raises
     ------
     FileNotFoundError
         If the provided theme folder does not exist
 
+    BuildCancelled
+        If the cancel event is set before the build finishes
+
     Examples
     --------
     Generating a site with all default settings
@@ -372,34 +970,60 @@ def generate_site(output_folder:str="site", theme:str = "dimension", sections: l
 
     generate_site(output_folder="my_site", sections=["projects"])
     ```
+
+    Generating a site in memory and reading the homepage
+    ```
+    from ezcv.core import generate_site
+    from ezcv.output import MemoryOutput
+
+    site = generate_site(output_folder=MemoryOutput())
+    homepage = site.read("index.html")
+    ```
     """
     if sections is None:
         sections = []
     if extra_filters is None:
         extra_filters = []
-    print(f"Exporting site to {output_folder}")
+    if isinstance(output_folder, MemoryOutput):
+        print("Building site in memory")
+        previous_output = output_folder
+        output_folder = previous_output.copy() if incremental else MemoryOutput() # Leave the previous build untouched so it can still be served
+    else:
+        print(f"Exporting site to {output_folder}")
     pages = [] # Filled with a list of all the pages to render
+    profiler = BuildProfiler(settings={"output_folder": output_folder if isinstance(output_folder, str) else "<memory>", "theme": theme, "preview": preview, "incremental": incremental, "cache": cache})
 
     # The data passed to render all pages
     logging.debug("[ezcv] Initializing site context with config file")
+    phase = profiler.start("Config loading", files=1)
     site_context:dict[str, Union[list, defaultdict, dict]] = {"config": get_site_config(config_file_path)}
+    profiler.finish(phase)
 
     logging.debug("[ezcv] Getting ignore_exif_data config value")
-    if site_context["config"]["ignore_exif_data"]:
-        Image.ignore_exif_data = True
+    Image.ignore_exif_data = bool(site_context["config"]["ignore_exif_data"])
+    # Keep the exif tags of gallery images between builds (even with cache=False, like the variant index), so unchanged images are not read again
+    Image.exif_index = ExifIndex(CACHE_FOLDER) if not Image.ignore_exif_data else None
+
+    # If no jobs argument, use the value from the site config file (defaulting to parsing one file at a time)
+    if jobs is None:
+        jobs = site_context["config"]["jobs"] if site_context["config"]["jobs"] is not False else 1
+    profiler.settings["jobs"] = jobs
 
     # If no theme argument, and a theme is defined in the site config file
     logging.debug("[ezcv] Getting theme config value")
     if site_context["config"]["theme"] and theme == "dimension": 
-        logging.debug(f"Using theme from site config file: {site_context['config']['theme']}")
+        logging.debug("Using theme from site config file: %s", site_context['config']['theme'])
         theme = site_context["config"]["theme"]
 
     # Find theme directory based on name, or download it if it's a remote theme
     logging.debug("[ezcv] Getting theme directory")
+    phase = profiler.start("Theme location")
     theme_folder = locate_theme_directory(theme, site_context)
-    logging.info(f"[ezcv] theme directory: {theme_folder}" )
+    profiler.finish(phase)
+    logging.info("[ezcv] theme directory: %s", theme_folder)
 
     # Check required_config values
+    phase = profiler.start("Theme metadata", files=1)
     if not os.path.exists(os.path.join(theme_folder, "metadata.yml")):
         new_metadata = dict(generate_theme_metadata(theme_folder))
         with open(os.path.join(theme_folder, "metadata.yml"), "w+") as outfile:
@@ -415,59 +1039,150 @@ def generate_site(output_folder:str="site", theme:str = "dimension", sections: l
                 theme_metadata["required_config"][value]["description"] = theme_metadata["required_config"][value].get("description", "")
                 print(f"\n\x1b[31mThe theme requires the '{value}'configuration value \n\n\ttype: { theme_metadata['required_config'][value]['type'] } \n\tdescription: { theme_metadata['required_config'][value]['description'] }\n\n please add\n\n\x1b[37m\t {value}: <value> \n\n\x1b[31mto your config.yml file\x1b[37m")
                 exit(1)
+    profiler.finish(phase)
 
-    # Initialize jinja loaders
-    logging.debug("[ezcv] Initializing jinja2 loaders")
-    theme_loader = jinja2.FileSystemLoader(theme_folder)
-    environment = jinja2.Environment(loader=theme_loader, autoescape=True, trim_blocks=True) # Grab all files in theme_folder
+    # Use the template cache from the site config if it's set, or the default template cache folder
+    template_cache_folder = None
+    if cache and site_context["config"].get("template_cache", True):
+        template_cache_folder = site_context["config"]["template_cache"] if isinstance(site_context["config"]["template_cache"], str) else TEMPLATE_CACHE_FOLDER
 
-    logging.debug("[ezcv] Injecting extra jinja filters into environment (if available)")
-    environment = inject_filters(environment, extra_filters)
+    # Initialize jinja loaders and inject extra jinja filters into environment (if available)
+    logging.debug("[ezcv] Initializing jinja2 environment with template_cache_folder=%r", template_cache_folder)
+    environment = _create_environment(theme_folder, extra_filters, template_cache_folder)
 
     # Initialize sections key in site context to empty dict
     site_context["sections"] = {}
 
-    # Get a list of the section names, and section theme directories
-    logging.debug("[ezcv] Getting info about sections content")
-    sections = get_theme_section_directories(theme_folder, sections, preview) # TODO: Add support for blog sections
-    sections_content_dirs = get_content_directories()
-    logging.info(f"[ezcv] Found sections: {sections}\n[ezcv] Found section content directories: {sections_content_dirs}" )
-
-    # Go through all section content files to get content (i.e. ./sections/education/*.md)
-    logging.debug("[ezcv] Getting content for each section")
-    for section in sections_content_dirs: 
-        if not section.split(os.sep)[-1] == "blog": #TODO: make parametric
-            # Get content to store in site_context["sections"][section]
-            site_context["sections"][section.split(os.sep)[-1]] = get_section_content(section, site_context["config"]["examples"])
+    # Compare against the manifest of the previous build to find what work can be skipped
+    if incremental:
+        logging.debug("[ezcv] Planning incremental build from previous build manifest")
+        phase = profiler.start("Build planning")
+        if isinstance(output_folder, MemoryOutput):
+            previous_manifest = previous_output.manifest or BuildManifest()
         else:
-            # Get content to store in site_context["sections"][section]
-            site_context["sections"][section.split(os.sep)[-1]] = get_section_content(section, site_context["config"]["examples"], blog=True)
-
-    # Get a list of all the top level pages in the theme folder and add them to the pages list
-    logging.debug("[ezcv] Getting list of top-level files (.jinja and .html)")
-    for top_level_file in os.listdir(theme_folder):
-        if top_level_file == "resume.jinja" and not site_context["config"]["resume"]: # Ignore resume.jinja if resume config var is False
-            continue
-        # TODO: add support for blog overview files
-        if top_level_file.endswith(".jinja") or top_level_file.endswith(".html"):
-            pages.append(top_level_file)
+            previous_manifest = BuildManifest.load(output_folder)
+        manifest = BuildManifest.generate(config_file_path, theme_folder, previous_manifest, settings={"sections": list(sections), "preview": preview, "optimize": optimize})
+        plan = manifest.plan(previous_manifest, output_folder)
+        phase.files = len(manifest.content) + len(manifest.templates) + len(manifest.assets) + len(manifest.images)
+        profiler.finish(phase)
+    else:
+        plan = BuildPlan()
+
+    # Generate the resized and converted versions of gallery images (only the ones that aren't in the cache)
+    image_variants, variant_files = {}, {}
+    if (site_context["config"]["image_widths"] or site_context["config"]["image_formats"]) and os.path.isdir(os.path.join("content", "gallery")):
+        _check_cancelled(cancel_event)
+        logging.debug("[ezcv] Generating gallery image variants")
+        phase = profiler.start("Image variants")
+        from ezcv.images import generate_variants # Imported here so pillow is only loaded when variants are generated
+        variant_pool = create_content_pool(jobs) if jobs != 1 else None
+        try:
+            image_variants, variant_files = generate_variants(os.path.join("content", "gallery"), "images/gallery/", site_context["config"]["image_widths"] or (), site_context["config"]["image_formats"] or (), variant_pool)
+        finally:
+            if variant_pool:
+                variant_pool.shutdown()
+        phase.files = len(variant_files)
+        profiler.finish(phase)
+
+    if plan.render_pages:
+        # Get a list of the section names, and section theme directories
+        logging.debug("[ezcv] Getting info about sections content")
+        sections = get_theme_section_directories(theme_folder, sections, preview) # TODO: Add support for blog sections
+        sections_content_dirs = get_content_directories()
+        logging.info("[ezcv] Found sections: %s\n[ezcv] Found section content directories: %s", sections, sections_content_dirs)
+
+        # Go through all section content files to get content (i.e. ./sections/education/*.md)
+        logging.debug("[ezcv] Getting content for each section with jobs=%r cache=%r", jobs, cache)
+        content_pool = create_content_pool(jobs) if jobs != 1 else None
+        content_cache = None
+        if cache and site_context["config"].get("cache", True):
+            content_cache = ContentCache(CACHE_FOLDER, site_context["config"]["cache_size"] or DEFAULT_CACHE_SIZE)
+        try:
+            for section in sections_content_dirs: 
+                if not plan.needs_section(section.split(os.sep)[-1]): # Nothing that needs to be rendered uses the section
+                    logging.debug("[ezcv] Skipping unchanged section %s", section)
+                    continue
+                _check_cancelled(cancel_event)
+                phase = profiler.start(f"Content parsing ({section.split(os.sep)[-1]})")
+                if not section.split(os.sep)[-1] == "blog": #TODO: make parametric
+                    # Get content to store in site_context["sections"][section]
+                    site_context["sections"][section.split(os.sep)[-1]] = get_section_content(section, site_context["config"]["examples"], executor=content_pool, cache=content_cache)
+                    if section.split(os.sep)[-1] == "gallery" and image_variants: # Add the srcset data of each image to it's metadata
+                        for metadata, _ in site_context["sections"]["gallery"]:
+                            metadata.update(image_variants.get(metadata["file_path"], {}))
+                else:
+                    # Get content to store in site_context["sections"][section]
+                    site_context["sections"][section.split(os.sep)[-1]] = get_section_content(section, site_context["config"]["examples"], blog=True, executor=content_pool, cache=content_cache)
+                phase.files = len(site_context["sections"][section.split(os.sep)[-1]])
+                profiler.finish(phase)
+        finally:
+            if content_pool:
+                content_pool.shutdown()
+        if Image.exif_index:
+            Image.exif_index.save()
+        if content_cache:
+            content_cache.save()
+            print(f"Got {content_cache.hits} content files from the cache, parsed {content_cache.misses}")
+
+        # Get a list of all the top level pages in the theme folder and add them to the pages list
+        logging.debug("[ezcv] Getting list of top-level files (.jinja and .html)")
+        for top_level_file in os.listdir(theme_folder):
+            if top_level_file == "resume.jinja" and not site_context["config"]["resume"]: # Ignore resume.jinja if resume config var is False
+                continue
+            # TODO: add support for blog overview files
+            if top_level_file.endswith(".jinja") or top_level_file.endswith(".html"):
+                pages.append(top_level_file)
     
-    # Go through each section, render the html and add it to the site context
-    print("\nGenerating content from sections")
-    logging.debug("[ezcv] Generating html from section content")
-    sections_iterator = tqdm(sections)
-    sections_iterator.set_description_str("Writing section content")
-    for section in sections_iterator:
-        if section == "blog": #TODO: Make parametric based on setup
-            single_page, overview_page, feed_html = _render_section(section, site_context, environment, blog=True)
-            if single_page or overview_page or feed_html:
-                site_context[f"{section}_html"] = feed_html
-                pages.append([section, overview_page])
-                pages.append([section, single_page, site_context["sections"][section]])
-        else:
-            html = _render_section(section, site_context, environment)
-            site_context[f"{section}_html"] = html
+        # Go through each section, render the html and add it to the site context
+        print("\nGenerating content from sections")
+        logging.debug("[ezcv] Generating html from section content")
+        from tqdm import tqdm
+        sections_iterator = tqdm(sections)
+        sections_iterator.set_description_str("Writing section content")
+        phase = profiler.start("Section rendering", files=len(sections))
+        for section in sections_iterator:
+            if section == "blog":
+                feed_templates, _ = _template_dependencies(f"sections/{section}/feed.jinja", environment)
+                plan.add_dependencies(f"{section}_html", feed_templates | {f"content/{section}/"})
+            else:
+                section_templates, _ = _template_dependencies(f"sections/{section}.jinja", environment)
+                plan.add_dependencies(f"{section}_html", section_templates | {f"content/{section}/"})
+            if not plan.needs_section(section):
+                continue
+            _check_cancelled(cancel_event)
+            if section == "blog": #TODO: Make parametric based on setup
+                single_page, overview_page, feed_html = _render_section(section, site_context, environment, blog=True)
+                if single_page or overview_page or feed_html:
+                    site_context[f"{section}_html"] = feed_html
+                    pages.append([section, overview_page])
+                    pages.append([section, single_page, site_context["sections"][section]])
+            else:
+                html = _render_section(section, site_context, environment)
+                site_context[f"{section}_html"] = html
+        profiler.finish(phase)
+    else:
+        print("\nNo content, config or template changes found, skipping page generation")
 
     # Generate and export all the pages of a site
     logging.debug("[ezcv] Generating html from pages")
-    _export(site_context, theme_folder, environment, output_folder, pages)
+    _export(site_context, theme_folder, environment, output_folder, pages, plan, jobs, extra_filters, template_cache_folder, site_context["config"]["publish_method"] or "copy", profiler, cancel_event, variant_files, optimize, strip_exif, cache)
+
+    if incremental:
+        manifest.outputs = plan.outputs
+        manifest.dependencies = plan.graph()
+        if isinstance(output_folder, MemoryOutput):
+            output_folder.manifest = manifest
+        else:
+            manifest.save(output_folder)
+        print(f"\n{plan.summary()}")
+
+    if not isinstance(output_folder, MemoryOutput): # Written last, so servers only reload the site once the build has finished
+        with open(os.path.join(output_folder, BUILD_STAMP_FILE_NAME), "w+") as stamp_file:
+            stamp_file.write(version)
+
+    if profile:
+        profiler.save(PROFILE_FILE_NAME)
+        print(f"\n{profiler.summary()}\n\nWrote the build profile to {os.path.abspath(PROFILE_FILE_NAME)}")
+
+    if isinstance(output_folder, MemoryOutput):
+        return output_folder
@@ -1,42 +1,86 @@
-from flask import render_template, Flask
+import os
+import hashlib
+from flask import Flask, Response, request, send_from_directory
+from werkzeug.exceptions import NotFound
 from ezcv.core import generate_site
-from jinja2.exceptions import TemplateNotFound
+from ezcv.manifest import BUILD_STAMP_FILE_NAME
 
-template_dir = 'site' # The folder you want to export your site to
+site_dir = 'site' # The folder you want to export your site to
 
-app = Flask(__name__, static_url_path='', static_folder=template_dir,  template_folder=template_dir)
+app = Flask(__name__, static_folder=None)
 
-# Turn these on when you're developing
+# Turn this on when you're developing
 # app.config["DEBUG"] = True
-# app.config['TEMPLATES_AUTO_RELOAD'] = True
 
-@app.route('/')
-def index():
-    """display the homepage"""
-    return render_template("index.html")
+pages = {} # The built html pages kept in memory, the path of each page mapped to it's (html, etag, last modified time)
+loaded_build = None # The modification time of the build stamp when the pages were loaded
 
-@app.route('/<path>')
-def static_file(path:str):
-    """Takes in a path and tries to return the template file with that title
-    So if a user types in /test then it will try to find a template called test.html
+def load_pages():
+    """Loads the built pages into memory, only reading them again if the site was rebuilt since they were loaded"""
+    global pages, loaded_build
+    try: # generate_site() writes the stamp after every build, so checking for a new build is a single stat
+        build = os.stat(os.path.join(site_dir, BUILD_STAMP_FILE_NAME)).st_mtime_ns
+    except FileNotFoundError: # The site has not been built yet, load whatever is there once
+        build = 0
+    if build == loaded_build:
+        return
+    loaded_pages = {}
+    for folder, _, files in os.walk(site_dir):
+        for file_name in files:
+            if file_name.endswith(".html"):
+                file_path = os.path.join(folder, file_name)
+                with open(file_path, "rb") as page_file:
+                    html = page_file.read()
+                path = os.path.relpath(file_path, site_dir).replace(os.sep, "/")
+                loaded_pages[path] = (html, hashlib.sha256(html).hexdigest()[:32], os.path.getmtime(file_path))
+    pages, loaded_build = loaded_pages, build # Swap in the new pages all at once
+
+def serve_page(path:str, status:int = 200) -> Response:
+    """Returns a page from memory, or a 304 response if the browser's copy is up to date
+
+    Parameters
+    ----------
+    path : str
+        The path of the page i.e. 'index.html'
+
+    status : int, optional
+        The status code of the response, by default 200
+    """
+    html, etag, last_modified = pages[path]
+    response = Response(html, status=status, mimetype="text/html")
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.cache_control.no_cache = True # Browsers check the page is up to date before using their copy
+    return response.make_conditional(request) if status == 200 else response
+
+@app.route('/', defaults={"path": ""})
+@app.route('/<path:path>')
+def site_file(path:str):
+    """Takes in a path and tries to return the page or file with that path
+    So if a user types in /test then it will try to find a page called test.html
 
     Parameters
     ----------
     path : str
         The path the user puts in the browser
     """
-    try:
-        return render_template(f"{path}.html")
-    except TemplateNotFound:
-        try: # Try to look for a 404 page
-            return render_template("404.html")
-        except TemplateNotFound: # If no 404 page exists, return a generic 404 page
-            return """<div style='font-size: XXX-large;text-align: center;'>
-            <h1>404 page not found</h1>
-            </br>
-            <button onclick='history.go(-1)'> Click to go back</button>
-            </div>"""
+    load_pages()
+    path = path.strip("/")
+    for page in (path or "index.html", f"{path}.html", f"{path}/index.html"):
+        if page in pages:
+            return serve_page(page)
+    try: # Look for a static file (css, js, images etc.)
+        return send_from_directory(site_dir, path)
+    except NotFound:
+        if "404.html" in pages: # Try to look for a 404 page
+            return serve_page("404.html", 404)
+        # If no 404 page exists, return a generic 404 page
+        return """<div style='font-size: XXX-large;text-align: center;'>
+        <h1>404 page not found</h1>
+        </br>
+        <button onclick='history.go(-1)'> Click to go back</button>
+        </div>""", 404
 
 if __name__ == '__main__':
-    generate_site(output_folder=template_dir)
-    app.run(host='localhost', port=5000)
\ No newline at end of file
+    generate_site(output_folder=site_dir, incremental=True)
+    app.run(host='localhost', port=5000)
@@ -120,7 +120,7 @@ def split_to_sublists(initial_list:list, n:int, strict:bool=True) -> List[list]:
         ... # Do stuff with each sublist
     ```
     """
-    logging.debug(f"[ezcv split_to_sublists({initial_list}, {n}, {strict})]: Beggining filter function")
+    logging.debug("[ezcv split_to_sublists(%s, %s, %s)]: Beggining filter function", initial_list, n, strict)
     if strict and not len(initial_list) % n == 0:
             raise ValueError(f"\033[;31m Provided list was not of correct size: \n\tList: {initial_list}\n\tSegment size {n} \033[0m")
 
@@ -171,7 +171,7 @@ def get_image_path(path:str) -> str:
         print(get_image_path(project[0]['image'])) # Prints https://example.com/img/image.jpg which is a usable path
     ```
     """
-    logging.debug(f"[ezcv get_image_path({path})]: Beggining to find image path")
+    logging.debug("[ezcv get_image_path(%s)]: Beggining to find image path", path)
     try:
         if path.startswith("http"):
             return path
@@ -226,7 +226,7 @@ def get_filename_without_extension(path:str) -> str:
         print(get_filename_without_extension(project[0]['image'])) # Prints "John Doe"
     ```
     """
-    logging.debug(f"[ezcv get_filename_without_extension({path})]: Beggining to find filename without path")
+    logging.debug("[ezcv get_filename_without_extension(%s)]: Beggining to find filename without path", path)
     return str(path.split("/")[-1].split(".")[0])
 
 def pretty_datetime(month_started:str, year_started:str, month_ended:str, year_ended:str, current:bool) -> str:
@@ -280,7 +280,7 @@ def pretty_datetime(month_started:str, year_started:str, month_ended:str, year_e
     print(pretty_datetime(month_started, year_started, month_ended, year_ended, current)) # October 2013 - December 2017
     ```
     """
-    logging.debug(f"[ezcv pretty_datetime({month_started}, {year_started}, {month_ended}, {year_ended}, {current}))]: Pretty printing datetime")
+    logging.debug("[ezcv pretty_datetime(%s, %s, %s, %s, %s))]: Pretty printing datetime", month_started, year_started, month_ended, year_ended, current)
     
     if month_started or year_started:
         if month_started and year_started:
@@ -305,7 +305,7 @@ def pretty_datetime(month_started:str, year_started:str, month_ended:str, year_e
             end = f"{year_ended}"
     else:
         end = ""
-    logging.debug(f"[ezcv pretty_datetime({month_started}, {year_started}, {month_ended}, {year_ended}, {current}))]: result = {beginning}{sep}{end}")
+    logging.debug("[ezcv pretty_datetime(%s, %s, %s, %s, %s))]: result = %s%s%s", month_started, year_started, month_ended, year_ended, current, beginning, sep, end)
     return f"{beginning}{sep}{end}"
 
 
@@ -345,6 +345,6 @@ def pretty_defaultdict(ugly_dict:DefaultDict) -> str:
     print(pretty_defaultdict(config)) # Prints config dict in pretty form
     ```
     """
-    logging.debug(f'[ezcv pretty_defaultdict({ugly_dict})]: Pretty printing defaultdict')
+    logging.debug("[ezcv pretty_defaultdict(%s)]: Pretty printing defaultdict", ugly_dict)
 
     return pformat(dict(ugly_dict)).replace("\n", "<br>").replace("{", "{<br>").replace("}", "<br>    }")
@@ -0,0 +1,251 @@
+"""This module is for generating responsive versions of gallery images including:
+
+- Resizing images to smaller widths, so phones don't download full resolution photos
+- Converting images to modern formats (webp, avif) that are smaller at the same quality
+- Caching the generated images by the hash of their source, so they are only generated once
+- Creating the srcset data themes use to write <picture> and <img srcset> tags
+
+Notes
+-----
+- Variants are only generated for widths smaller than the image (images are never scaled up), \
+    each modern format also gets a variant at the full width of the image
+- Photos are rotated to match their exif orientation, and the exif data is removed from variants
+
+Functions
+---------
+generate_variants() -> Tuple[Dict[str, dict], Dict[str, str]]:
+    Generates the resized and converted variants of the images in a folder
+
+Module Variables
+----------------
+VARIANT_FOLDER (str):
+    The default folder to store generated variants in
+
+VARIANT_EXTENSIONS (Tuple[str]):
+    The file extensions of the images variants are generated for (animated and vector images are left as they are)
+
+VARIANT_QUALITY (Dict[str, int]):
+    The quality each format is saved at
+
+Examples
+--------
+#### Generate 480px and 960px wide webp and jpeg versions of the images in content/gallery
+```
+from ezcv.images import generate_variants
+
+images, files = generate_variants("content/gallery", "images/gallery/", widths=[480, 960], formats=["webp"])
+
+print(images["images/gallery/photo.jpg"]["srcset"]) # 'images/gallery/variants/photo-1a2b3c4d-480w.jpg 480w, ..., images/gallery/photo.jpg 1920w'
+print(images["images/gallery/photo.jpg"]["sources"]) # [{'type': 'image/webp', 'srcset': 'images/gallery/variants/photo-1a2b3c4d-480w.webp 480w, ...'}]
+```
+"""
+# Standard Lib Dependencies
+import os                                   # Used for path validation and directory walking
+import json                                 # Used to read and write the index of image hashes
+import shutil                               # Used to remove the variants of images that are gone
+import logging                              # Used to log information for internal testing
+from concurrent.futures import Executor     # Used to type hint the pool variants are generated with
+from typing import Dict, Iterable, List, Optional, Tuple # Used to provide accurate type hints
+
+## internal dependencies
+from ezcv.cache import CACHE_FOLDER
+from ezcv.manifest import hash_file
+
+# Third party dependencies
+from PIL import Image, ImageOps             # Used to resize and convert images
+
+VARIANT_FOLDER = os.path.join(CACHE_FOLDER, "variants")
+
+VARIANT_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".jfif", ".pjpeg", ".pjp")
+
+VARIANT_QUALITY = {"JPEG": 85, "WEBP": 80, "AVIF": 60}
+
+# The extension each pillow format is saved with
+_FORMAT_EXTENSIONS = {"JPEG": ".jpg", "PNG": ".png", "WEBP": ".webp", "AVIF": ".avif"}
+
+
+def _supported_formats(formats:Iterable[str]) -> List[str]:
+    """Returns the pillow names of the formats that can be saved, printing a warning for any that can't"""
+    Image.init()
+    supported = []
+    for image_format in formats:
+        image_format = str(image_format).upper()
+        if image_format in Image.SAVE and image_format in _FORMAT_EXTENSIONS:
+            supported.append(image_format)
+        else:
+            print(f"Image format '{image_format.lower()}' is not supported by your version of pillow, no variants will be generated for it")
+    return supported
+
+
+def _variant_sizes(width:int, widths:Iterable[int]) -> List[int]:
+    """Returns the widths smaller than the width of an image, smallest first"""
+    return sorted({int(variant_width) for variant_width in widths if 0 < int(variant_width) < width})
+
+
+def _generate_image_variants(image_path:str, variant_folder:str, variants:List[Tuple[int, str]]) -> bool:
+    """Writes the variants of a single image that are not already in variant_folder, runs in a worker process
+
+    Parameters
+    ----------
+    image_path : str
+        The path to the source image
+
+    variant_folder : str
+        The folder to write the variants to (one per source hash)
+
+    variants : List[Tuple[int, str]]
+        The width and pillow format of each variant
+
+    Returns
+    -------
+    bool
+        False if the image could not be read (i.e. it's truncated), a warning is logged and no variants are written
+    """
+    missing = [(width, image_format) for width, image_format in variants if not os.path.exists(os.path.join(variant_folder, f"{width}w{_FORMAT_EXTENSIONS[image_format]}"))]
+    if not missing:
+        return True
+    os.makedirs(variant_folder, exist_ok=True)
+    temporary_path = ""
+    try:
+        with Image.open(image_path) as image:
+            image = ImageOps.exif_transpose(image)
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "A" in image.mode or "transparency" in image.info else "RGB")
+            for width, image_format in missing:
+                resized = image if width == image.width else image.resize((width, max(1, round(image.height * width / image.width))), Image.LANCZOS)
+                if image_format == "JPEG" and resized.mode == "RGBA":
+                    resized = resized.convert("RGB")
+                variant_path = os.path.join(variant_folder, f"{width}w{_FORMAT_EXTENSIONS[image_format]}")
+                temporary_path = f"{variant_path}.{os.getpid()}.tmp"
+                resized.save(temporary_path, format=image_format, quality=VARIANT_QUALITY.get(image_format, 85), optimize=image_format in ("JPEG", "PNG"))
+                os.replace(temporary_path, variant_path) # Avoid partially written variants if the build is interrupted
+    except (OSError, Image.DecompressionBombError) as e: # Truncated or corrupt images are published without variants
+        logging.warning("[ezcv _generate_image_variants()] Could not generate variants of %s, publishing it without them: %s", image_path, e)
+        if temporary_path and os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        return False
+    return True
+
+
+def generate_variants(folder:str, output_prefix:str, widths:Iterable[int] = (), formats:Iterable[str] = (), executor:Optional[Executor] = None, variant_folder:str = VARIANT_FOLDER) -> Tuple[Dict[str, dict], Dict[str, str]]:
+    """Generates the resized and converted variants of the images in a folder
+
+    Notes
+    -----
+    - Variants are stored in variant_folder in a folder named after the sha256 hash of their source, \
+        so they are only generated again when the image changes
+    - An index of the size, modification time, hash and dimensions of each image is kept in variant_folder \
+        so unchanged images are not hashed or opened again
+    - The variants of images that are no longer in the folder are removed from variant_folder
+    - Files that can't be read as images (i.e. truncated or corrupt files) are left out with a warning, \
+        so they're published as they are without a srcset or dimensions
+    - Variant output paths include part of the source hash, so they can be cached forever by browsers and CDNs
+
+    Parameters
+    ----------
+    folder : str
+        The folder with the images (searched recursively) i.e. 'content/gallery'
+
+    output_prefix : str
+        The folder (with / as a seperator) inside the output folder the images are published to i.e. 'images/gallery/'
+
+    widths : Iterable[int], optional
+        The widths in pixels to resize images to, by default ()
+
+    formats : Iterable[str], optional
+        The formats to convert images to i.e. ['avif', 'webp'], by default ()
+
+    executor : Optional[Executor], optional
+        A pool to generate variants with, by default None which generates them one at a time
+
+    variant_folder : str, optional
+        The folder to store generated variants in, by default VARIANT_FOLDER
+
+    Returns
+    -------
+    Tuple[Dict[str, dict], Dict[str, str]]
+        The output path of each image mapped to it's srcset data (width, height, srcset and sources), \
+        and the output path of each variant mapped to it's path in variant_folder (see ezcv.assets.sync_files())
+    """
+    formats = _supported_formats(formats)
+    index_path = os.path.join(variant_folder, "index.json")
+    index:Dict[str, dict] = {}
+    if os.path.exists(index_path):
+        try:
+            with open(index_path, "r") as index_file:
+                index = json.load(index_file)
+        except ValueError:
+            logging.warning("[ezcv generate_variants()] Could not read %s, hashing every image", index_path)
+
+    images:Dict[str, dict] = {}
+    files:Dict[str, str] = {}
+    used_index:Dict[str, dict] = {}
+    jobs = []
+    job_outputs = [] # The output path of the image and it's variants for each job, to leave them out if generating them fails
+    for current_folder, _, file_names in os.walk(folder):
+        for file_name in sorted(file_names):
+            if not os.path.splitext(file_name)[1].lower() in VARIANT_EXTENSIONS:
+                continue
+            image_path = os.path.join(current_folder, file_name)
+            stats = os.stat(image_path)
+            entry = index.get(image_path)
+            if not entry or entry["size"] != stats.st_size or entry["mtime"] != stats.st_mtime_ns:
+                try:
+                    with Image.open(image_path) as image: # Only reads the header of the image
+                        width, height = image.size
+                        if image.getexif().get(0x0112, 1) in (5, 6, 7, 8): # Rotated 90 degrees by it's exif orientation
+                            width, height = height, width
+                        image_format = image.format
+                except (OSError, Image.DecompressionBombError) as e:
+                    logging.warning("[ezcv generate_variants()] Could not read %s, publishing it without variants: %s", image_path, e)
+                    continue
+                entry = {"size": stats.st_size, "mtime": stats.st_mtime_ns, "hash": hash_file(image_path), "width": width, "height": height, "format": image_format}
+            used_index[image_path] = entry
+
+            relative_path = os.path.relpath(image_path, folder).replace(os.sep, "/")
+            output_path = f"{output_prefix}{relative_path}"
+            stem = os.path.splitext(relative_path)[0]
+            source_folder = os.path.join(variant_folder, entry["hash"])
+            sizes = _variant_sizes(entry["width"], widths)
+            variants = [(width, entry["format"]) for width in sizes if entry["format"] in _FORMAT_EXTENSIONS]
+            variants += [(width, image_format) for image_format in formats if image_format != entry["format"] for width in sizes + [entry["width"]]]
+            jobs.append((image_path, source_folder, variants))
+
+            srcsets:Dict[str, List[str]] = {}
+            variant_paths = []
+            for width, image_format in variants:
+                variant_name = f"{width}w{_FORMAT_EXTENSIONS[image_format]}"
+                variant_path = f"{output_prefix}variants/{stem}-{entry['hash'][:8]}-{variant_name}"
+                files[variant_path] = os.path.join(source_folder, variant_name)
+                srcsets.setdefault(image_format, []).append(f"{variant_path} {width}w")
+                variant_paths.append(variant_path)
+            job_outputs.append((output_path, variant_paths))
+            original = srcsets.pop(entry["format"], [])
+            images[output_path] = {
+                "width": entry["width"],
+                "height": entry["height"],
+                "srcset": ", ".join(original + [f"{output_path} {entry['width']}w"]),
+                "sources": [{"type": Image.MIME[image_format], "srcset": ", ".join(srcset)} for image_format, srcset in srcsets.items()],
+            }
+
+    logging.debug("[ezcv generate_variants(folder=%r)] Checking the variants of %s images", folder, len(jobs))
+    arguments = [list(argument) for argument in zip(*jobs)] if jobs else [[], [], []]
+    if executor:
+        generated = list(executor.map(_generate_image_variants, *arguments))
+    else:
+        generated = list(map(_generate_image_variants, *arguments))
+    for (image_path, _, _), (output_path, variant_paths), success in zip(jobs, job_outputs, generated):
+        if not success: # Publish the plain image, and read it again next build in case it's fixed
+            images.pop(output_path, None)
+            for variant_path in variant_paths:
+                files.pop(variant_path, None)
+            used_index.pop(image_path, None)
+
+    os.makedirs(variant_folder, exist_ok=True)
+    with open(index_path, "w+") as index_file:
+        json.dump(used_index, index_file)
+    used_hashes = {entry["hash"] for entry in used_index.values()}
+    for file_name in os.listdir(variant_folder): # Remove the variants of images that are no longer in the folder
+        if file_name != "index.json" and not file_name in used_hashes:
+            shutil.rmtree(os.path.join(variant_folder, file_name), ignore_errors=True)
+    return images, files
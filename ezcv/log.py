@@ -0,0 +1,77 @@
+"""This module is for configuring the logging output of ezcv including:
+
+- Turning on verbose (debug) logging
+- Writing log records as JSON lines so they can be collected by other tools
+
+Notes
+-----
+- All the log calls in ezcv pass their values as arguments (i.e. logging.debug("Rendering %s", page)) \
+    so nothing is formatted unless the record is actually going to be written
+
+Classes
+-------
+JSONFormatter:
+    Formats log records as a single line of JSON
+
+Functions
+---------
+configure_logging():
+    Sets up the root logger to write ezcv's logs to stderr
+
+Examples
+--------
+#### Write all debug logs as JSON lines
+```
+from ezcv.log import configure_logging
+from ezcv.core import generate_site
+
+configure_logging(verbose=True, json_output=True)
+generate_site()
+```
+"""
+# Standard Lib Dependencies
+import json                                 # Used to serialize log records
+import logging                              # Used to configure the log handlers
+from typing import TextIO                   # Used to provide accurate type hints
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats log records as a single line of JSON with the time, level, logger, module, function and message"""
+    def format(self, record:logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "function": record.funcName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure_logging(verbose:bool = False, json_output:bool = False, stream:TextIO = None):
+    """Sets up the root logger to write ezcv's logs to stderr
+
+    Parameters
+    ----------
+    verbose : bool, optional
+        Whether to write debug logs, by default False which only writes warnings and errors
+
+    json_output : bool, optional
+        Whether to write each log record as a line of JSON, by default False
+
+    stream : TextIO, optional
+        The stream to write the logs to, by default None which uses stderr
+    """
+    handler = logging.StreamHandler(stream)
+    if json_output:
+        handler.setFormatter(JSONFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(levelname)s:%(module)s: %(message)s"))
+    root_logger = logging.getLogger()
+    for existing_handler in root_logger.handlers[:]:
+        root_logger.removeHandler(existing_handler)
+    root_logger.addHandler(handler)
+    root_logger.setLevel(logging.DEBUG if verbose else logging.WARNING)
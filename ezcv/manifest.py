@@ -0,0 +1,550 @@
+"""This module is for handling incremental builds including:
+
+- Hashing the inputs of a build (config, content, theme templates and static assets)
+- Reading and writing the build manifest that is stored in the output folder
+- Comparing manifests to decide which work can be skipped on the next build
+- Recording which inputs each output depends on, so only the outputs affected by a change are rendered again
+
+Classes
+-------
+BuildManifest:
+    A record of the hashes of every input used to generate a site
+
+BuildPlan:
+    Describes which work needs to be redone, and keeps count of what was skipped
+
+Functions
+---------
+hash_file() -> str:
+    Returns the hex digest of the sha256 hash of a file
+
+Module Variables
+----------------
+MANIFEST_FILE_NAME (str):
+    The name of the manifest file inside the output folder
+
+BUILD_STAMP_FILE_NAME (str):
+    The name of the file generate_site() writes to the output folder after every build, so servers \
+    (i.e. the flask routes.py) can check for a new build with a single stat
+
+Examples
+--------
+#### Plan a build from the manifest of the previous build in ./site
+```
+from ezcv.manifest import BuildManifest
+
+previous = BuildManifest.load("site")
+current = BuildManifest.generate("config.yml", "/path/to/theme", previous)
+plan = current.plan(previous, "site")
+
+print(plan.changed_content) # i.e. {'content/blog/example.md'}
+print(plan.stale_outputs) # i.e. {'example.html', 'blog.html', 'index.html'}
+```
+"""
+# Standard Lib Dependencies
+import os                                       # Used for path validation and directory walking
+import json                                     # Used to read and write the manifest file
+import hashlib                                  # Used to hash the build inputs
+import logging                                  # Used to log information for internal testing
+from collections import defaultdict             # Used to give dicts default args
+from dataclasses import dataclass, field, asdict # Used to define the manifest and plan classes
+from typing import DefaultDict, Dict, Iterable, List, Set, Union # Used to provide accurate type hints
+
+# Internal Dependencies
+from ezcv import __version__ as version
+from ezcv.output import MemoryOutput, output_exists
+
+MANIFEST_FILE_NAME = ".ezcv-manifest.json"
+
+BUILD_STAMP_FILE_NAME = ".ezcv-build"
+
+
+def hash_file(file_path:str) -> str:
+    """Returns the hex digest of the sha256 hash of a file
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the file to hash
+
+    Returns
+    -------
+    str
+        The hex digest of the file's contents
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as current_file:
+        for chunk in iter(lambda: current_file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _hash_folder(folder:str, prefix:str, previous:Dict[str, dict], include_templates:bool = True, include_assets:bool = True) -> Dict[str, dict]:
+    """Walks a folder and returns a dict of entries for each file in it
+
+    Parameters
+    ----------
+    folder : str
+        The folder to walk
+
+    prefix : str
+        The prefix to add to the relative path of each file i.e. 'content/'
+
+    previous : Dict[str, dict]
+        The entries from the previous manifest, if a file's size and mtime are unchanged it's hash is reused
+
+    include_templates : bool, optional
+        Whether to include .jinja files, by default True
+
+    include_assets : bool, optional
+        Whether to include non .jinja files, by default True
+
+    Returns
+    -------
+    Dict[str, dict]
+        A dict of the relative path (with / as a seperator) to the size, mtime and hash of the file
+    """
+    entries:Dict[str, dict] = {}
+    if not os.path.isdir(folder):
+        return entries
+    for current_folder, _, files in os.walk(folder):
+        for file_name in files:
+            is_template = file_name.endswith(".jinja") or file_name == "metadata.yml"
+            if (is_template and not include_templates) or (not is_template and not include_assets):
+                continue
+            file_path = os.path.join(current_folder, file_name)
+            key = prefix + os.path.relpath(file_path, folder).replace(os.sep, "/")
+            entries[key] = _hash_entry(file_path, previous.get(key))
+    return entries
+
+
+def _hash_entry(file_path:str, previous_entry:dict = None) -> dict:
+    """Returns the manifest entry for a single file
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the file
+
+    previous_entry : dict, optional
+        The entry for the file from the previous manifest, if the size and mtime are unchanged it's hash is reused
+
+    Returns
+    -------
+    dict
+        The size, mtime and hash of the file i.e. {'size': 10, 'mtime': 1652745600000000000, 'hash': 'e3b0...'}
+    """
+    stats = os.stat(file_path)
+    entry = {"size": stats.st_size, "mtime": stats.st_mtime_ns}
+    if previous_entry and previous_entry.get("size") == entry["size"] and previous_entry.get("mtime") == entry["mtime"]:
+        entry["hash"] = previous_entry["hash"] # Unchanged stats, skip re-hashing
+    else:
+        entry["hash"] = hash_file(file_path)
+    return entry
+
+
+@dataclass
+class BuildPlan:
+    """Describes which work needs to be redone, and keeps count of what was skipped
+
+    Notes
+    -----
+    - When full is True every page is rendered, which is the behaviour of a non-incremental build
+    - Changed assets and images are always published again, even if their size and modification time match the published file
+    - Content and image paths are relative to the site folder, asset and template paths are relative to the theme folder
+    - The dependency graph maps each output (i.e. 'index.html') and intermediate value (i.e. 'projects_html') to the \
+        nodes and inputs it depends on, inputs ending in / depend on every file in that folder, and '*' depends on every template
+
+    Attributes
+    ----------
+    full : bool
+        Whether everything needs to be rebuilt, by default True
+
+    render_pages : bool
+        Whether the content needs to be parsed and the top level pages rendered, by default True
+
+    changed_content : Set[str]
+        The content files that were added or modified since the last build
+
+    changed_assets : Set[str]
+        The theme static assets that were added or modified since the last build
+
+    removed_assets : Set[str]
+        The theme static assets that were removed since the last build
+
+    changed_images : Set[str]
+        The site images (images/ and content/gallery/) that were added or modified since the last build
+
+    removed_images : Set[str]
+        The site images that were removed since the last build
+
+    changed_templates : Set[str]
+        The theme templates that were modified since the last build
+
+    outputs : Dict[str, str]
+        The output files of the build mapped to the file they were generated from
+
+    previous_outputs : Dict[str, str]
+        The outputs of the previous build
+
+    dependencies : Dict[str, List[str]]
+        The dependency graph of the build, starts as the graph of the previous build and is updated as pages are rendered
+
+    stale_outputs : Set[str]
+        The outputs of the previous build that depend on something that changed, or are missing from the output folder
+
+    needed_inputs : Set[str]
+        Every input the stale outputs depend on, used to decide which sections need to be parsed and rendered
+
+    skipped : DefaultDict[str, int]
+        Count of the work that was skipped by kind i.e. {'pages': 10, 'assets': 200}
+
+    rebuilt : DefaultDict[str, int]
+        Count of the work that was redone by kind i.e. {'pages': 1, 'assets': 0}
+    """
+    full:bool = True
+    render_pages:bool = True
+    changed_content:Set[str] = field(default_factory=set)
+    changed_assets:Set[str] = field(default_factory=set)
+    removed_assets:Set[str] = field(default_factory=set)
+    changed_images:Set[str] = field(default_factory=set)
+    removed_images:Set[str] = field(default_factory=set)
+    changed_templates:Set[str] = field(default_factory=set)
+    outputs:Dict[str, str] = field(default_factory=dict)
+    previous_outputs:Dict[str, str] = field(default_factory=dict)
+    dependencies:Dict[str, List[str]] = field(default_factory=dict)
+    stale_outputs:Set[str] = field(default_factory=set)
+    needed_inputs:Set[str] = field(default_factory=set)
+    skipped:DefaultDict[str, int] = field(default_factory=lambda: defaultdict(int))
+    rebuilt:DefaultDict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+
+    def needs_render(self, output:str, exists:bool = True) -> bool:
+        """Whether an output needs to be rendered, or the output of the previous build can be kept
+
+        Parameters
+        ----------
+        output : str
+            The path of the output relative to the output folder i.e. 'example.html'
+
+        exists : bool, optional
+            Whether the output of the previous build is still in the output folder, by default True
+
+        Returns
+        -------
+        bool
+            True if the file needs to be rendered, False if the existing output can be kept
+        """
+        return self.full or output in self.stale_outputs or not output in self.previous_outputs or not exists
+
+
+    def needs_section(self, section_name:str) -> bool:
+        """Whether the content of a section needs to be parsed, because a stale output depends on it
+
+        Parameters
+        ----------
+        section_name : str
+            The name of the section i.e. 'projects'
+
+        Returns
+        -------
+        bool
+            True if the section needs to be parsed and rendered
+        """
+        section_folder = f"content/{section_name}/"
+        return self.full or any(needed.startswith(section_folder) or (needed.endswith("/") and section_folder.startswith(needed)) for needed in self.needed_inputs)
+
+
+    def add_dependencies(self, node:str, dependencies:Iterable[str]):
+        """Records the nodes and inputs an output or intermediate value of the build depends on
+
+        Parameters
+        ----------
+        node : str
+            The output (i.e. 'index.html') or intermediate value (i.e. 'projects_html')
+
+        dependencies : Iterable[str]
+            The nodes and inputs the node depends on i.e. ['index.jinja', 'projects_html']
+        """
+        self.dependencies[node] = sorted(set(dependencies))
+
+
+    def graph(self) -> Dict[str, List[str]]:
+        """Returns the part of the dependency graph that is reachable from the outputs of the build
+
+        Returns
+        -------
+        Dict[str, List[str]]
+            The nodes the outputs depend on (including the outputs) mapped to their dependencies
+        """
+        graph = {}
+        remaining = [output for output in self.outputs if output in self.dependencies]
+        while remaining:
+            node = remaining.pop()
+            if node in graph:
+                continue
+            graph[node] = self.dependencies[node]
+            remaining.extend(dependency for dependency in graph[node] if dependency in self.dependencies)
+        return graph
+
+
+    def summary(self) -> str:
+        """Returns a human readable summary of the work that was done and skipped
+
+        Returns
+        -------
+        str
+            The summary i.e. 'Incremental build: rebuilt 1 pages, 0 assets; skipped 10 pages, 200 assets'
+        """
+        kinds = sorted(set(self.skipped) | set(self.rebuilt))
+        rebuilt = ", ".join(f"{self.rebuilt[kind]} {kind}" for kind in kinds)
+        skipped = ", ".join(f"{self.skipped[kind]} {kind}" for kind in kinds)
+        return f"Incremental build: rebuilt {rebuilt or 'nothing'}; skipped {skipped or 'nothing'} (unchanged)"
+
+
+@dataclass
+class BuildManifest:
+    """A record of the hashes of every input used to generate a site
+
+    Notes
+    -----
+    - Each file entry is a dict with the size, mtime (in nanoseconds) and sha256 hash of the file, \
+        the size and mtime are used to avoid re-hashing files that have not been touched
+    - The manifest is stored as JSON in the output folder at MANIFEST_FILE_NAME
+
+    Attributes
+    ----------
+    settings : dict
+        The ezcv version, theme folder and arguments used for the build
+
+    config : Dict[str, dict]
+        The entry for the config file
+
+    content : Dict[str, dict]
+        The entries for each file in the content folder i.e. 'content/blog/example.md'
+
+    templates : Dict[str, dict]
+        The entries for each template (and the metadata.yml) in the theme folder i.e. 'sections/blog/single.jinja'
+
+    assets : Dict[str, dict]
+        The entries for each static asset in the theme folder i.e. 'css/main.css'
+
+    images : Dict[str, dict]
+        The entries for each file in the site's images folder i.e. 'images/avatar.png'
+
+    outputs : Dict[str, str]
+        The output files of the build mapped to the file they were generated from
+
+    dependencies : Dict[str, List[str]]
+        The dependency graph of the build, see BuildPlan
+    """
+    settings:dict = field(default_factory=dict)
+    config:Dict[str, dict] = field(default_factory=dict)
+    content:Dict[str, dict] = field(default_factory=dict)
+    templates:Dict[str, dict] = field(default_factory=dict)
+    assets:Dict[str, dict] = field(default_factory=dict)
+    images:Dict[str, dict] = field(default_factory=dict)
+    outputs:Dict[str, str] = field(default_factory=dict)
+    dependencies:Dict[str, List[str]] = field(default_factory=dict)
+
+
+    @classmethod
+    def load(cls, output_folder:str) -> "BuildManifest":
+        """Loads the manifest from the output folder of a previous build
+
+        Parameters
+        ----------
+        output_folder : str
+            The output folder of the previous build
+
+        Returns
+        -------
+        BuildManifest
+            The previous manifest, or an empty manifest if none exists or it could not be read
+        """
+        manifest_path = os.path.join(output_folder, MANIFEST_FILE_NAME)
+        logging.debug("[ezcv BuildManifest.load(output_folder=%r)] Loading manifest from %s", output_folder, manifest_path)
+        if not os.path.exists(manifest_path):
+            return cls()
+        try:
+            with open(manifest_path, "r") as manifest_file:
+                data = json.load(manifest_file)
+            return cls(**{key: data.get(key, {}) for key in cls.__dataclass_fields__})
+        except (ValueError, TypeError):
+            logging.warning("[ezcv BuildManifest.load()] Could not read %s, doing a full build", manifest_path)
+            return cls()
+
+
+    @classmethod
+    def generate(cls, config_file_path:str, theme_folder:str, previous:"BuildManifest" = None, settings:dict = None) -> "BuildManifest":
+        """Hashes all the inputs of a build (relative to the current working directory)
+
+        Parameters
+        ----------
+        config_file_path : str
+            The path to the site's config yaml file
+
+        theme_folder : str
+            The path to the theme folder
+
+        previous : BuildManifest, optional
+            The manifest of the previous build, used to skip hashing unchanged files, by default None
+
+        settings : dict, optional
+            Extra values that force a full build when they change i.e. the sections argument, by default None
+
+        Returns
+        -------
+        BuildManifest
+            The manifest for the current state of the inputs
+        """
+        logging.debug("[ezcv BuildManifest.generate(config_file_path=%r, theme_folder=%r)] Hashing build inputs", config_file_path, theme_folder)
+        if previous is None:
+            previous = cls()
+        manifest = cls()
+        manifest.settings = {"ezcv_version": version, "theme_folder": os.path.abspath(theme_folder), **(settings or {})}
+        manifest.config = {config_file_path: _hash_entry(config_file_path, previous.config.get(config_file_path))}
+        manifest.content = _hash_folder("content", "content/", previous.content)
+        manifest.templates = _hash_folder(theme_folder, "", previous.templates, include_assets=False)
+        manifest.assets = _hash_folder(theme_folder, "", previous.assets, include_templates=False)
+        manifest.images = _hash_folder("images", "images/", previous.images)
+        return manifest
+
+
+    def save(self, output_folder:str):
+        """Writes the manifest to the output folder
+
+        Parameters
+        ----------
+        output_folder : str
+            The output folder of the current build
+        """
+        manifest_path = os.path.join(output_folder, MANIFEST_FILE_NAME)
+        logging.debug("[ezcv BuildManifest.save(output_folder=%r)] Writing manifest to %s", output_folder, manifest_path)
+        with open(manifest_path, "w+") as manifest_file:
+            json.dump(asdict(self), manifest_file, indent=1, sort_keys=True)
+
+
+    def plan(self, previous:"BuildManifest", output_folder:Union[str, MemoryOutput]) -> BuildPlan:
+        """Compares this manifest to the manifest of the previous build to decide what work needs to be redone
+
+        Parameters
+        ----------
+        previous : BuildManifest
+            The manifest of the previous build
+
+        output_folder : Union[str, MemoryOutput]
+            The output folder of the previous build, or the previous build if it was built in memory
+
+        Returns
+        -------
+        BuildPlan
+            The plan for the current build
+        """
+        plan = BuildPlan(previous_outputs=dict(previous.outputs))
+        changed_templates = _changed(previous.templates, self.templates)
+        if (not previous.settings or previous.settings != self.settings or previous.config != self.config
+            or changed_templates - set(previous.templates) or _removed(previous.templates, self.templates) or "metadata.yml" in changed_templates):
+            logging.debug("[ezcv BuildManifest.plan()] Settings, config, theme metadata or the list of templates changed, doing a full build")
+            return plan
+
+        plan.full = False
+        plan.changed_content = _changed(previous.content, self.content) | _removed(previous.content, self.content)
+        plan.changed_assets = _changed(previous.assets, self.assets)
+        plan.removed_assets = _removed(previous.assets, self.assets)
+        plan.changed_images = _changed(previous.images, self.images) | {path for path in _changed(previous.content, self.content) if path.startswith("content/gallery/")}
+        plan.removed_images = _removed(previous.images, self.images) | {path for path in _removed(previous.content, self.content) if path.startswith("content/gallery/")}
+
+        plan.changed_templates = changed_templates
+
+        # Outputs are only rendered again if something they depend on changed, or they were not written previously
+        changed_inputs = plan.changed_content | plan.changed_templates
+        affected = {}
+        for output in previous.outputs:
+            if (not output in previous.dependencies or _is_affected(output, previous.dependencies, changed_inputs, affected)
+                or not output_exists(output_folder, output)):
+                plan.stale_outputs.add(output)
+
+        # Content that nothing depended on (i.e. the first file in a new section) could add to any page, so render them all
+        inputs = {dependency for dependencies in previous.dependencies.values() for dependency in dependencies}
+        if any(not any(_matches(dependency, {path}) for dependency in inputs) for path in plan.changed_content):
+            logging.debug("[ezcv BuildManifest.plan()] Found changed content that no output depended on, rendering every page")
+            plan.stale_outputs = set(previous.outputs)
+
+        plan.dependencies = {node: list(dependencies) for node, dependencies in previous.dependencies.items()}
+        plan.outputs = {output: source for output, source in previous.outputs.items() if not output in plan.stale_outputs}
+        plan.needed_inputs = _flatten(plan.stale_outputs, previous.dependencies)
+        plan.render_pages = bool(plan.stale_outputs)
+        logging.debug("[ezcv BuildManifest.plan()] len(plan.stale_outputs)=%r len(plan.changed_content)=%r len(plan.changed_templates)=%r len(plan.changed_assets)=%r len(plan.changed_images)=%r", len(plan.stale_outputs), len(plan.changed_content), len(plan.changed_templates), len(plan.changed_assets), len(plan.changed_images))
+        return plan
+
+
+def _changed(previous:Dict[str, dict], current:Dict[str, dict]) -> Set[str]:
+    """Returns the keys that were added or whose hash changed between two sets of entries"""
+    return {key for key, entry in current.items() if previous.get(key, {}).get("hash") != entry["hash"]}
+
+
+def _removed(previous:Dict[str, dict], current:Dict[str, dict]) -> Set[str]:
+    """Returns the keys that were present in the previous entries but not the current ones"""
+    return set(previous) - set(current)
+
+
+def _matches(dependency:str, changed:Set[str]) -> bool:
+    """Whether an input of the dependency graph matches any of the changed files"""
+    if dependency == "*":
+        return any(not path.startswith("content/") for path in changed) # Templates are the only inputs outside of content/
+    if dependency.endswith("/"):
+        return any(path.startswith(dependency) for path in changed)
+    return dependency in changed
+
+
+def _is_affected(node:str, dependencies:Dict[str, List[str]], changed:Set[str], affected:Dict[str, bool]) -> bool:
+    """Whether a node of the dependency graph depends (directly or through other nodes) on any of the changed files
+
+    Parameters
+    ----------
+    node : str
+        The output or intermediate value to check
+
+    dependencies : Dict[str, List[str]]
+        The dependency graph
+
+    changed : Set[str]
+        The inputs that changed
+
+    affected : Dict[str, bool]
+        The results for nodes that were already checked, shared between calls
+
+    Returns
+    -------
+    bool
+        True if the node needs to be rendered again
+    """
+    if node in affected:
+        return affected[node]
+    affected[node] = False # Stops cycles from recursing forever
+    for dependency in dependencies[node]:
+        if dependency in dependencies:
+            if _is_affected(dependency, dependencies, changed, affected):
+                affected[node] = True
+                break
+        elif _matches(dependency, changed):
+            affected[node] = True
+            break
+    return affected[node]
+
+
+def _flatten(nodes:Iterable[str], dependencies:Dict[str, List[str]]) -> Set[str]:
+    """Returns every input the nodes depend on, directly or through other nodes"""
+    inputs, seen, remaining = set(), set(), list(nodes)
+    while remaining:
+        node = remaining.pop()
+        if node in seen:
+            continue
+        seen.add(node)
+        for dependency in dependencies.get(node, ()):
+            if dependency in dependencies:
+                remaining.append(dependency)
+            else:
+                inputs.add(dependency)
+    return inputs
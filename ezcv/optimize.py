@@ -0,0 +1,592 @@
+"""This module is for optimizing the files of a built site including:
+
+- Writing gzip (and brotli if it's installed) compressed copies of text files next to them, so web servers \
+    can send them without compressing files on every request
+- Re-compressing images in parallel, keeping a record of the optimized images so they are never optimized twice
+- Minifying html, css and js files in parallel, keeping a record of the minified files so unchanged files are not minified again
+
+Notes
+-----
+- Brotli compression needs the [brotli](https://pypi.org/project/Brotli/) package (```pip install ezcv[brotli]```), \
+    without it only .gz files are written
+
+Classes
+-------
+CompressionReport:
+    A record of the files that were compressed by precompress(), and the bytes that were saved
+
+Functions
+---------
+precompress() -> CompressionReport:
+    Writes compressed copies (.gz and .br) of the compressible files in a folder
+
+optimize_images() -> Tuple[int, int]:
+    Re-compresses the images in a folder, skipping images that are already optimized
+
+minify_files() -> Tuple[int, int]:
+    Minifies the html, css and js files in a folder, skipping files that are unchanged since they were last minified
+
+optimize_static_files() -> Tuple[Dict[str, str], int, int]:
+    Optimizes the static files of a site into the cache before they're published, and returns the files to publish instead
+
+Module Variables
+----------------
+COMPRESSIBLE_EXTENSIONS (Tuple[str]):
+    The file extensions that are worth compressing (text formats and uncompressed fonts)
+
+MIN_COMPRESS_SIZE (int):
+    The default size in bytes files need to be to get compressed copies, smaller files don't compress well enough to be worth it
+
+IMAGE_EXTENSIONS (Tuple[str]):
+    The file extensions of the images optimize_images() re-compresses
+
+IMAGE_CACHE_FOLDER (str):
+    The default folder to store optimized images and the record of which images have been optimized in
+
+MINIFY_EXTENSIONS (Tuple[str]):
+    The file extensions of the files minify_files() minifies
+
+MINIFY_CACHE_FOLDER (str):
+    The default folder to store minified files and the record of which files have been minified in
+
+PAGE_CACHE_FOLDER (str):
+    The folder builds store minified pages and the record of which pages have been minified in, \
+    seperate from MINIFY_CACHE_FOLDER since a cache folder only keeps the files it was last used for
+
+Examples
+--------
+#### Build a site into ./site then write compressed copies of it's files
+```
+from ezcv.core import generate_site
+from ezcv.optimize import precompress
+
+generate_site()
+report = precompress("site")
+
+print(report.summary()) # i.e. 'Precompressed 12 files (3 already up to date): gzip saved 120.4 KB (71%)'
+```
+
+#### Optimize the images of a site built into ./site, keeping their exif data
+```
+from ezcv.optimize import optimize_images
+
+optimized, skipped = optimize_images("site/images", strip_exif=False)
+```
+
+#### Minify every page, stylesheet and script of a site built into ./site
+```
+from ezcv.optimize import minify_files
+
+minified, skipped = minify_files("site")
+```
+"""
+# Standard Lib Dependencies
+import os                                   # Used for path validation and directory walking
+import gzip                                 # Used to write .gz files
+import json                                 # Used to read and write the record of optimized images
+import shutil                               # Used to copy optimized images in and out of the cache
+import tempfile                             # Used to optimize files in place without a cache folder
+import hashlib                              # Used to key optimized images on their settings
+import logging                              # Used to log information for internal testing
+import threading                            # Used to give each compressing thread it's own temporary files
+from functools import partial               # Used to pass the image settings to worker processes
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor # Used to compress files in parallel
+from dataclasses import dataclass, field    # Used to define the report class
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple # Used to provide accurate type hints
+
+## internal dependencies
+from ezcv.assets import SIDECAR_EXTENSIONS
+from ezcv.cache import CACHE_FOLDER
+from ezcv.manifest import hash_file
+
+# Third party dependencies
+# pillow (used to optimize images) and css_html_js_minify (used to minify html/css/js files) are imported \
+# by the functions that use them, so i.e. --precompress on it's own doesn't load them
+try:
+    import brotli                           # Used to write .br files
+except ImportError: # brotli is not installed, only .gz files are written
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = (".html", ".htm", ".css", ".js", ".mjs", ".json", ".map", ".webmanifest", ".xml", ".svg", ".txt", ".ico", ".ttf", ".otf", ".eot")
+
+MIN_COMPRESS_SIZE = 1024
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+IMAGE_CACHE_FOLDER = os.path.join(CACHE_FOLDER, "images")
+
+MINIFY_EXTENSIONS = (".html", ".htm", ".css", ".js")
+
+MINIFY_CACHE_FOLDER = os.path.join(CACHE_FOLDER, "minified")
+
+PAGE_CACHE_FOLDER = os.path.join(CACHE_FOLDER, "pages")
+
+# The name of each compressed format, used in reports
+_FORMAT_NAMES = {".gz": "gzip", ".br": "brotli"}
+
+
+@dataclass
+class CompressionReport:
+    """A record of the files that were compressed by precompress(), and the bytes that were saved
+
+    Attributes
+    ----------
+    compressed : int
+        The number of files that had compressed copies written, by default 0
+
+    skipped : int
+        The number of files whose compressed copies were already up to date, by default 0
+
+    original_bytes : int
+        The total size of the files that were compressed, by default 0
+
+    saved_bytes : Dict[str, int]
+        The number of bytes saved by each format (i.e. 'gzip') across the files that were compressed
+    """
+    compressed:int = 0
+    skipped:int = 0
+    original_bytes:int = 0
+    saved_bytes:Dict[str, int] = field(default_factory=dict)
+
+
+    def summary(self) -> str:
+        """Returns a human readable summary of the files that were compressed and the bytes that were saved
+
+        Returns
+        -------
+        str
+            The summary i.e. 'Precompressed 12 files (3 already up to date): gzip saved 120.4 KB (71%)'
+        """
+        summary = f"Precompressed {self.compressed} files ({self.skipped} already up to date)"
+        if self.original_bytes:
+            summary += ": " + ", ".join(f"{name} saved {saved / 1024:.1f} KB ({saved / self.original_bytes:.0%})" for name, saved in self.saved_bytes.items())
+        return summary
+
+
+def _compressors() -> Dict[str, object]:
+    """Returns the sidecar extension mapped to the compress function of each available format"""
+    compressors = {".gz": lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli:
+        compressors[".br"] = lambda data: brotli.compress(data, quality=11)
+    return compressors
+
+
+def _is_current(sidecar_path:str, source_stats:os.stat_result) -> bool:
+    """Whether a compressed copy was written from the current version of it's file (they share a modification time)"""
+    try:
+        return os.stat(sidecar_path).st_mtime_ns == source_stats.st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def _precompress_file(file_path:str) -> Tuple[bool, int, Dict[str, int]]:
+    """Writes the compressed copies of a single file if they are not up to date
+
+    Returns
+    -------
+    Tuple[bool, int, Dict[str, int]]
+        Whether the file was compressed, it's size, and the size of each compressed copy that was written
+    """
+    stats = os.stat(file_path)
+    compressors = _compressors()
+    if all(_is_current(file_path + extension, stats) for extension in compressors):
+        return False, 0, {}
+    with open(file_path, "rb") as source_file:
+        data = source_file.read()
+    sizes = {}
+    for extension in SIDECAR_EXTENSIONS:
+        sidecar_path = file_path + extension
+        compressed = compressors[extension](data) if extension in compressors else None
+        if compressed is None or len(compressed) >= len(data): # Not worth sending, make sure an outdated copy isn't sent instead
+            if os.path.exists(sidecar_path) and not _is_current(sidecar_path, stats):
+                logging.debug("[ezcv _precompress_file()] Removing outdated %s", sidecar_path)
+                os.remove(sidecar_path)
+            continue
+        temporary_path = f"{sidecar_path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        try:
+            with open(temporary_path, "wb") as sidecar_file:
+                sidecar_file.write(compressed)
+            os.utime(temporary_path, ns=(stats.st_atime_ns, stats.st_mtime_ns)) # Marks which version of the file it was written from
+            os.replace(temporary_path, sidecar_path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+        sizes[extension] = len(compressed)
+    return True, len(data), sizes
+
+
+def precompress(folder:str, min_size:int = MIN_COMPRESS_SIZE, threads:int = None) -> CompressionReport:
+    """Writes compressed copies (.gz and .br) of the compressible files in a folder
+
+    Notes
+    -----
+    - Compressed copies are written next to their file with the extension added i.e. 'index.html.gz', \
+        which is what web servers like nginx (gzip_static/brotli_static) and caddy (precompressed) look for
+    - Compressed copies have the same modification time as their file, so files that have not changed \
+        since the last time are skipped
+    - Copies that are not smaller than their file are not written
+    - Files are compressed on a pool of threads, since zlib and brotli release the GIL while compressing
+
+    Parameters
+    ----------
+    folder : str
+        The folder to compress the files of (searched recursively)
+
+    min_size : int, optional
+        The size in bytes files need to be to get compressed copies, by default MIN_COMPRESS_SIZE
+
+    threads : int, optional
+        The number of threads to compress files with, by default None which uses the ThreadPoolExecutor default
+
+    Returns
+    -------
+    CompressionReport
+        The files that were compressed and the bytes that were saved
+    """
+    file_paths:List[str] = []
+    for current_folder, _, file_names in os.walk(folder):
+        for file_name in file_names:
+            file_path = os.path.join(current_folder, file_name)
+            if not file_name.startswith(".") and os.path.splitext(file_name)[1].lower() in COMPRESSIBLE_EXTENSIONS and os.path.getsize(file_path) >= min_size:
+                file_paths.append(file_path)
+    if threads == 1 or len(file_paths) < 2:
+        results = list(map(_precompress_file, file_paths))
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            results = list(pool.map(_precompress_file, file_paths))
+
+    report = CompressionReport(saved_bytes={_FORMAT_NAMES[extension]: 0 for extension in _compressors()})
+    for compressed, size, sizes in results:
+        if not compressed:
+            report.skipped += 1
+            continue
+        report.compressed += 1
+        report.original_bytes += size
+        for extension in _compressors():
+            report.saved_bytes[_FORMAT_NAMES[extension]] += size - sizes.get(extension, size)
+    logging.debug("[ezcv precompress(folder=%r)] Compressed %s files, %s were up to date", folder, report.compressed, report.skipped)
+    return report
+
+
+def _optimize_files(file_paths:List[str], optimize_file:Callable[[str, str], None], settings:list, jobs:Optional[int], cache_folder:str, keep_larger:bool = False, use_record:bool = True) -> Tuple[Dict[str, str], int]:
+    """Writes optimized copies of files into cache_folder in a pool of processes, keeping a record of the optimized files so they are never optimized twice
+
+    Notes
+    -----
+    - Optimized copies are named after their sha256 hash, so a copy is never modified once it's written \
+        and can be published (linked or copied) to the output folder as-is
+    - Files that are already optimized (the output of an earlier optimization), or whose optimized copy \
+        is not smaller than them, are their own optimized copy
+    - Only the optimized copies of file_paths are kept in cache_folder, any others are removed from it (unless use_record is False)
+
+    Parameters
+    ----------
+    file_paths : List[str]
+        The paths of the files to optimize
+
+    optimize_file : Callable[[str, str], None]
+        A picklable function that takes the path of a file and writes it's optimized copy to the second path
+
+    settings : list
+        The settings (and versions of the libraries) the files are optimized with, \
+        files optimized with different settings are not used from the record
+
+    jobs : Optional[int]
+        The number of processes to optimize files with (less than 1 uses every CPU), None uses every CPU
+
+    cache_folder : str
+        The folder to store optimized copies and the record of which files have been optimized in
+
+    keep_larger : bool, optional
+        Whether to use optimized copies that are not smaller than their file, by default False
+
+    use_record : bool, optional
+        Whether to use and update the record, when False every file is optimized again and the record \
+        (and the optimized copies that are not used) are left as they are, by default True
+
+    Returns
+    -------
+    Tuple[Dict[str, str], int]
+        The path of the optimized copy of each file, and the number of files that were optimized \
+        (the rest were already optimized, or copied from the cache)
+    """
+    index_path = os.path.join(cache_folder, "index.json")
+    record:Dict[str, str] = {} # The key of each file (it's hash and settings) mapped to the hash of it's optimized copy
+    if use_record and os.path.exists(index_path):
+        try:
+            with open(index_path, "r") as index_file:
+                record = json.load(index_file)
+        except ValueError:
+            logging.warning("[ezcv _optimize_files()] Could not read %s, optimizing every file", index_path)
+    optimized_keys = {file_hash: key for key, file_hash in record.items()}
+
+    used_record:Dict[str, str] = {}
+    used_names:Set[str] = set() # The file names of the optimized copies to keep in cache_folder
+    optimized_paths:Dict[str, str] = {}
+    to_optimize:List[Tuple[str, str, str, str]] = [] # The path, hash, key and extension of each file that needs optimizing
+    for file_path in file_paths:
+        extension = os.path.splitext(file_path)[1].lower()
+        file_hash = hash_file(file_path)
+        key = hashlib.sha256(json.dumps([file_hash] + settings).encode()).hexdigest()
+        if file_hash in optimized_keys: # Already optimized, keep it's copy for when the original is back (i.e. a page that's rendered again)
+            used_record[optimized_keys[file_hash]] = file_hash
+            used_names.add(f"{file_hash}{extension}")
+            optimized_paths[file_path] = file_path
+            continue
+        cached_path = os.path.join(cache_folder, f"{record.get(key)}{extension}")
+        if key in record and os.path.exists(cached_path): # Optimized before, use the optimized copy
+            logging.debug("[ezcv _optimize_files()] Using cached optimized copy of %s", file_path)
+            used_record[key] = record[key]
+            used_names.add(os.path.basename(cached_path))
+            optimized_paths[file_path] = cached_path
+            continue
+        to_optimize.append((file_path, file_hash, key, extension))
+
+    os.makedirs(cache_folder, exist_ok=True)
+    temporary_paths = [os.path.join(cache_folder, f"{key}.{os.getpid()}.tmp") for _, _, key, _ in to_optimize]
+    arguments = ([file_path for file_path, _, _, _ in to_optimize], temporary_paths)
+    try:
+        if jobs == 1 or len(to_optimize) < 2:
+            list(map(optimize_file, *arguments))
+        else:
+            workers = (os.cpu_count() or 1) if jobs is None or jobs < 1 else jobs
+            with ProcessPoolExecutor(max_workers=workers) as pool: # Files are sent in chunks, since small pages take less time to minify than to send
+                list(pool.map(optimize_file, *arguments, chunksize=max(1, len(to_optimize) // (4 * workers))))
+        for (file_path, file_hash, key, extension), temporary_path in zip(to_optimize, temporary_paths):
+            logging.debug("[ezcv _optimize_files()] Optimized %s", file_path)
+            if not keep_larger and os.path.getsize(temporary_path) >= os.path.getsize(file_path): # The file was already as small as it's going to get
+                os.remove(temporary_path)
+                used_record[key] = file_hash
+                optimized_paths[file_path] = file_path
+                continue
+            optimized_hash = hash_file(temporary_path)
+            optimized_path = os.path.join(cache_folder, f"{optimized_hash}{extension}")
+            os.replace(temporary_path, optimized_path)
+            used_record[key] = optimized_hash
+            used_names.add(os.path.basename(optimized_path))
+            optimized_paths[file_path] = optimized_path
+    finally:
+        for temporary_path in temporary_paths:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    if use_record: # Builds without the record (i.e. --no-cache) leave it and the copies it points to alone
+        with open(index_path, "w+") as index_file:
+            json.dump(used_record, index_file)
+        for file_name in os.listdir(cache_folder): # Remove the optimized copies of files that are no longer being optimized
+            if file_name != "index.json" and file_name not in used_names:
+                os.remove(os.path.join(cache_folder, file_name))
+    return optimized_paths, len(to_optimize)
+
+
+def _optimize_in_place(file_paths:List[str], optimize_file:Callable[[str, str], None], settings:list, jobs:Optional[int], cache_folder:Optional[str], keep_larger:bool = False) -> Tuple[int, int]:
+    """Replaces files with their optimized copies (see _optimize_files()), returns the number of files that were optimized and skipped
+
+    Notes
+    -----
+    - Optimized copies are copied to a temporary file and moved over the file, so linked files \
+        (see the publish_method config value) are replaced instead of modifying their source
+    - If cache_folder is None the files are optimized into a temporary folder without a record
+    """
+    temporary_folder = tempfile.mkdtemp(prefix="ezcv-optimize-") if cache_folder is None else None
+    try:
+        optimized_paths, optimized = _optimize_files(file_paths, optimize_file, settings, jobs, cache_folder or temporary_folder, keep_larger, use_record=cache_folder is not None)
+        for file_path, optimized_path in optimized_paths.items():
+            if optimized_path != file_path:
+                temporary_path = f"{file_path}.{os.getpid()}.tmp"
+                shutil.copyfile(optimized_path, temporary_path)
+                os.replace(temporary_path, file_path)
+    finally:
+        if temporary_folder:
+            shutil.rmtree(temporary_folder, ignore_errors=True)
+    return optimized, len(file_paths) - optimized
+
+
+def _optimize_image(image_path:str, temporary_path:str, strip_exif:bool, quality:int):
+    """Writes an optimized copy of an image to temporary_path, runs in a worker process"""
+    from PIL import Image, ImageOps
+    with Image.open(image_path) as image:
+        image_format = image.format
+        options = {"optimize": True, "quality": quality}
+        if strip_exif:
+            image = ImageOps.exif_transpose(image) # Keep photos the right way up once their orientation tag is gone
+        else:
+            options.update({key: image.info[key] for key in ("exif", "icc_profile") if image.info.get(key)})
+        image.save(temporary_path, format=image_format, **options)
+
+
+def optimize_images(folder:str, jobs:int = None, strip_exif:bool = True, quality:int = 85, cache_folder:Optional[str] = IMAGE_CACHE_FOLDER) -> Tuple[int, int]:
+    """Re-compresses the images in a folder, skipping images that are already optimized
+
+    Notes
+    -----
+    - Only images with an extension in IMAGE_EXTENSIONS are optimized (searched recursively)
+    - A record of the sha256 hash of each image and it's optimized copy is kept in cache_folder, so images \
+        that were already optimized are skipped (instead of losing quality each time they're compressed), \
+        and images that were optimized before are replaced with their optimized copy from the cache without being compressed again
+    - Optimized images are written to a temporary file and moved over the image, so linked images \
+        (see the publish_method config value) are replaced instead of modifying their source
+    - To optimize the images of a build without replacing the published files (which makes the next build publish them again) \
+        use optimize_static_files() on the files before they're published instead
+    - Optimized copies that are larger than the image are not used (unless exif data is being removed)
+    - Only the images in the folder are kept in the cache, any others are removed from it
+
+    Parameters
+    ----------
+    folder : str
+        The folder to optimize the images of
+
+    jobs : int, optional
+        The number of processes to optimize images with (less than 1 uses every CPU), by default None which uses every CPU
+
+    strip_exif : bool, optional
+        Whether to remove the exif data (camera, location etc.) of the images, by default True
+
+    quality : int, optional
+        The quality to save jpeg images at, by default 85
+
+    cache_folder : Optional[str], optional
+        The folder to store optimized images and the record of which images have been optimized in, \
+        or None to optimize every image without a record, by default IMAGE_CACHE_FOLDER
+
+    Returns
+    -------
+    Tuple[int, int]
+        The number of images that were optimized, and the number that were skipped (or copied from the cache)
+    """
+    import PIL
+    image_paths = [os.path.join(current_folder, file_name) for current_folder, _, file_names in os.walk(folder) for file_name in file_names if os.path.splitext(file_name)[1].lower() in IMAGE_EXTENSIONS]
+    optimize_image = partial(_optimize_image, strip_exif=strip_exif, quality=quality)
+    optimized, skipped = _optimize_in_place(image_paths, optimize_image, [PIL.__version__, strip_exif, quality], jobs, cache_folder, keep_larger=strip_exif)
+    logging.debug("[ezcv optimize_images(folder=%r)] Optimized %s images, skipped %s", folder, optimized, skipped)
+    return optimized, skipped
+
+
+def _minify_file(file_path:str, temporary_path:str):
+    """Writes a minified copy of a html, css or js file to temporary_path, runs in a worker process"""
+    from css_html_js_minify import css_minify, html_minify, js_minify
+    with open(file_path, "r", encoding="utf-8") as source_file:
+        source = source_file.read()
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == ".css":
+        minified = css_minify(source, wrap=False, comments=False, sort=False)
+    elif extension == ".js":
+        minified = js_minify(source)
+    else:
+        minified = html_minify(source, comments=False)
+    with open(temporary_path, "w", encoding="utf-8") as minified_file:
+        minified_file.write(minified)
+
+
+def _is_minifiable(path:str) -> bool:
+    """Whether a file should be minified, it has an extension in MINIFY_EXTENSIONS and is not hidden or already minified"""
+    file_name = os.path.basename(path)
+    name, extension = os.path.splitext(file_name)
+    return not file_name.startswith(".") and extension.lower() in MINIFY_EXTENSIONS and not name.lower().endswith(".min")
+
+
+def minify_files(folder:str, jobs:int = None, cache_folder:Optional[str] = MINIFY_CACHE_FOLDER, paths:Optional[Iterable[str]] = None) -> Tuple[int, int]:
+    """Minifies the html, css and js files in a folder, skipping files that are unchanged since they were last minified
+
+    Notes
+    -----
+    - Only files with an extension in MINIFY_EXTENSIONS are minified (searched recursively), \
+        files that are already minified (i.e. 'bootstrap.min.css') and hidden files are skipped
+    - A record of the sha256 hash of each file and it's minified copy is kept in cache_folder in the same way \
+        as optimize_images(), so pages that did not change since the last build are copied from the cache \
+        instead of being minified again
+    - Minified copies are written to a temporary file and moved over the file, so linked theme files \
+        (see the publish_method config value) are replaced instead of modifying their source
+    - Builds only minify their rendered pages in place (see the paths parameter), published css and js \
+        files are minified before they're published with optimize_static_files()
+
+    Parameters
+    ----------
+    folder : str
+        The folder to minify the files of i.e. 'site'
+
+    jobs : int, optional
+        The number of processes to minify files with (less than 1 uses every CPU), by default None which uses every CPU
+
+    cache_folder : Optional[str], optional
+        The folder to store minified files and the record of which files have been minified in, \
+        or None to minify every file without a record, by default MINIFY_CACHE_FOLDER
+
+    paths : Optional[Iterable[str]], optional
+        The paths (relative to folder, with / as a seperator) of the files to minify i.e. ['index.html'], \
+        by default None which minifies every file in the folder
+
+    Returns
+    -------
+    Tuple[int, int]
+        The number of files that were minified, and the number that were skipped (or copied from the cache)
+    """
+    import css_html_js_minify
+    if paths is None:
+        file_paths = [os.path.join(current_folder, file_name) for current_folder, _, file_names in os.walk(folder) for file_name in file_names]
+    else:
+        file_paths = [os.path.join(folder, *path.split("/")) for path in paths]
+    file_paths = [file_path for file_path in file_paths if _is_minifiable(file_path) and os.path.isfile(file_path)]
+    minified, skipped = _optimize_in_place(file_paths, _minify_file, [css_html_js_minify.__version__], jobs, cache_folder)
+    logging.debug("[ezcv minify_files(folder=%r)] Minified %s files, skipped %s", folder, minified, skipped)
+    return minified, skipped
+
+
+def optimize_static_files(files:Dict[str, str], jobs:int = None, strip_exif:bool = True, quality:int = 85, cache:bool = True, image_cache_folder:str = IMAGE_CACHE_FOLDER, minify_cache_folder:str = MINIFY_CACHE_FOLDER) -> Tuple[Dict[str, str], int, int]:
+    """Optimizes the static files of a site into the cache before they're published, and returns the files to publish instead
+
+    Notes
+    -----
+    - Images in the images folder of the output (i.e. 'images/gallery/photo.jpg') are optimized like optimize_images(), \
+        and html, css and js files are minified like minify_files()
+    - The originals are never modified, their optimized copies are kept in the cache folders and published in their place \
+        (the same way as the variants from ezcv.images.generate_variants()), so the published files keep matching \
+        their (cached) source and unchanged files are not published again by the next build
+    - Only the optimized copies of files are kept in the cache folders, any others are removed from them (unless cache is False)
+
+    Parameters
+    ----------
+    files : Dict[str, str]
+        The static files of the site, their path in the output folder mapped to their source path (see ezcv.assets.sync_files())
+
+    jobs : int, optional
+        The number of processes to optimize files with (less than 1 uses every CPU), by default None which uses every CPU
+
+    strip_exif : bool, optional
+        Whether to remove the exif data (camera, location etc.) of the images, by default True
+
+    quality : int, optional
+        The quality to save jpeg images at, by default 85
+
+    cache : bool, optional
+        Whether to use and update the records of files that were optimized before, when False every file is optimized \
+        again and the records are left as they are, by default True
+
+    image_cache_folder : str, optional
+        The folder to store optimized images and their record in, by default IMAGE_CACHE_FOLDER
+
+    minify_cache_folder : str, optional
+        The folder to store minified files and their record in, by default MINIFY_CACHE_FOLDER
+
+    Returns
+    -------
+    Tuple[Dict[str, str], int, int]
+        The files with the sources of optimized files replaced by their optimized copies, \
+        the number of files that were optimized, and the number that were skipped (or used from the cache)
+    """
+    import PIL
+    import css_html_js_minify
+    images = [path for path in files if path.startswith("images/") and os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS]
+    minifiable = [path for path in files if _is_minifiable(path)]
+    optimize_image = partial(_optimize_image, strip_exif=strip_exif, quality=quality)
+    optimized_images, optimized = _optimize_files(list(dict.fromkeys(files[path] for path in images)), optimize_image, [PIL.__version__, strip_exif, quality], jobs, image_cache_folder, keep_larger=strip_exif, use_record=cache)
+    minified_files, minified = _optimize_files(list(dict.fromkeys(files[path] for path in minifiable)), _minify_file, [css_html_js_minify.__version__], jobs, minify_cache_folder, use_record=cache)
+    files = dict(files)
+    for path in images:
+        files[path] = optimized_images[files[path]]
+    for path in minifiable:
+        files[path] = minified_files[files[path]]
+    skipped = len(set(optimized_images) | set(minified_files)) - optimized - minified
+    logging.debug("[ezcv optimize_static_files()] Optimized %s images and minified %s files, skipped %s", optimized, minified, skipped)
+    return files, optimized + minified, skipped
@@ -0,0 +1,206 @@
+"""This module is for building sites in memory instead of writing them to an output folder including:
+
+- Storing the rendered pages of a site as bytes
+- Referencing the static files of a site (theme assets and images) by their source path instead of copying them
+- Reading and opening the files of a site built in memory, so they can be served without touching the disk
+
+Classes
+-------
+MemoryOutput:
+    A site built in memory, passed to ezcv.core.generate_site() in place of an output folder
+
+Functions
+---------
+output_exists() -> bool:
+    Whether a file is in an output folder, or a site built in memory
+
+Examples
+--------
+#### Build a site in memory and read it's homepage
+```
+from ezcv.core import generate_site
+from ezcv.output import MemoryOutput
+
+site = generate_site(output_folder=MemoryOutput())
+
+print(site.read("index.html")[:15]) # b'<!DOCTYPE HTML>'
+```
+
+#### Rebuild a site incrementally, keeping the previous build available until the new one is done
+```
+site = generate_site(output_folder=MemoryOutput(), incremental=True)
+...
+site = generate_site(output_folder=site, incremental=True) # Only the pages affected by changes are rendered
+```
+"""
+# Standard Lib Dependencies
+import os                                   # Used to get the absolute path of static files
+import io                                   # Used to open pages as file objects
+import logging                              # Used to log information for internal testing
+from dataclasses import dataclass, field    # Used to define the output class
+from typing import BinaryIO, Dict, Iterable, Iterator, Set, Tuple, Union # Used to provide accurate type hints
+
+
+@dataclass(repr=False)
+class MemoryOutput:
+    """A site built in memory, passed to ezcv.core.generate_site() in place of an output folder
+
+    Notes
+    -----
+    - Paths are relative to the root of the site with / as a seperator i.e. 'blog/page/2.html'
+    - generate_site() never modifies the MemoryOutput passed to it, it returns a new one, so a server can keep \
+        serving the previous build until the new one is done and then swap them
+
+    Attributes
+    ----------
+    pages : Dict[str, bytes]
+        The rendered pages (utf-8 encoded html) of the site
+
+    static : Dict[str, str]
+        The static files of the site (theme assets and images) mapped to the absolute path of their source file
+
+    manifest : BuildManifest
+        The manifest of the build that created the output, used by the next incremental build, by default None
+    """
+    pages:Dict[str, bytes] = field(default_factory=dict)
+    static:Dict[str, str] = field(default_factory=dict)
+    manifest:object = None
+
+
+    def __repr__(self) -> str:
+        return f"MemoryOutput({len(self.pages)} pages, {len(self.static)} static files)"
+
+
+    def __contains__(self, path:str) -> bool:
+        return path in self.pages or path in self.static
+
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.pages
+        yield from self.static
+
+
+    def __len__(self) -> int:
+        return len(self.pages) + len(self.static)
+
+
+    def copy(self) -> "MemoryOutput":
+        """Returns a copy of the output that can be modified without changing this one (page contents and manifests are shared)
+
+        Returns
+        -------
+        MemoryOutput
+            The copy
+        """
+        return MemoryOutput(dict(self.pages), dict(self.static), self.manifest)
+
+
+    def read(self, path:str) -> bytes:
+        """Returns the contents of a file of the site
+
+        Parameters
+        ----------
+        path : str
+            The path of the file i.e. 'index.html' or 'css/main.css'
+
+        Returns
+        -------
+        bytes
+            The contents of the file
+
+        Raises
+        ------
+        KeyError
+            If the file is not part of the site
+        """
+        if path in self.pages:
+            return self.pages[path]
+        with open(self.static[path], "rb") as static_file:
+            return static_file.read()
+
+
+    def open(self, path:str) -> BinaryIO:
+        """Opens a file of the site for reading, static files are opened from their source without being read into memory
+
+        Parameters
+        ----------
+        path : str
+            The path of the file i.e. 'index.html' or 'css/main.css'
+
+        Returns
+        -------
+        BinaryIO
+            The opened file
+
+        Raises
+        ------
+        KeyError
+            If the file is not part of the site
+        """
+        if path in self.pages:
+            return io.BytesIO(self.pages[path])
+        return open(self.static[path], "rb")
+
+
+    def reference(self, files:Dict[str, str], force:Iterable[str] = ()) -> Tuple[int, int]:
+        """Replaces the static files of the site
+
+        Parameters
+        ----------
+        files : Dict[str, str]
+            The path of each static file mapped to it's source path (see ezcv.assets.collect_files())
+
+        force : Iterable[str], optional
+            Paths to count as published even if they referenced the same source before, by default ()
+
+        Returns
+        -------
+        Tuple[int, int]
+            The number of files that were added or changed (or forced), and the number that were unchanged
+        """
+        force = set(force)
+        static = {path: os.path.abspath(source) for path, source in files.items()}
+        published = sum(1 for path, source in static.items() if path in force or self.static.get(path) != source)
+        self.static = static
+        return published, len(static) - published
+
+
+    def prune(self, keep:Set[str]) -> int:
+        """Removes every page that is not in the provided set of paths
+
+        Parameters
+        ----------
+        keep : Set[str]
+            The paths of the pages to keep
+
+        Returns
+        -------
+        int
+            The number of pages that were removed
+        """
+        stale = [path for path in self.pages if not path in keep]
+        for path in stale:
+            logging.debug("[ezcv MemoryOutput.prune()] Removing stale page %s", path)
+            del self.pages[path]
+        return len(stale)
+
+
+def output_exists(output_folder:Union[str, MemoryOutput], path:str) -> bool:
+    """Whether a file is in an output folder, or a site built in memory
+
+    Parameters
+    ----------
+    output_folder : Union[str, MemoryOutput]
+        The output folder, or the site built in memory
+
+    path : str
+        The path of the file relative to the output folder (with / as a seperator) i.e. 'blog/page/2.html'
+
+    Returns
+    -------
+    bool
+        True if the file exists
+    """
+    if isinstance(output_folder, MemoryOutput):
+        return path in output_folder
+    return os.path.exists(os.path.join(output_folder, *path.split("/")))
@@ -0,0 +1,219 @@
+"""This module is for splitting blog sections into pages including:
+
+- Sorting posts by their created date
+- Splitting the posts into pages of a configurable size
+- Selecting only the newest posts when just the first page is needed
+
+Classes
+-------
+Page:
+    A single page of a blog section, passed to the feed and overview templates as `page`
+
+Functions
+---------
+paginate() -> List[Page]:
+    Splits the posts of a blog section into pages, newest first
+
+first_page() -> Page:
+    Gets only the first page of a blog section
+
+page_output_path() -> str:
+    The path (relative to the output folder) of a page of a blog section
+
+Examples
+--------
+#### Split a blog section into pages of 10 posts
+```
+from ezcv.content import get_section_content
+from ezcv.pagination import paginate
+
+posts = get_section_content("content/blog", blog=True)
+
+for page in paginate("blog", posts, 10):
+    print(page.output_path, len(page.posts)) # blog.html 10, blog/page/2.html 10 ...
+```
+"""
+# Standard Lib Dependencies
+import heapq                                # Used to select the newest posts without sorting every post
+import datetime                             # Used to compare created dates written in different formats
+from dataclasses import dataclass, field    # Used to define the page object
+from typing import List, Tuple              # Used to provide accurate type hints
+
+# The formats tried (in order) for created dates YAML leaves as strings, i.e. '2021-3-5' or 'March 5 2021'
+DATE_FORMATS = ["%Y-%m-%d", "%Y/%m/%d", "%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S", "%d-%m-%Y", "%d/%m/%Y",
+                "%B %d %Y", "%B %d, %Y", "%b %d %Y", "%b %d, %Y", "%d %B %Y", "%d %b %Y"]
+
+
+@dataclass
+class Page:
+    """A single page of a blog section, passed to the feed and overview templates as `page`
+
+    Attributes
+    ----------
+    number : int
+        The number of the page, starting at 1
+
+    total_pages : int
+        The number of pages in the section
+
+    page_size : int
+        The maximum number of posts on a page (0 when the section is not paginated)
+
+    total_posts : int
+        The number of posts in the section
+
+    posts : list
+        The content of the posts on this page (the same format as the section content)
+
+    output_path : str
+        The path of the page relative to the output folder i.e. 'blog/page/2.html'
+
+    url : str
+        The url of the page i.e. '/blog/page/2'
+
+    previous_url : str
+        The url of the previous (newer) page, or '' if this is the first page
+
+    next_url : str
+        The url of the next (older) page, or '' if this is the last page
+
+    root : str
+        The relative path from the page to the root of the site, i.e. '../../' for 'blog/page/2.html', \
+        used to link to theme assets like css files
+    """
+    number:int = 1
+    total_pages:int = 1
+    page_size:int = 0
+    total_posts:int = 0
+    posts:list = field(default_factory=list)
+    output_path:str = ""
+    url:str = ""
+    previous_url:str = ""
+    next_url:str = ""
+    root:str = ""
+
+
+def _parse_date(value) -> datetime.datetime:
+    """Converts a created date (a date, datetime or str) to a naive datetime, returns None if it can't be parsed"""
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None: # Aware and naive datetimes can't be compared
+            value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return value
+    if isinstance(value, datetime.date):
+        return datetime.datetime(value.year, value.month, value.day)
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    try:
+        return _parse_date(datetime.datetime.fromisoformat(value))
+    except ValueError:
+        pass
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+    return None
+
+
+def _created(post:list) -> Tuple[bool, datetime.datetime, str]:
+    """The sort key of a post, posts with dates that can't be parsed sort as the oldest (by their text)"""
+    created = post[0]["created"]
+    parsed = _parse_date(created)
+    if parsed is None:
+        return (False, datetime.datetime.min, str(created))
+    return (True, parsed, "")
+
+
+def page_output_path(section_name:str, number:int) -> str:
+    """The path (relative to the output folder) of a page of a blog section
+
+    Parameters
+    ----------
+    section_name : str
+        The name of the blog section i.e. 'blog'
+
+    number : int
+        The number of the page, starting at 1
+
+    Returns
+    -------
+    str
+        '<section_name>.html' for the first page and '<section_name>/page/<number>.html' for the rest
+    """
+    if number == 1:
+        return f"{section_name}.html"
+    return f"{section_name}/page/{number}.html"
+
+
+def _page(section_name:str, posts:list, number:int, total_pages:int, page_size:int, total_posts:int) -> Page:
+    """Creates the page object for a slice of a blog section"""
+    output_path = page_output_path(section_name, number)
+    url = lambda page_number: "/" + page_output_path(section_name, page_number)[:-len(".html")]
+    return Page(
+        number = number,
+        total_pages = total_pages,
+        page_size = page_size,
+        total_posts = total_posts,
+        posts = posts,
+        output_path = output_path,
+        url = url(number),
+        previous_url = url(number - 1) if number > 1 else "",
+        next_url = url(number + 1) if number < total_pages else "",
+        root = "../" * output_path.count("/"),
+    )
+
+
+def paginate(section_name:str, posts:list, page_size:int = 0) -> List[Page]:
+    """Splits the posts of a blog section into pages, newest first
+
+    Notes
+    -----
+    - If page_size is 0 (or less) a single page with every post in it's original order is returned
+
+    Parameters
+    ----------
+    section_name : str
+        The name of the blog section i.e. 'blog'
+
+    posts : list
+        The content of the section from ezcv.content.get_section_content()
+
+    page_size : int, optional
+        The maximum number of posts on each page, by default 0
+
+    Returns
+    -------
+    List[Page]
+        The pages of the section, there is always at least one page
+    """
+    if page_size < 1:
+        return [_page(section_name, list(posts), 1, 1, 0, len(posts))]
+    posts = sorted(posts, key=_created, reverse=True)
+    total_pages = max(1, -(-len(posts) // page_size))
+    return [_page(section_name, posts[index * page_size:(index + 1) * page_size], index + 1, total_pages, page_size, len(posts)) for index in range(total_pages)]
+
+
+def first_page(section_name:str, posts:list, page_size:int = 0) -> Page:
+    """Gets only the first page of a blog section, selecting the newest posts without sorting the whole section
+
+    Parameters
+    ----------
+    section_name : str
+        The name of the blog section i.e. 'blog'
+
+    posts : list
+        The content of the section from ezcv.content.get_section_content()
+
+    page_size : int, optional
+        The maximum number of posts on each page, by default 0 which puts every post on the first page
+
+    Returns
+    -------
+    Page
+        The first page of the section
+    """
+    if page_size < 1:
+        return paginate(section_name, posts, page_size)[0]
+    total_pages = max(1, -(-len(posts) // page_size))
+    return _page(section_name, heapq.nlargest(page_size, posts, key=_created), 1, total_pages, page_size, len(posts))
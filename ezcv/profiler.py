@@ -0,0 +1,202 @@
+"""This module is for measuring how long each phase of a build takes including:
+
+- Timing the wall clock and CPU time of each phase
+- Counting the files each phase worked on
+- Writing a human readable summary, and a JSON report to track build performance over time
+
+Classes
+-------
+Phase:
+    The timings of a single phase of a build
+
+BuildProfiler:
+    Records the timings of each phase of a build
+
+Module Variables
+----------------
+PROFILE_FILE_NAME (str):
+    The name of the JSON report written by ezcv build --profile
+
+Examples
+--------
+#### Time a phase of a build and print the summary
+```
+from ezcv.profiler import BuildProfiler
+
+profiler = BuildProfiler()
+with profiler.phase("Content parsing (blog)") as phase:
+    ...
+    phase.files = 10
+print(profiler.summary())
+profiler.save("ezcv-profile.json")
+```
+"""
+# Standard Lib Dependencies
+import os                                   # Used to get the cpu time of the process
+import json                                 # Used to write the JSON report
+import time                                 # Used to get the wall clock time
+import datetime                             # Used to timestamp the report
+from dataclasses import asdict, dataclass, field # Used to define the timing records
+from contextlib import contextmanager       # Used to time phases with a with statement
+from typing import Iterator, List           # Used to provide accurate type hints
+
+# Internal Dependencies
+from ezcv import __version__ as version
+
+PROFILE_FILE_NAME = "ezcv-profile.json"
+
+
+def _cpu_time() -> float:
+    """Returns the user + system cpu time of this process and any worker processes that have finished"""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+@dataclass
+class Phase:
+    """The timings of a single phase of a build
+
+    Attributes
+    ----------
+    name : str
+        The name of the phase i.e. 'Content parsing (blog)'
+
+    wall : float
+        The wall clock time the phase took in seconds
+
+    cpu : float
+        The cpu time the phase used in seconds (including worker processes that finished during the phase)
+
+    files : int
+        The number of files the phase worked on
+    """
+    name:str
+    wall:float = 0.0
+    cpu:float = 0.0
+    files:int = 0
+
+
+@dataclass
+class BuildProfiler:
+    """Records the timings of each phase of a build
+
+    Attributes
+    ----------
+    phases : List[Phase]
+        The phases that have finished, in the order they finished
+
+    settings : dict
+        The arguments used for the build, included in the report
+    """
+    phases:List[Phase] = field(default_factory=list)
+    settings:dict = field(default_factory=dict)
+
+
+    def __post_init__(self):
+        self._started = datetime.datetime.now().isoformat(timespec="seconds")
+        self._wall_start = time.perf_counter()
+        self._cpu_start = _cpu_time()
+
+
+    def start(self, name:str, files:int = 0) -> Phase:
+        """Starts timing a phase of the build, finish() has to be called with the returned phase when it's done
+
+        Parameters
+        ----------
+        name : str
+            The name of the phase
+
+        files : int, optional
+            The number of files the phase works on, set phase.files before calling finish() if it's not known yet, by default 0
+
+        Returns
+        -------
+        Phase
+            The phase being timed
+        """
+        current_phase = Phase(name, files=files)
+        current_phase.wall, current_phase.cpu = time.perf_counter(), _cpu_time()
+        return current_phase
+
+
+    def finish(self, current_phase:Phase):
+        """Stops timing a phase started with start() and adds it to the profile
+
+        Parameters
+        ----------
+        current_phase : Phase
+            The phase returned by start()
+        """
+        current_phase.wall = time.perf_counter() - current_phase.wall
+        current_phase.cpu = _cpu_time() - current_phase.cpu
+        self.phases.append(current_phase)
+
+
+    @contextmanager
+    def phase(self, name:str, files:int = 0) -> Iterator[Phase]:
+        """Times the code inside the with statement as a phase of the build
+
+        Parameters
+        ----------
+        name : str
+            The name of the phase
+
+        files : int, optional
+            The number of files the phase works on, set phase.files inside the with statement if it's not known yet, by default 0
+
+        Yields
+        ------
+        Phase
+            The phase being timed
+        """
+        current_phase = self.start(name, files)
+        try:
+            yield current_phase
+        finally:
+            self.finish(current_phase)
+
+
+    def report(self) -> dict:
+        """Returns the machine readable report of the build
+
+        Returns
+        -------
+        dict
+            The ezcv version, start time, settings, total timings and the timings of each phase
+        """
+        return {
+            "ezcv_version": version,
+            "started": self._started,
+            "settings": self.settings,
+            "total": {"wall": time.perf_counter() - self._wall_start, "cpu": _cpu_time() - self._cpu_start},
+            "phases": [asdict(current_phase) for current_phase in self.phases],
+        }
+
+
+    def summary(self) -> str:
+        """Returns a human readable table of the timings of each phase
+
+        Returns
+        -------
+        str
+            The table, with one row per phase and the total at the bottom
+        """
+        report = self.report()
+        name_width = max([len(current_phase.name) for current_phase in self.phases] + [len("Phase")])
+        lines = [f"{'Phase':<{name_width}}  {'Wall (s)':>9}  {'CPU (s)':>9}  {'Files':>7}"]
+        for current_phase in self.phases:
+            lines.append(f"{current_phase.name:<{name_width}}  {current_phase.wall:>9.3f}  {current_phase.cpu:>9.3f}  {current_phase.files:>7}")
+        lines.append(f"{'Total':<{name_width}}  {report['total']['wall']:>9.3f}  {report['total']['cpu']:>9.3f}  {sum(current_phase.files for current_phase in self.phases):>7}")
+        return "\n".join(lines)
+
+
+    def save(self, report_path:str = PROFILE_FILE_NAME):
+        """Writes the JSON report
+
+        Parameters
+        ----------
+        report_path : str, optional
+            The path to write the report to, by default PROFILE_FILE_NAME
+        """
+        with open(report_path, "w+") as report_file:
+            json.dump(self.report(), report_file, indent=1)
@@ -19,8 +19,8 @@ from ezcv.content import Markdown
 
 # Third Party Depenencies
 import yaml
-import requests              # Used to access remote files
-from tqdm import tqdm        # Used to generate progress bars during iteration
+# requests (used to access remote files) and tqdm (used to generate progress bars during downloads) are imported \
+# by the functions that download themes, so only commands that go online load them
 
 THEMES_FOLDER = os.path.join(os.path.dirname(__file__), "themes")
 
@@ -53,7 +53,7 @@ def get_theme_section_directories(theme_folder:str, sections:list = None, previe
     """
     if sections is None:
         sections = []
-    logging.debug(f"[ezcv get_theme_section_directories({theme_folder=}, {sections=}, {preview=})] Getting sections for theme {theme_folder}")
+    logging.debug("[ezcv get_theme_section_directories(theme_folder=%r, sections=%r, preview=%r)] Getting sections for theme %s", theme_folder, sections, preview, theme_folder)
     if preview:
         logging.debug("[ezcv get_theme_section_directories()] Preview mode specified generating sections list from scrath")
         sections = []
@@ -64,12 +64,12 @@ def get_theme_section_directories(theme_folder:str, sections:list = None, previe
                     sections.append(section)
                 elif os.path.isdir(os.path.join(theme_folder, "sections", section)): # blog sections
                     sections.append(section)
-            logging.debug(f"[ezcv get_theme_section_directories()] Sections list generated: {sections=}")
+            logging.debug("[ezcv get_theme_section_directories()] Sections list generated: sections=%r", sections)
             return sections
         else:
             return []
     elif sections and not preview:
-        logging.debug(f"[ezcv get_theme_section_directories()] Sections list provided, returning: {sections=}")
+        logging.debug("[ezcv get_theme_section_directories()] Sections list provided, returning: sections=%r", sections)
         return sections
     elif os.path.exists(os.path.join(theme_folder, "sections")):
         logging.debug("[ezcv get_theme_section_directories()] No sections list provided, generating from theme folder")
@@ -79,7 +79,7 @@ def get_theme_section_directories(theme_folder:str, sections:list = None, previe
                 sections.append(section)
             elif os.path.isdir(os.path.join(theme_folder, "sections", section)): # blog sections
                 sections.append(section)
-        logging.debug(f"[ezcv get_theme_section_directories()] Sections list generated, returning: {sections=}")
+        logging.debug("[ezcv get_theme_section_directories()] Sections list generated, returning: sections=%r", sections)
         return sections
     else:
         return []
@@ -96,7 +96,7 @@ def setup_remote_theme(name: str, url: str):
     url : str
         The URL to the .zip file
     """
-    logging.debug(f"[ezcv setup_remote_theme()] Downloading {name=} from {url=}")
+    logging.debug("[ezcv setup_remote_theme()] Downloading name=%r from url=%r", name, url)
     theme_folder_path = os.path.join(THEMES_FOLDER, name)
 
     if os.path.exists(theme_folder_path): # If theme folder already exists
@@ -104,7 +104,9 @@ def setup_remote_theme(name: str, url: str):
         return # Exit function
 
     else: # Download remote theme
-        logging.debug(f"[ezcv setup_remote_theme()] Downloading theme from {url=}")
+        logging.debug("[ezcv setup_remote_theme()] Downloading theme from url=%r", url)
+        import requests
+        from tqdm import tqdm
         # Setting up necessary download variables
         file_stream = requests.get(url, stream=True) # The open http request for the file
         chunk_size = 1024 # Setting the progress bar chunk size to measure in kb
@@ -127,20 +129,20 @@ def setup_remote_theme(name: str, url: str):
             progress_bar.close()
 
             # Extract zip file to theme folder
-            logging.debug(f"[ezcv setup_remote_theme()] Extracting theme from {zip_folder_path}")
+            logging.debug("[ezcv setup_remote_theme()] Extracting theme from %s", zip_folder_path)
             with ZipFile(zip_folder_path, "r") as archive:
                     archive.extractall(theme_folder_path) # Extract to theme folder
                     print(f"Extracted theme from {zip_folder_path} to folder {theme_folder_path}")
 
     # If theme is at THEME_FOLDER/<name>/<name> move code to THEME_FOLDER/<name>
     if os.path.exists(os.path.join(theme_folder_path, name)):
-        logging.debug(f"[ezcv setup_remote_theme()] Moving theme from {theme_folder_path}/{name} to {theme_folder_path}")
+        logging.debug("[ezcv setup_remote_theme()] Moving theme from %s/%s to %s", theme_folder_path, name, theme_folder_path)
         print(f"moving {os.path.join(theme_folder_path, name)} to {theme_folder_path}")
         for current_file in os.listdir(os.path.join(theme_folder_path, name)):
             shutil.move(os.path.join(theme_folder_path, name, current_file), os.path.join(theme_folder_path))
         shutil.rmtree(os.path.join(theme_folder_path, name))
     elif len(os.listdir(theme_folder_path)) == 1: # If only one file in theme folder
-        logging.debug(f"[ezcv setup_remote_theme()] Moving theme from {os.listdir(theme_folder_path[0])} directory to {theme_folder_path}")
+        logging.debug("[ezcv setup_remote_theme()] Moving theme from %s directory to %s", os.listdir(theme_folder_path[0]), theme_folder_path)
         print(f"moving {os.listdir(theme_folder_path)[0]} to {theme_folder_path}")
         theme_files = os.listdir(os.path.join(theme_folder_path, os.path.join(os.listdir(theme_folder_path)[0])))
         theme_files_folder = os.path.join(theme_folder_path, os.listdir(theme_folder_path)[0])
@@ -172,32 +174,32 @@ def locate_theme_directory(theme:str, site_context:dict) -> str:
     FileNotFoundError
         If no theme folder exists, or remote is defined
     """
-    logging.debug(f"[ezcv locate_theme_directory()] Locate theme directory for {theme=}")
+    logging.debug("[ezcv locate_theme_directory()] Locate theme directory for theme=%r", theme)
     if os.path.exists(f".{os.sep}{theme}"):
-        logging.debug(f"[ezcv locate_theme_directory()] Theme folder found at {os.path.abspath(f'.{os.sep}{theme}')}")
+        logging.debug("[ezcv locate_theme_directory()] Theme folder found at %s", os.path.abspath(f'.{os.sep}{theme}'))
         return os.path.abspath(f".{os.sep}{theme}")
     if os.path.exists(os.path.abspath(theme)):
-        logging.debug(f"[ezcv locate_theme_directory()] Theme found at {os.path.abspath(theme)}")
+        logging.debug("[ezcv locate_theme_directory()] Theme found at %s", os.path.abspath(theme))
         theme_folder = os.path.abspath(theme)
     elif os.path.exists(os.path.abspath(os.path.join("themes", theme))):
-        logging.debug(f"[ezcv locate_theme_directory()] Theme found in dedicated theme folder {os.path.abspath(os.path.join('themes', theme))}")
+        logging.debug("[ezcv locate_theme_directory()] Theme found in dedicated theme folder %s", os.path.abspath(os.path.join('themes', theme)))
         theme_folder = os.path.abspath(os.path.join("themes", theme))
     elif os.path.exists(os.path.abspath(os.path.join(THEMES_FOLDER, theme))):
-        logging.debug(f"[ezcv locate_theme_directory()] Theme found in ezcv source theme folder {os.path.abspath(os.path.join(THEMES_FOLDER, theme))}")
+        logging.debug("[ezcv locate_theme_directory()] Theme found in ezcv source theme folder %s", os.path.abspath(os.path.join(THEMES_FOLDER, theme)))
         theme_folder = os.path.abspath(os.path.join(THEMES_FOLDER, theme))
     elif theme in site_context["config"]["remotes"]:
-        logging.debug(f"[ezcv locate_theme_directory()] Theme found in remotes {site_context['config']['remotes'][theme]}")
+        logging.debug("[ezcv locate_theme_directory()] Theme found in remotes %s", site_context['config']['remotes'][theme])
         setup_remote_theme(theme, site_context["config"]["remotes"][theme])
         theme_folder = os.path.abspath(os.path.join(THEMES_FOLDER, theme))
     elif theme.startswith("http"):
-        logging.debug(f"[ezcv locate_theme_directory()] Theme is remote URL {theme_name}")
         theme_name = theme.split("/")[-1].replace(".zip", "")
+        logging.debug("[ezcv locate_theme_directory()] Theme is remote URL %s", theme_name)
         print(f"Downloading theme {theme_name} from {theme} to {os.path.join(THEMES_FOLDER, theme_name)}")
         setup_remote_theme(theme_name, theme)
         theme_folder = os.path.abspath(os.path.join(THEMES_FOLDER, theme_name))
     else:
         raise FileNotFoundError(f"Theme {theme} does not exist")
-    logging.debug(f"[ezcv locate_theme_directory()] Theme folder is {theme_folder}")
+    logging.debug("[ezcv locate_theme_directory()] Theme folder is %s", theme_folder)
     return theme_folder
 
 
@@ -214,11 +216,11 @@ def get_remote_themes(remotes_file_path:str = os.path.join(THEMES_FOLDER, "remot
     dict
         A key-value pair of name to url of themes
     """
-    logging.debug(f"[ezcv get_remote_themes()] Getting remote themes list from {remotes_file_path=}")
+    logging.debug("[ezcv get_remote_themes()] Getting remote themes list from remotes_file_path=%r", remotes_file_path)
     if os.path.exists(remotes_file_path):
         with open(remotes_file_path, "r") as remotes_file:
             remotes = yaml.safe_load(remotes_file)
-    logging.debug(f"[ezcv get_remote_themes()] Returning remotes {remotes=}")
+    logging.debug("[ezcv get_remote_themes()] Returning remotes remotes=%r", remotes)
     return remotes
 
 
@@ -246,11 +248,11 @@ def get_theme_metadata(theme_folder:str) -> defaultdict:
     metadata = get_theme_metadata(os.path.join(THEMES_FOLDER, theme_name))
     ```
     """
-    logging.debug(f"[ezcv get_theme_metadata()] Getting metadata for {theme_folder=}")
+    logging.debug("[ezcv get_theme_metadata()] Getting metadata for theme_folder=%r", theme_folder)
     # Get the metadata file
     with open(os.path.join(theme_folder, "metadata.yml"), "r") as metadata:
         data = yaml.safe_load(metadata)
-    logging.debug(f"[ezcv get_theme_metadata()] Returning metadata {data=}")
+    logging.debug("[ezcv get_theme_metadata()] Returning metadata data=%r", data)
     return defaultdict(lambda: False, data)
 
 
@@ -288,7 +290,7 @@ def _generate_fields(section_content_folder:str) -> dict:
     fields = _generate_fields(os.path.join('content', 'dimension'))
     ```
     """
-    logging.debug(f"[ezcv _generate_fields()] Generating fields for {section_content_folder=}")
+    logging.debug("[ezcv _generate_fields()] Generating fields for section_content_folder=%r", section_content_folder)
     fields = {}
     # section_content_folder would be like /content/education
     files = os.listdir(section_content_folder)
@@ -296,7 +298,7 @@ def _generate_fields(section_content_folder:str) -> dict:
         raise ValueError(f"No files in {section_content_folder}")
 
     if files[0].endswith("md"):
-        logging.debug(f"[ezcv _generate_fields()] Found markdown files in {section_content_folder=}")
+        logging.debug("[ezcv _generate_fields()] Found markdown files in section_content_folder=%r", section_content_folder)
         metadata, _ = Markdown().get_content(os.path.join(section_content_folder, files[0]))
         for field in metadata: # Get each field type from the first markdown file
             if type(metadata[field]) == str:
@@ -364,7 +366,7 @@ def generate_theme_metadata(theme_folder:str, force:bool=False) -> defaultdict:
         yaml.dump(dict(data_2), metadata_file)
     ```
     """
-    logging.debug(f"[ezcv generate_theme_metadata()] Generating metadata for {theme_folder=}")
+    logging.debug("[ezcv generate_theme_metadata()] Generating metadata for theme_folder=%r", theme_folder)
     if not os.path.exists(theme_folder):
         raise ValueError(f"Theme folder {theme_folder} does not exist")
     elif not os.path.exists(os.path.join(theme_folder, "index.jinja")):
@@ -383,7 +385,7 @@ def generate_theme_metadata(theme_folder:str, force:bool=False) -> defaultdict:
         data["sections"] = {}
         for section in os.listdir(os.path.join(theme_folder, "sections")):
             if os.path.isdir(os.path.join(theme_folder,"sections", section)):
-                logging.debug(f"[ezcv generate_theme_metadata()] Generating metadata for blog-like section: {section=}")
+                logging.debug("[ezcv generate_theme_metadata()] Generating metadata for blog-like section: section=%r", section)
                 data["sections"][section] = {"type": "blog"}
                 if os.path.isdir(os.path.join("content", section)):
                     data["sections"][section]["fields"] = _generate_fields(os.path.join("content", section))
@@ -405,10 +407,10 @@ def generate_theme_metadata(theme_folder:str, force:bool=False) -> defaultdict:
                     data["sections"][section]["feed"] = False
 
             elif section == "gallery.jinja":
-                logging.debug(f"[ezcv generate_theme_metadata()] Generating metadata for gallery section: {section=}")
+                logging.debug("[ezcv generate_theme_metadata()] Generating metadata for gallery section: section=%r", section)
                 data["sections"]["gallery"] = {"type": "gallery"}
             else:
-                logging.debug(f"[ezcv generate_theme_metadata()] Generating metadata for markdown section: {section=}")
+                logging.debug("[ezcv generate_theme_metadata()] Generating metadata for markdown section: section=%r", section)
                 if os.path.isdir(os.path.join("content", section.replace(".jinja", ""))):
                     data["sections"][section.replace(".jinja", "")] = {"type": "markdown", "fields": _generate_fields(os.path.join("content", section.replace(".jinja", "")))}
                 else:
@@ -432,7 +434,8 @@ def get_repo_last_updated(user_name:str="QU-UP", repo_name: str="ezcv-themes") -
     datetime.datetime
         A datetime object representing the last updated date of the repository
     """
-    logging.debug(f"[ezcv get_repo_last_updated()] Getting last updated date for https://github.com{user_name}/{repo_name}")
+    logging.debug("[ezcv get_repo_last_updated()] Getting last updated date for https://github.com%s/%s", user_name, repo_name)
+    import requests
     response = requests.get(f'https://api.github.com/repos/{user_name}/{repo_name}/branches/master')
     date_changed = datetime.datetime.strptime(response.json()["commit"]["commit"]["author"]["date"], "%Y-%m-%dT%H:%M:%SZ")
     return date_changed
@@ -0,0 +1,268 @@
+"""This module is for watching the files of a site and rebuilding it when they change including:
+
+- Watching content, images, config files and the theme folder for changes
+- Waiting for a burst of changes (i.e. a save that touches several files) to finish before rebuilding
+- Cancelling a rebuild that is in progress when more changes come in, so the preview never falls behind
+
+Notes
+-----
+- If [watchdog](https://pypi.org/project/watchdog/) is installed changes are reported by the operating system, \
+    otherwise the watched folders are checked for changes every half second
+
+Classes
+-------
+SiteWatcher:
+    Watches files and folders for changes on a background thread
+
+RebuildScheduler:
+    Coalesces changes into rebuilds that run on a background thread, cancelling in progress rebuilds when more changes come in
+
+Module Variables
+----------------
+IGNORED_PATTERNS (Tuple[str]):
+    Glob patterns of file names that are never reported as changed (editor swap files, temporary files etc.)
+
+Examples
+--------
+#### Rebuild a site into ./site whenever it's content changes
+```
+from ezcv.core import generate_site
+from ezcv.watcher import RebuildScheduler, SiteWatcher
+
+scheduler = RebuildScheduler(lambda changed, cancel_event: generate_site(incremental=True, cancel_event=cancel_event))
+watcher = SiteWatcher(["content", "images", "*.yml"], scheduler.notify)
+watcher.start()
+```
+"""
+# Standard Lib Dependencies
+import os                                   # Used for path validation and directory walking
+import glob                                 # Used to find the files matching watched glob patterns
+import logging                              # Used to log information for internal testing
+import threading                            # Used to watch for changes and rebuild in the background
+from fnmatch import fnmatch                 # Used to match ignore patterns against file names
+from typing import Callable, Dict, Iterable, List, Set, Tuple # Used to provide accurate type hints
+
+try:
+    from watchdog.observers import Observer # Used to get file change events from the operating system
+    from watchdog.events import FileSystemEventHandler
+except ImportError: # watchdog is not installed, fall back to polling
+    Observer = None
+    FileSystemEventHandler = object
+
+IGNORED_PATTERNS = (".*", "*~", "*.swp", "*.swx", "*.tmp", "*.pyc", "4913")
+
+
+def _is_ignored(file_path:str, root:str = "") -> bool:
+    """Whether a changed file should be ignored, matches the file name (and it's folders inside root) against IGNORED_PATTERNS"""
+    parts = os.path.relpath(file_path, root).split(os.sep) if root else [os.path.basename(file_path)]
+    return any(fnmatch(part, pattern) for part in parts for pattern in IGNORED_PATTERNS)
+
+
+def _snapshot(paths:Iterable[str]) -> Dict[str, Tuple[int, int]]:
+    """Returns the size and modification time of every file in the watched folders and glob patterns"""
+    files = {}
+    for path in paths:
+        if os.path.isdir(path):
+            for current_folder, folders, file_names in os.walk(path):
+                folders[:] = [folder for folder in folders if not any(fnmatch(folder, pattern) for pattern in IGNORED_PATTERNS)]
+                for file_name in file_names:
+                    files[os.path.join(current_folder, file_name)] = None
+        else:
+            for file_path in glob.glob(path):
+                files[file_path] = None
+    for file_path in list(files):
+        try:
+            stats = os.stat(file_path)
+        except OSError: # Removed while walking
+            del files[file_path]
+            continue
+        files[file_path] = (stats.st_size, stats.st_mtime_ns)
+    return {file_path: stats for file_path, stats in files.items() if not _is_ignored(file_path)}
+
+
+class _EventHandler(FileSystemEventHandler):
+    """Forwards watchdog events for watched files to a SiteWatcher"""
+    def __init__(self, watcher:"SiteWatcher", root:str, pattern:str = ""):
+        self.watcher = watcher
+        self.root = root
+        self.pattern = pattern
+
+
+    def on_any_event(self, event):
+        if event.event_type in ("opened", "closed", "closed_no_write"):
+            return
+        changed = {event.src_path, getattr(event, "dest_path", "") or event.src_path}
+        changed = {path for path in changed if not _is_ignored(path, self.root) and (not self.pattern or fnmatch(os.path.basename(path), self.pattern))}
+        if changed:
+            self.watcher.callback(changed)
+
+
+class SiteWatcher:
+    """Watches files and folders for changes on a background thread
+
+    Attributes
+    ----------
+    paths : List[str]
+        The folders (watched recursively) and glob patterns of files to watch
+
+    callback : Callable[[Set[str]], None]
+        Called with the paths of the files that were added, modified or removed
+
+    interval : float
+        The number of seconds between checks when polling, by default 0.5
+    """
+    def __init__(self, paths:List[str], callback:Callable[[Set[str]], None], interval:float = 0.5):
+        self.paths = list(paths)
+        self.callback = callback
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+        self._observer = None
+
+
+    def start(self):
+        """Starts watching for changes"""
+        logging.debug("[ezcv SiteWatcher.start()] Watching %s with %s", self.paths, "watchdog" if Observer else "polling")
+        if Observer:
+            self._observer = Observer()
+            self._schedule()
+            self._observer.start()
+        else:
+            self._files = _snapshot(self.paths)
+            self._thread = threading.Thread(target=self._poll, name="ezcv-watcher", daemon=True)
+            self._thread.start()
+
+
+    def stop(self):
+        """Stops watching for changes"""
+        self._stop.set()
+        if self._observer:
+            self._observer.stop()
+            self._observer.join()
+        elif self._thread:
+            self._thread.join()
+
+
+    def set_paths(self, paths:List[str]):
+        """Changes the files and folders being watched (i.e. when the site switches to a different theme)
+
+        Parameters
+        ----------
+        paths : List[str]
+            The folders (watched recursively) and glob patterns of files to watch
+        """
+        if list(paths) == self.paths:
+            return
+        logging.debug("[ezcv SiteWatcher.set_paths()] Now watching %s", paths)
+        self.paths = list(paths)
+        if self._observer:
+            self._observer.unschedule_all()
+            self._schedule()
+        else:
+            self._files = _snapshot(self.paths)
+
+
+    def _schedule(self):
+        """Schedules a watchdog handler for each watched path"""
+        for path in self.paths:
+            if os.path.isdir(path):
+                self._observer.schedule(_EventHandler(self, path), path, recursive=True)
+            elif os.path.isdir(os.path.dirname(path) or "."):
+                self._observer.schedule(_EventHandler(self, os.path.dirname(path) or ".", os.path.basename(path)), os.path.dirname(path) or ".", recursive=False)
+
+
+    def _poll(self):
+        """Compares snapshots of the watched files until the watcher is stopped"""
+        while not self._stop.wait(self.interval):
+            files = _snapshot(self.paths)
+            changed = {file_path for file_path in set(files) | set(self._files) if files.get(file_path) != self._files.get(file_path)}
+            self._files = files
+            if changed:
+                self.callback(changed)
+
+
+class RebuildScheduler:
+    """Coalesces changes into rebuilds that run on a background thread, cancelling in progress rebuilds when more changes come in
+
+    Notes
+    -----
+    - A rebuild starts once no changes have come in for debounce seconds, with every file that changed since the last rebuild started
+    - Only one rebuild runs at a time, if changes come in while it is running it's cancel event is set, \
+        and a new rebuild starts as soon as it stops
+    - The changes of a rebuild that is cancelled or raises an error are added to the next rebuild, \
+        which starts when more files change
+
+    Attributes
+    ----------
+    build : Callable[[Set[str], threading.Event], None]
+        Rebuilds the site, called with the changed files and an event that is set when the rebuild should stop early
+
+    debounce : float
+        The number of seconds to wait for more changes before rebuilding, by default 0.3
+
+    on_rebuild : Callable[[Set[str]], None]
+        Called with the changed files after a rebuild finishes without being cancelled or raising an error, by default None
+    """
+    def __init__(self, build:Callable[[Set[str], threading.Event], None], debounce:float = 0.3, on_rebuild:Callable[[Set[str]], None] = None):
+        self.build = build
+        self.debounce = debounce
+        self.on_rebuild = on_rebuild
+        self._lock = threading.Lock()
+        self._pending:Set[str] = set()
+        self._timer:threading.Timer = None
+        self._cancel_event:threading.Event = None
+        self._running = False
+
+
+    def notify(self, changed:Iterable[str]):
+        """Schedules a rebuild for files that changed, and cancels the rebuild in progress (if any)
+
+        Parameters
+        ----------
+        changed : Iterable[str]
+            The paths of the files that changed
+        """
+        with self._lock:
+            self._pending.update(changed)
+            if self._running:
+                self._cancel_event.set()
+            if self._timer:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce, self._start)
+            self._timer.daemon = True
+            self._timer.start()
+
+
+    def _start(self):
+        """Starts a rebuild with the pending changes, unless one is already running (it starts the next one when it stops)"""
+        with self._lock:
+            if self._running or not self._pending:
+                return
+            changed, self._pending = self._pending, set()
+            self._running = True
+            self._cancel_event = threading.Event()
+            threading.Thread(target=self._run, args=(changed, self._cancel_event), name="ezcv-rebuild", daemon=True).start()
+
+
+    def _run(self, changed:Set[str], cancel_event:threading.Event):
+        """Runs a single rebuild, then starts the next one if more changes came in"""
+        logging.debug("[ezcv RebuildScheduler._run()] Rebuilding for %s changed files", len(changed))
+        succeeded = False
+        try:
+            self.build(changed, cancel_event)
+            succeeded = not cancel_event.is_set()
+        except Exception as e:
+            if cancel_event.is_set():
+                logging.debug("[ezcv RebuildScheduler._run()] Rebuild was cancelled: %r", e)
+            else:
+                print(f"\nCould not rebuild the site: {e!r}")
+        with self._lock:
+            self._running = False
+            more_changes = bool(self._pending)
+            if not succeeded: # Keep the changes for the next rebuild, so on_rebuild gets every file that changed since the last one
+                self._pending.update(changed)
+            restart = more_changes and not (self._timer and self._timer.is_alive()) # A failed rebuild is only retried once more files change
+        if succeeded and self.on_rebuild:
+            self.on_rebuild(changed)
+        if restart:
+            self._start()
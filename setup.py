@@ -45,7 +45,7 @@ setuptools.setup(
     packages = setuptools.find_packages(),
 
     entry_points = { 
-            'console_scripts': ['ezcv = ezcv.cli:main']
+            'console_scripts': ['ezcv = ezcv.cli:main', 'ezcv-benchmark = ezcv.benchmark:main']
         },
 
     install_requires = [
@@ -61,13 +61,14 @@ setuptools.setup(
     "pillow",                # Used to do image compression for optimized builds
     "css-html-js-minify",    # Used to minify html, css and JS files for optimized builds
     "livereload",            # Used to auto-reload the site when changes are made
-    "flask",                 # Used to create the web server for live reloading
-    "tornado<6.3.0"          # HACK: Pinned until livereload is patched
+    "flask",                 # Used by the routes generated with ezcv init --flask
+    "tornado<6.3.0"          # Used to serve previews, HACK: Pinned until livereload is patched
         ],
     extras_require = {
         "dev" : ["mkdocs", # Used to create HTML versions of the markdown docs in the docs directory
                 "pdoc3",   # Used to create development docs
                 ], 
+        "brotli" : ["brotli"], # Used to write .br files with ezcv build --precompress
 
     },
     classifiers = [